@@ -0,0 +1,74 @@
+"""
+Import-time benchmark of the eventstudy package.
+
+`import eventstudy` must not import pandas, scipy, matplotlib or statsmodels:
+they are imported only when a feature needs them (reading files, results, plots, statsmodels solver).
+This script imports eventstudy in fresh interpreters, checks that none of these packages
+has been imported and that the median import time stays under a budget.
+
+Usage (from the repository root):
+
+    python benchmarks/import_time.py [--repeat 5] [--budget 0.5]
+
+Exit with a non-zero status if a heavy package is imported or if the budget is exceeded.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_PACKAGES = ("pandas", "scipy", "matplotlib", "statsmodels")
+
+CODE = f"""
+import json, sys, time
+start = time.perf_counter()
+import eventstudy
+duration = time.perf_counter() - start
+print(json.dumps({{
+    "duration": duration,
+    "imported": [name for name in {HEAVY_PACKAGES!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(repeat: int):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+
+    runs = list()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE], env=env, check=True, capture_output=True, text=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark of eventstudy.")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh imports, by default 5")
+    parser.add_argument(
+        "--budget", type=float, default=0.5, help="maximum median import time in seconds, by default 0.5"
+    )
+    args = parser.parse_args()
+
+    runs = measure(args.repeat)
+    median = statistics.median(run["duration"] for run in runs)
+    imported = sorted({name for run in runs for name in run["imported"]})
+
+    print(f"import eventstudy: median {median * 1000:.1f} ms over {args.repeat} runs (budget {args.budget * 1000:.0f} ms)")
+    if imported:
+        print(f"FAILED: heavy packages imported eagerly: {', '.join(imported)}")
+        return 1
+    if median > args.budget:
+        print("FAILED: import time over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,3 +11,5 @@ __description__ = "Event Study package is an open-source python project created
 
 from .single import Single
 from .multiple import Multiple
+from .context import DataContext
+from .aggregate import AggregateState
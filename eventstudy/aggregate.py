@@ -0,0 +1,426 @@
+import numpy as np
+
+import json
+import math
+
+# Sums are kept exactly, as python integers in units of 2**-(_SHIFT + 53):
+# frexp exponents of float64 are at least -1073, every float64 is then an integer in this unit.
+_SHIFT = 1100
+_SCALE = 1 << (_SHIFT + 53)
+_ROWS = 1 << 25  # sums of up to _ROWS halves of mantissas (< 2**27) are exact in float64
+
+# sums kept for each day of the event window
+_SUMS = ("AR", "var_AR", "CAR", "CAR^2", "CAR^3", "CAR^4")
+
+# Quantile sketch of CAR: counts of CAR by bucket, each power of two being split in 2**_SKETCH_BITS buckets
+# (of relative width below 2**-_SKETCH_BITS). |CAR| below 2**_SKETCH_ZERO fall in the bucket of 0.
+# Buckets of all days are numbered by a single code, in the order of their values within a day.
+_SKETCH_BITS = 6
+_SKETCH_ZERO = -30
+_SPAN = 1 << 20  # codes of one day of the event window
+
+
+def _exact_sums(values):
+    # Exact sums of the columns of a 2-d array of finite values, as integers (see _SCALE).
+    # Each value is split into its exponent and the two halves of its mantissa: halves of the same
+    # exponent are summed exactly as floats, then shifted by their exponent in python integers.
+    n, m = values.shape
+    mantissa, exponent = np.frexp(values)
+    mantissa = mantissa * 2.0 ** 53
+    high = np.floor(mantissa * 2.0 ** -26)
+    low = mantissa - high * 2.0 ** 26
+    # one bucket per column and exponent, from the lowest to the highest exponent of the values
+    lowest = int(exponent.min()) if values.size else 0
+    buckets = int(exponent.max()) - lowest + 1 if values.size else 1
+    keys = (exponent - lowest) + np.arange(m) * buckets
+
+    sums = [0] * m
+    for start in range(0, n, _ROWS):
+        rows = slice(start, start + _ROWS)
+        key = keys[rows].ravel()
+        high_sums = np.bincount(key, weights=high[rows].ravel(), minlength=m * buckets)
+        low_sums = np.bincount(key, weights=low[rows].ravel(), minlength=m * buckets)
+        for k in np.flatnonzero((high_sums != 0) | (low_sums != 0)).tolist():
+            column, bucket = divmod(k, buckets)
+            sums[column] += ((int(high_sums[k]) << 26) + int(low_sums[k])) << (bucket + lowest + _SHIFT)
+    return sums
+
+
+def _two_product(a, b):
+    # a * b = product + error exactly (Dekker's algorithm), unless the product underflows or overflows
+    product = a * b
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    error = ((a_high * b_high - product) + a_high * b_low + a_low * b_high) + a_low * b_low
+    return product, error
+
+
+def _split(a):
+    # a = high + low, with halves of the mantissa in high and low
+    c = (2.0 ** 27 + 1) * a
+    high = c - (c - a)
+    return high, a - high
+
+
+def _sketch_codes(values):
+    # code of the bucket of each value, with one column per day of the event window.
+    # Buckets are computed from the binary representation of values: they don't depend on the platform.
+    mantissa, exponent = np.frexp(np.abs(values))
+    key = (exponent - _SKETCH_ZERO - 1) * (1 << _SKETCH_BITS) + np.floor((2 * mantissa - 1) * (1 << _SKETCH_BITS))
+    key = np.where(exponent <= _SKETCH_ZERO, 0, key.astype(np.int64) + 1)
+    key = np.where(values < 0, -key, key)
+    return key + _SPAN // 2 + np.arange(values.shape[1]) * _SPAN
+
+
+def _bucket_values(keys):
+    # middle of the buckets of keys (codes within a day, see _sketch_codes)
+    magnitude = np.abs(keys) - 1
+    exponent = magnitude // (1 << _SKETCH_BITS) + _SKETCH_ZERO + 1
+    mantissa = 0.5 + (magnitude % (1 << _SKETCH_BITS) + 0.5) / (1 << (_SKETCH_BITS + 1))
+    return np.where(keys == 0, 0.0, np.sign(keys) * np.ldexp(mantissa, exponent))
+
+
+def _linear_quantile(value_at, n: int, q: float):
+    # quantile q of n sorted values, given by their ranks with `value_at`,
+    # computed as numpy.quantile does with the (default) linear interpolation
+    index = (n - 1) * q
+    previous = math.floor(index)
+    following = min(previous + 1, n - 1)
+    gamma = index - previous
+    a, b = value_at(previous), value_at(following)
+    difference = b - a
+    return b - difference * (1 - gamma) if gamma >= 0.5 else a + difference * gamma
+
+
+def _divide(numerator: int, denominator: int) -> float:
+    # correctly rounded, as python's true division of integers
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return math.inf if numerator > 0 else -math.inf
+
+
+class AggregateState:
+    """
+    Sufficient statistics of an aggregate of event studies.
+
+    For each day of the event window, the state holds the sums over all events of the AR,
+    of their variances and of the first four powers of the CAR, along with the number of events,
+    the sum of their degrees of freedom and the extrema of the CAR.
+    Aggregate statistics (AAR, their variance and the distribution of CAR) are computed from it,
+    in constant memory whatever the number of events.
+
+    Sums are accumulated exactly (as integers, without any rounding), so that they don't depend
+    on the order in which events are added and remain accurate over very large samples.
+    Events can also be removed: the state is then exactly the one of the remaining events.
+
+    Quantiles of the CAR are approximated by a sketch: the number of CAR in buckets
+    of relative width below 1/64 (relative error below 0.8%). As the sums, bucket counts are exact.
+
+    States of the same event window can be merged (e.g. states computed by many processes
+    or machines, on different events): merging is exact, associative and commutative,
+    the merged state is the one of a single state to which all events would have been added.
+    States can be saved and sent as builtin python types (see `to_dict`) or JSON (see `save`).
+
+    Parameters
+    ----------
+    event_window : tuple
+        Event window specification (T2,T3) of the aggregated events.
+
+    See also
+    --------
+
+    Multiple.from_stream, Multiple.from_state, Multiple.merge
+
+    Example
+    -------
+
+    Compute the aggregate of events split over two processes:
+
+    >>> # in each process
+    >>> agg = eventstudy.Multiple.from_stream(events_of_the_process, eventstudy.Single.market_model)
+    >>> agg.state.save('state_1.json')
+    >>> # then
+    >>> state = eventstudy.AggregateState.load('state_1.json')
+    >>> state.merge(eventstudy.AggregateState.load('state_2.json'))
+    >>> agg = eventstudy.Multiple.from_state(state)
+    """
+
+    def __init__(self, event_window: tuple):
+        self.event_window = tuple(event_window)
+        self.event_window_size = -self.event_window[0] + self.event_window[1] + 1
+        self.n = 0
+        self.df = 0
+        self._sums = np.zeros((len(_SUMS), self.event_window_size), dtype=object)
+        # non-finite values (e.g. AR of missing days) can't be summed exactly, they are counted instead
+        self._invalid = np.zeros((len(_SUMS), self.event_window_size), dtype=np.int64)
+        self.CAR_min = np.full(self.event_window_size, np.inf)
+        self.CAR_max = np.full(self.event_window_size, -np.inf)
+        # sorted codes of the non-empty buckets of the sketch and their counts
+        self._sketch_codes = np.empty(0, dtype=np.int64)
+        self._sketch_counts = np.empty(0, dtype=np.int64)
+
+    def add(self, AR, var_AR, df):
+        """
+        Add events to the aggregate.
+
+        Parameters
+        ----------
+        AR : array-like
+            Abnormal returns of the events, of shape (events, event window size).
+        var_AR : array-like
+            Variance of the abnormal returns of the events, of shape (events,)
+            if constant over the event window, or (events, event window size).
+        df : array-like
+            Degree of freedom of each event.
+        """
+        CAR = self.__update(AR, var_AR, df, 1)
+        if CAR is not None:
+            self.CAR_min = np.minimum(self.CAR_min, np.min(CAR, axis=0))
+            self.CAR_max = np.maximum(self.CAR_max, np.max(CAR, axis=0))
+
+    def remove(self, AR, var_AR, df):
+        """
+        Remove events from the aggregate, given as in `add`.
+
+        The events must have been added before: their sums are subtracted exactly,
+        and the aggregate is exactly the one of the other events.
+        However, extrema of the CAR can't be updated from sufficient statistics:
+        on the days where a removed event had the lowest (or highest) CAR, they are unknown (NaN).
+        """
+        if len(AR) > self.n:
+            raise ValueError(f"Can't remove {len(AR)} events from an aggregate of {self.n} events.")
+        CAR = self.__update(AR, var_AR, df, -1)
+        if self.n == 0:
+            self.CAR_min[:], self.CAR_max[:] = np.inf, -np.inf
+        elif CAR is not None:
+            self.CAR_min[np.any(CAR <= self.CAR_min, axis=0)] = np.nan
+            self.CAR_max[np.any(CAR >= self.CAR_max, axis=0)] = np.nan
+
+    def __update(self, AR, var_AR, df, sign):
+        # add (sign = 1) or subtract (sign = -1) the sums of events, return their CAR
+        AR = np.asarray(AR, dtype=np.float64)
+        var_AR = np.asarray(var_AR, dtype=np.float64)
+        if AR.ndim != 2 or AR.shape[1] != self.event_window_size:
+            raise ValueError(
+                f"AR must be of shape (events, {self.event_window_size}) for an event window {self.event_window}."
+            )
+        if len(AR) == 0:
+            return None
+        if var_AR.ndim == 1:
+            var_AR = var_AR[:, None]
+
+        CAR = np.cumsum(AR, axis=1)
+        # squares are summed exactly (the sum of their rounding errors too): the variance of CAR
+        # is then exact, e.g. zero for a constant CAR. Higher powers are only rounded.
+        with np.errstate(invalid="ignore", over="ignore"):
+            CAR_2, CAR_2_error = _two_product(CAR, CAR)
+            # all sums of a few events are computed at once, as the columns of a single array
+            values = np.concatenate((AR, var_AR, CAR, CAR_2, CAR_2_error, CAR_2 * CAR, CAR_2 * CAR_2), axis=1)
+        finite = np.isfinite(values)
+        sums = _exact_sums(np.where(finite, values, 0.0))
+        invalid = np.sum(~finite, axis=0)
+
+        # variances constant over the event window are summed once, for all days
+        W = self.event_window_size
+        bounds = np.cumsum([W, var_AR.shape[1], W, W, W, W])
+        sums = np.split(np.array(sums, dtype=object), bounds)
+        invalid = np.split(invalid, bounds)
+        sums[3:5] = [sums[3] + sums[4]]
+        invalid[3:5] = [invalid[3] + invalid[4]]
+        for i in range(len(_SUMS)):
+            self._sums[i] += sign * sums[i]
+            self._invalid[i] += sign * invalid[i]
+
+        self.n += sign * len(AR)
+        self.df += sign * int(np.sum(df))
+        finite = np.isfinite(CAR)
+        codes = _sketch_codes(np.where(finite, CAR, 0.0))[finite]
+        self.__count(codes, np.full(len(codes), sign, dtype=np.int64))
+        return CAR
+
+    def __count(self, codes, counts):
+        # add counts to the buckets of the sketch, kept as sorted codes with non-zero counts:
+        # the sketch of a set of events doesn't depend on how it was built
+        codes, inverse = np.unique(np.concatenate((self._sketch_codes, codes)), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate((self._sketch_counts, counts)), minlength=len(codes))
+        counts = counts.astype(np.int64)
+        self._sketch_codes, self._sketch_counts = codes[counts != 0], counts[counts != 0]
+
+    def merge(self, other):
+        """
+        Merge the statistics of another aggregate into this one.
+
+        Parameters
+        ----------
+        other : AggregateState
+            State of other events, with the same event window.
+
+        Returns
+        -------
+        AggregateState
+            This state, to which all events of `other` have been added.
+        """
+        if other.event_window != self.event_window:
+            raise ValueError(
+                f"States of different event windows can't be merged: {self.event_window} and {other.event_window}."
+            )
+        self._sums = self._sums + other._sums
+        self._invalid = self._invalid + other._invalid
+        self.n += other.n
+        self.df += other.df
+        # unknown extrema (NaN) remain unknown
+        self.CAR_min = np.minimum(self.CAR_min, other.CAR_min)
+        self.CAR_max = np.maximum(self.CAR_max, other.CAR_max)
+        self.__count(other._sketch_codes, other._sketch_counts)
+        return self
+
+    def copy(self):
+        """Return a copy of the state."""
+        state = AggregateState(self.event_window)
+        return state.merge(self)
+
+    def to_dict(self) -> dict:
+        """
+        Return the state as builtin python types (e.g. to be saved as JSON).
+        Exact sums are given as hexadecimal strings.
+
+        See also
+        --------
+
+        from_dict, save
+        """
+        return {
+            "event_window": list(self.event_window),
+            "n": self.n,
+            "df": self.df,
+            "sums": {name: [hex(total) for total in self._sums[i]] for i, name in enumerate(_SUMS)},
+            "invalid": {name: self._invalid[i].tolist() for i, name in enumerate(_SUMS)},
+            "CAR_min": self.CAR_min.tolist(),
+            "CAR_max": self.CAR_max.tolist(),
+            "sketch_bits": _SKETCH_BITS,
+            "sketch_codes": self._sketch_codes.tolist(),
+            "sketch_counts": self._sketch_counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Build a state from its representation by `to_dict`.
+        """
+        if data["sketch_bits"] != _SKETCH_BITS:
+            raise ValueError(
+                f"The quantile sketch of the state ({data['sketch_bits']} bits) "
+                f"is incompatible with this version ({_SKETCH_BITS} bits)."
+            )
+        state = cls(data["event_window"])
+        state.n = data["n"]
+        state.df = data["df"]
+        for i, name in enumerate(_SUMS):
+            state._sums[i] = [int(total, 16) for total in data["sums"][name]]
+            state._invalid[i] = data["invalid"][name]
+        state.CAR_min = np.array(data["CAR_min"], dtype=np.float64)
+        state.CAR_max = np.array(data["CAR_max"], dtype=np.float64)
+        state._sketch_codes = np.array(data["sketch_codes"], dtype=np.int64)
+        state._sketch_counts = np.array(data["sketch_counts"], dtype=np.int64)
+        return state
+
+    def save(self, path: str):
+        """
+        Save the state in a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Load a state saved with `save`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        """
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+    def __mean(self, name, divisor):
+        i = _SUMS.index(name)
+        if self.n == 0:
+            return np.full(self.event_window_size, np.nan)
+        mean = np.array([_divide(total, divisor * _SCALE) for total in self._sums[i]])
+        mean[self._invalid[i] > 0] = np.nan
+        return mean
+
+    @property
+    def AAR(self):
+        """Average abnormal returns over the event window."""
+        return self.__mean("AR", self.n)
+
+    @property
+    def var_AAR(self):
+        """Variance of the average abnormal returns over the event window."""
+        return self.__mean("var_AR", self.n ** 2)
+
+    @property
+    def CAR_dist(self):
+        """
+        Descriptive statistics of the CAR distribution, for each day of the event window.
+
+        Moments are computed from the exact sums of the powers of CAR,
+        quantiles are approximated by the sketch of CAR.
+        """
+        W = self.event_window_size
+        mean, variance, skewness, kurtosis = (np.full(W, np.nan) for _ in range(4))
+        nK = self.n * _SCALE
+        for t in range(W):
+            if self.n == 0 or np.any(self._invalid[2:, t] > 0):
+                continue
+            S1, S2, S3, S4 = self._sums[2:, t]
+            # n^k K^k times the central moments of order k, as exact integers
+            m2 = max(nK * S2 - S1 * S1, 0)
+            m3 = nK ** 2 * S3 - 3 * nK * S1 * S2 + 2 * S1 ** 3
+            m4 = nK ** 3 * S4 - 4 * nK ** 2 * S1 * S3 + 6 * nK * S1 * S1 * S2 - 3 * S1 ** 4
+
+            mean[t] = _divide(S1, nK)
+            variance[t] = _divide(m2, nK ** 2)
+            # as scipy.stats, skewness and kurtosis are undefined (NaN) for a (numerically) constant CAR
+            if variance[t] > (np.finfo(np.float64).eps * mean[t]) ** 2:
+                skewness[t] = math.sqrt(_divide(m3 * m3, m2 ** 3)) * (1 if m3 >= 0 else -1)
+                kurtosis[t] = _divide(m4, m2 * m2) - 3.0
+
+        invalid = np.any(self._invalid[2:] > 0, axis=0)
+        quantiles = np.full((3, W), np.nan)
+        bounds = np.searchsorted(self._sketch_codes, np.arange(W + 1) * _SPAN)
+        for t in np.flatnonzero(~invalid):
+            if bounds[t] == bounds[t + 1]:
+                continue
+            keys = self._sketch_codes[bounds[t] : bounds[t + 1]] - t * _SPAN - _SPAN // 2
+            cumulative = np.cumsum(self._sketch_counts[bounds[t] : bounds[t + 1]])
+            for i, q in enumerate((0.25, 0.5, 0.75)):
+                quantiles[i, t] = _linear_quantile(
+                    lambda rank: _bucket_values(keys[np.searchsorted(cumulative, rank, side="right")]),
+                    int(cumulative[-1]),
+                    q,
+                )
+
+        return {
+            "Mean": mean,
+            "Variance": variance,
+            "Kurtosis": kurtosis,
+            "Skewness": skewness,
+            "Min": np.where(invalid, np.nan, self.CAR_min),
+            "Quantile 25%": quantiles[0],
+            "Quantile 50%": quantiles[1],
+            "Quantile 75%": quantiles[2],
+            "Max": np.where(invalid, np.nan, self.CAR_max),
+        }
+
+    def __repr__(self):
+        return f"AggregateState(event_window={self.event_window}, n={self.n})"
@@ -0,0 +1,97 @@
+from .store import align, AlignedStore
+from .models import CrossProductsCache
+
+from collections.abc import Mapping
+
+
+class DataContext(Mapping):
+    """
+    Read-only set of data (returns and Fama-French factors) on which event studies are run.
+
+    By default, event studies run on the data imported at the `Single` class level
+    (through `Single.import_returns` and `Single.import_FamaFrench`).
+    A `DataContext` makes the data explicit: it can be passed to any model
+    (e.g. `Single.market_model(..., context=context)`) or to `Multiple.from_list`,
+    `Multiple.from_csv` and `Multiple.from_text`. Several contexts, for example on two 
+    universes or on two snapshot dates, can then be used at the same time.
+
+    A context can't be modified after its construction: it holds read-only snapshots
+    of the data, which are not affected by later imports or appends. 
+    It can thus be shared freely, for example among the threads of a pool.
+
+    Parameters
+    ----------
+    returns : ReturnsStore, optional
+        Returns of the securities, by default None.
+    FamaFrench : ReturnsStore, optional
+        Fama-French factors, by default None.
+    max_iteration : int, optional
+        Maximum number of days after an event date searched 
+        to find the next trading day, by default 4.
+
+    See also
+    --------
+
+    Single.get_context
+
+    Example
+    -------
+
+    Run the same event study on two universes at once:
+
+    >>> es.Single.import_returns('returns_US.csv')
+    >>> US = es.Single.get_context()
+    >>> es.Single.import_returns('returns_EU.csv')
+    >>> EU = es.Single.get_context()
+    >>> event_US = es.Single.market_model('AAPL', 'SPY', np.datetime64('2013-03-04'), context=US)
+    >>> event_EU = es.Single.market_model('SAP', 'STOXX', np.datetime64('2013-03-04'), context=EU)
+    """
+
+    def __init__(self, returns=None, FamaFrench=None, max_iteration: int = 4):
+        parameters = {"max_iteration": max_iteration}
+        if returns is not None:
+            parameters["returns"] = returns.snapshot()
+        if FamaFrench is not None:
+            parameters["FamaFrench"] = FamaFrench.snapshot()
+        if returns is not None and FamaFrench is not None:
+            # returns and factors aligned once for all Fama-French models
+            parameters["panel"] = align(parameters["returns"], parameters["FamaFrench"])
+        # cumulative cross-products of the regressions run with the "rolling" solver, built when first needed
+        parameters["cross_products"] = CrossProductsCache()
+
+        object.__setattr__(self, "_parameters", parameters)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A DataContext is read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError("A DataContext is read-only.")
+
+    def __getstate__(self):
+        # derived data (aligned panel, cross-products) are not pickled, e.g. when the context
+        # is sent to other processes: the copy builds them again
+        return {
+            param_name: data
+            for param_name, data in self._parameters.items()
+            if param_name not in ("panel", "cross_products")
+        }
+
+    def __setstate__(self, parameters):
+        parameters = dict(parameters)
+        if "returns" in parameters and "FamaFrench" in parameters:
+            # dates without factors were already reported when the context was built
+            parameters["panel"] = AlignedStore(parameters["returns"], parameters["FamaFrench"])
+        parameters["cross_products"] = CrossProductsCache()
+        object.__setattr__(self, "_parameters", parameters)
+
+    def __getitem__(self, param_name: str):
+        return self._parameters[param_name]
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+    def __repr__(self):
+        return f"DataContext({', '.join(key for key in self._parameters.keys() if key not in ('panel', 'cross_products'))})"
@@ -146,7 +146,8 @@ def write_Single(self, path: str, *, chart_as_picture: bool=False, event_details
 def write_Multiple(self, path: str, *, chart_as_picture: bool=False, event_details: bool=True):
     wb = xl.Workbook(path)
     write_summary(self=self, type='Multiple', wb=wb, sheet_name = 'summary', chart_as_picture= chart_as_picture)
-    for i, event in enumerate(self.sample, 1):
+    # aggregates computed from a stream don't keep their events
+    for i, event in enumerate(self.sample or [], 1):
         write_summary(self=event, type='Single', wb=wb, sheet_name = 'event_'+str(i), chart_as_picture= chart_as_picture)
     wb.close()
 
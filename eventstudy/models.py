@@ -1,5 +1,8 @@
 import numpy as np
-import statsmodels.api as sm
+
+import threading
+
+from .exception import DataMissingError
 
 
 class Model:
@@ -16,29 +19,176 @@ class Model:
     A modelisation function must return (in this order):
         residuals of the eventWindow: as an array (vector)
         degree of freedom: as an integer
-        variance of the residuals: as an array (vector) of the same size than the residuals vector
+        variance of the residuals: as a float if it is the same for all days of the event window,
+            or as an array (vector) of the same size than the residuals vector
+
+    OLS regressions can be solved by two solvers:
+        "numpy": a direct least-squares solve with numpy, much faster than statsmodels (by default).
+        "statsmodels": a statsmodels OLS fit.
+    With keep_model, both solvers return the fitted model as a compact `FittedModel` record.
+
+    With min_obs, days with a missing value (NaN) are dropped from the estimation window,
+    which must keep at least min_obs valid days (DataMissingError otherwise).
+    The degree of freedom is then computed from the number of valid days.
     """
 
+    SOLVERS = ("numpy", "statsmodels")
+
     def __init__(
-        self, estimation_size: int, event_window_size: int, keep_model: bool = False
+        self,
+        estimation_size: int,
+        event_window_size: int,
+        keep_model: bool = False,
+        solver: str = None,
+        min_obs: int = None,
     ):
 
         self.estimation_size = estimation_size
         self.event_window_size = event_window_size
         self.keep_model = keep_model
+        self.min_obs = min_obs
+
+        if solver is None:
+            solver = "numpy"
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}. Available solvers: {', '.join(self.SOLVERS)}.")
+        self.solver = solver
+
+    def _valid_rows(self, X, Y):
+        # valid days of the estimation window of each event: days without any missing value
+        valid = ~np.isnan(Y[..., : self.estimation_size])
+        valid &= ~np.isnan(X[..., : self.estimation_size, :]).any(axis=-1)
+        nobs = np.sum(valid, axis=-1)
+        if X.shape[-1] >= self.min_obs:
+            raise ValueError(
+                f"min_obs ({self.min_obs}) must be greater than the number of coefficients ({X.shape[-1]})."
+            )
+        if np.any(nobs < self.min_obs):
+            raise DataMissingError(actual_size=np.min(nobs), expected_size=self.min_obs)
+        return valid, nobs
 
     def OLS(self, X, Y):
 
-        X = sm.add_constant(X)  # add an intercept
-        reg = sm.OLS(Y[: self.estimation_size], X[: self.estimation_size]).fit()
-        residuals = np.array(Y) - reg.predict(X)
-        df = self.estimation_size - 1
-        var = np.var(residuals[: self.estimation_size])
+        # inputs might be stored in float32, the regression always runs in float64
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        X = np.column_stack((np.ones(len(X)), X))  # add an intercept
+
+        if self.min_obs is None:
+            rows, nobs = slice(None, self.estimation_size), self.estimation_size
+        else:
+            valid, nobs = self._valid_rows(X, Y)
+            rows = np.flatnonzero(valid)
+
+        if self.solver == "statsmodels":
+            import statsmodels.api as sm  # only imported when needed, it is slow to import
+
+            reg = sm.OLS(Y[rows], X[rows]).fit()
+            residuals = Y - reg.predict(X)
+        elif np.isnan(X[rows]).any() or np.isnan(Y[rows]).any():
+            # as with the other solvers, a missing value gives NaN coefficients (lstsq may fail on it)
+            reg = np.full(X.shape[1], np.nan)
+            residuals = Y - X @ reg
+        else:
+            reg, *_ = np.linalg.lstsq(X[rows], Y[rows], rcond=None)
+            residuals = Y - X @ reg
+
+        df = int(nobs) - 1
+        var = np.var(residuals[rows])
         if self.keep_model:
-            return residuals[-self.event_window_size :], df, var, reg
+            if self.solver == "statsmodels":
+                model = FittedModel(reg.params, reg.bse, reg.rsquared, var, int(reg.nobs))
+            else:
+                X, Y = X[rows], Y[rows]
+                model = FittedModels.from_OLS(
+                    np.diagonal(np.linalg.inv(X.T @ X))[None],
+                    reg[None],
+                    np.sum(residuals[rows] ** 2)[None],
+                    np.sum((Y - np.mean(Y)) ** 2)[None],
+                    var[None],
+                    nobs,
+                )[0]
+            return residuals[-self.event_window_size :], df, var, model
 
         return residuals[-self.event_window_size :], df, var
 
+    def batch_OLS(self, X, Y, groups=None):
+        """
+        Run the OLS regressions of many events at once, with the "numpy" solver.
+
+        X and Y stack the windows of all events, as given to `OLS`:
+        X is of shape (designs, time, regressors) and Y of shape (events, time).
+        Events sharing the same regressors (e.g. Fama-French factors of events on the same date)
+        can share one design matrix: `groups` gives the index of the design matrix of each event.
+        By default (groups = None), each event has its own design matrix.
+        Return the residuals of the event windows (events, event_window_size),
+        the degree of freedom (a scalar, or one per event with min_obs),
+        and the variance of the residuals of each event (events,).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        X = np.concatenate((np.ones(X.shape[:2] + (1,)), X), axis=2)  # add an intercept
+
+        if self.min_obs is None:
+            valid, nobs = None, self.estimation_size
+        else:
+            # the missing days of each event are dropped from its own design matrix,
+            # by setting them to zero: they are then left out of the least-squares.
+            if groups is not None:
+                X, groups = X[groups], None
+            valid, nobs = self._valid_rows(X, Y)
+            X, Y = X.copy(), Y.copy()
+            X[:, : self.estimation_size][~valid] = 0
+            Y[:, : self.estimation_size][~valid] = 0
+
+        # batched least-squares through the QR decomposition of every estimation design matrix
+        Q, R = np.linalg.qr(X[:, : self.estimation_size])
+        coefficients_of = np.empty((len(Y), X.shape[2]))
+        if groups is None:
+            QtY = np.matmul(Q.transpose(0, 2, 1), Y[:, : self.estimation_size, None])
+            coefficients = np.linalg.solve(R, QtY)
+            residuals = Y - np.matmul(X, coefficients)[..., 0]
+            coefficients_of[:] = coefficients[..., 0]
+        else:
+            # multiple right-hand sides: all the events of a design matrix are solved together
+            solver = np.linalg.solve(R, Q.transpose(0, 2, 1))  # R^-1 Q'
+            order = np.argsort(groups, kind="stable")
+            bounds = np.flatnonzero(np.diff(groups[order])) + 1
+            residuals = np.empty_like(Y)
+            for events in np.split(order, bounds):
+                design = groups[events[0]]
+                coefficients = solver[design] @ Y[events, : self.estimation_size].T
+                residuals[events] = Y[events] - (X[design] @ coefficients).T
+                coefficients_of[events] = coefficients.T
+
+        df = nobs - 1
+        estimation = residuals[:, : self.estimation_size]
+        if valid is None:
+            var = np.var(estimation, axis=1)
+            ssr = np.sum(estimation ** 2, axis=1)
+        else:
+            estimation = np.where(valid, estimation, 0)
+            ssr = np.sum(estimation ** 2, axis=1)
+            var = ssr / nobs - (np.sum(estimation, axis=1) / nobs) ** 2
+
+        if self.keep_model:
+            # diagonal of (X'X)^-1 = R^-1 R^-1'
+            inverse_diagonal = np.sum(np.linalg.inv(R) ** 2, axis=2)
+            Y = Y[:, : self.estimation_size]
+            mean = np.sum(Y, axis=1, keepdims=True) / np.reshape(nobs, (-1, 1))
+            deviations = Y - mean if valid is None else np.where(valid, Y - mean, 0)
+            models = FittedModels.from_OLS(
+                inverse_diagonal if groups is None else inverse_diagonal[groups],
+                coefficients_of,
+                ssr,
+                np.sum(deviations ** 2, axis=1),
+                var,
+                nobs,
+            )
+            return residuals[:, -self.event_window_size :], df, var, models
+
+        return residuals[:, -self.event_window_size :], df, var
+
 
 def market_model(
     security_returns,
@@ -47,22 +197,22 @@ def market_model(
     estimation_size: int,
     event_window_size: int,
     keep_model: bool = False,
+    solver: str = None,
+    min_obs: int = None,
     **kwargs
 ):
     if keep_model:
-        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             market_returns, security_returns
         )
-        var = [var_res] * event_window_size
 
-        return residuals, df, var, model
+        return residuals, df, var_res, model
     else:
-        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             market_returns, security_returns
         )
-        var = [var_res] * event_window_size
 
-        return residuals, df, var
+        return residuals, df, var_res
 
     # var = var_res + 1/estimation_size * (1 +
     #    ( (np.array(market_returns)[-event_window_size:] - np.mean(market_returns[:estimation_size]) )**2)
@@ -79,32 +229,30 @@ def FamaFrench_3factor(
     estimation_size: int,
     event_window_size: int,
     keep_model: bool = False,
+    solver: str = None,
+    min_obs: int = None,
     **kwargs
 ):
 
-    RF = np.array(RF)
-    Mkt_RF = np.array(Mkt_RF)
-    security_returns = np.array(security_returns)
+    RF = np.asarray(RF, dtype=np.float64)
+    Mkt_RF = np.asarray(Mkt_RF, dtype=np.float64)
+    security_returns = np.asarray(security_returns, dtype=np.float64)
 
     X = np.column_stack((Mkt_RF, SMB, HML))
-    Y = np.array(security_returns) - np.array(RF)
+    Y = security_returns - RF
 
     if keep_model:
-        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             X, Y
         )
 
-        var = [var_res] * event_window_size
-
-        return residuals, df, var, model
+        return residuals, df, var_res, model
     else:
-        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             X, Y
         )
 
-        var = [var_res] * event_window_size
-
-        return residuals, df, var
+        return residuals, df, var_res
 
 
 def constant_mean(
@@ -113,18 +261,23 @@ def constant_mean(
     estimation_size: int,
     event_window_size: int,
     keep_model: bool = False,
+    min_obs: int = None,
     **kwargs
 ):
 
-    mean = np.mean(security_returns[:estimation_size])
-    residuals = np.array(security_returns) - mean
-    df = estimation_size - 1
-    var = [np.var(residuals)] * event_window_size
+    residuals, df, var_res, *model = constant_mean_batch(
+        np.asarray(security_returns, dtype=np.float64)[None],
+        estimation_size=estimation_size,
+        event_window_size=event_window_size,
+        keep_model=keep_model,
+        min_obs=min_obs,
+    )
+    df = df if min_obs is None else int(df[0])
 
     if keep_model:
-        return residuals[-event_window_size:], df, var, mean
+        return residuals[0], df, var_res[0], model[0][0]
     else:
-        return residuals[-event_window_size:], df, var
+        return residuals[0], df, var_res[0]
 
 
 def FamaFrench_5factor(
@@ -139,29 +292,349 @@ def FamaFrench_5factor(
     estimation_size: int,
     event_window_size: int,
     keep_model: bool = False,
+    solver: str = None,
+    min_obs: int = None,
     **kwargs
 ):
 
-    RF = np.array(RF)
-    Mkt_RF = np.array(Mkt_RF)
-    security_returns = np.array(security_returns)
+    RF = np.asarray(RF, dtype=np.float64)
+    Mkt_RF = np.asarray(Mkt_RF, dtype=np.float64)
+    security_returns = np.asarray(security_returns, dtype=np.float64)
 
     X = np.column_stack((Mkt_RF, SMB, HML, RMW, CMA))
-    Y = np.array(security_returns) - np.array(RF)
+    Y = security_returns - RF
 
     if keep_model:
-        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res, model = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             X, Y
         )
 
-        var = [var_res] * event_window_size
-
-        return residuals, df, var, model
+        return residuals, df, var_res, model
     else:
-        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model).OLS(
+        residuals, df, var_res = Model(estimation_size, event_window_size, keep_model, solver, min_obs).OLS(
             X, Y
         )
 
-        var = [var_res] * event_window_size
+        return residuals, df, var_res
+
+# Batch versions of the models, run on the stacked windows of many events (see `Model.batch_OLS`).
+# Regressors (market returns or factors) are given once per design matrix, `groups` giving
+# the design matrix of each event (by default, one design matrix per event).
+# They return the residuals of the event windows (events, event_window_size),
+# the degree of freedom and the variance of the residuals of each event (events,).
+
+
+def market_model_batch(
+    security_returns,
+    market_returns,
+    *,
+    estimation_size: int,
+    event_window_size: int,
+    keep_model: bool = False,
+    min_obs: int = None,
+    groups=None,
+    **kwargs
+):
+    market_returns = np.asarray(market_returns, dtype=np.float64)
+    return Model(estimation_size, event_window_size, keep_model, "numpy", min_obs).batch_OLS(
+        market_returns[..., None], security_returns, groups
+    )
+
+
+def FamaFrench_3factor_batch(
+    security_returns,
+    Mkt_RF,
+    SMB,
+    HML,
+    RF,
+    *,
+    estimation_size: int,
+    event_window_size: int,
+    keep_model: bool = False,
+    min_obs: int = None,
+    groups=None,
+    **kwargs
+):
+    X = np.stack((Mkt_RF, SMB, HML), axis=2)
+    RF = np.asarray(RF, dtype=np.float64)
+    Y = np.asarray(security_returns, dtype=np.float64) - (RF if groups is None else RF[groups])
+    return Model(estimation_size, event_window_size, keep_model, "numpy", min_obs).batch_OLS(X, Y, groups)
+
+
+def FamaFrench_5factor_batch(
+    security_returns,
+    Mkt_RF,
+    SMB,
+    HML,
+    RMW,
+    CMA,
+    RF,
+    *,
+    estimation_size: int,
+    event_window_size: int,
+    keep_model: bool = False,
+    min_obs: int = None,
+    groups=None,
+    **kwargs
+):
+    X = np.stack((Mkt_RF, SMB, HML, RMW, CMA), axis=2)
+    RF = np.asarray(RF, dtype=np.float64)
+    Y = np.asarray(security_returns, dtype=np.float64) - (RF if groups is None else RF[groups])
+    return Model(estimation_size, event_window_size, keep_model, "numpy", min_obs).batch_OLS(X, Y, groups)
+
+
+def constant_mean_batch(
+    security_returns,
+    *,
+    estimation_size: int,
+    event_window_size: int,
+    keep_model: bool = False,
+    min_obs: int = None,
+    **kwargs
+):
+    security_returns = np.asarray(security_returns, dtype=np.float64)
+    if min_obs is None:
+        nobs = estimation_size
+        mean = np.mean(security_returns[:, :estimation_size], axis=1, keepdims=True)
+        residuals = security_returns - mean
+        var = np.var(residuals, axis=1)
+    else:
+        # missing days are left out of the mean and of the variance
+        nobs = np.sum(~np.isnan(security_returns[:, :estimation_size]), axis=1)
+        if min_obs <= 1:
+            raise ValueError(f"min_obs ({min_obs}) must be greater than the number of coefficients (1).")
+        if np.any(nobs < min_obs):
+            raise DataMissingError(actual_size=np.min(nobs), expected_size=min_obs)
+        mean = np.nanmean(security_returns[:, :estimation_size], axis=1, keepdims=True)
+        residuals = security_returns - mean
+        var = np.nanvar(residuals, axis=1)
+    df = nobs - 1
+
+    if keep_model:
+        ssr = np.nansum(residuals[:, :estimation_size] ** 2, axis=1)
+        models = FittedModels.from_OLS(
+            1 / np.reshape(nobs, (-1, 1)) * np.ones((len(mean), 1)), mean, ssr, ssr, var, nobs
+        )
+        return residuals[:, -event_window_size:], df, var, models
+
+    return residuals[:, -event_window_size:], df, var
+
+
+class CrossProducts:
+
+    """
+    Cumulative cross-products of the regressors X (with an intercept) and of the regressand y,
+    over all the dates of the data.
+    Sums over any window of rows (Σx, Σy, Σxx', Σxy, Σyy) are the difference of two rows of the table,
+    so the OLS of an estimation window costs O(k²), whatever the estimation size.
+    This is worth it when many events are run on the same security (and market or factors).
+
+    Rows containing a NaN are left out of the sums and counted: as with the other solvers,
+    a window containing a NaN gives NaN coefficients and variance, unless min_obs is given (see `fit`).
+    The regressors and the regressand are kept in float64 (`X`, `y`) to compute the residuals of any window.
+    """
+
+    def __init__(self, X, y):
+
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[:, None]
+        self.X = X
+        self.y = np.asarray(y, dtype=np.float64)
+        Z = np.column_stack((np.ones(len(y)), X, self.y))
+        missing = np.isnan(Z).any(axis=1)
+        Z[missing] = 0
+
+        # only the upper triangle of the symmetric cross-products is stored
+        self.size = Z.shape[1]
+        self._upper = np.triu_indices(self.size)
+        self.table = np.zeros((len(Z) + 1, len(self._upper[0])))
+        np.cumsum(Z[:, self._upper[0]] * Z[:, self._upper[1]], axis=0, out=self.table[1:])
+        self.missing = np.concatenate(([0], np.cumsum(missing)))
+
+    def sums(self, starts, size: int):
+        """
+        Return the cross-products Z'Z of the windows [start, start + size), Z being (1, X, y),
+        as an array of shape (windows, k + 2, k + 2), and the number of rows containing a NaN in each window.
+        """
+        starts = np.asarray(starts)
+        upper = self.table[starts + size] - self.table[starts]
+        sums = np.empty((len(starts), self.size, self.size))
+        sums[:, self._upper[0], self._upper[1]] = upper
+        sums[:, self._upper[1], self._upper[0]] = upper
+        return sums, self.missing[starts + size] - self.missing[starts]
+
+    def fit(self, starts, size: int, keep_model: bool = False, min_obs: int = None):
+        """
+        Solve the OLS of y on X (with an intercept) over the windows [start, start + size).
+        Return the coefficients (windows, k + 1), the intercept first,
+        the variance of the residuals and the number of observations of each window (windows,),
+        plus the `FittedModels` of the windows if keep_model is True.
+        With min_obs, rows with a NaN are dropped from the windows instead,
+        and windows with less than min_obs valid rows give NaN coefficients and variance.
+        """
+        if min_obs is not None and self.size - 1 >= min_obs:
+            raise ValueError(
+                f"min_obs ({min_obs}) must be greater than the number of coefficients ({self.size - 1})."
+            )
+        sums, missing = self.sums(starts, size)
+        # without min_obs, windows always have `size` observations, as with the other solvers
+        nobs = size - missing if min_obs is not None else np.full(len(missing), size)
+        failed = missing > 0 if min_obs is None else nobs < min_obs
+        sums[failed] = np.eye(self.size)  # not solved, avoid singular matrices
+        nobs_solved = np.where(failed, size, nobs)
+        XtX = sums[:, :-1, :-1]
+        Xty = sums[:, :-1, -1]
+        coefficients = np.linalg.solve(XtX, Xty[..., None])[..., 0]
+
+        # with an intercept, residuals have a zero mean: their variance is SSR / nobs
+        ssr = sums[:, -1, -1] - np.sum(coefficients * Xty, axis=1)
+        var = ssr / nobs_solved
+
+        coefficients[failed] = np.nan
+        var[failed] = np.nan
+        if keep_model:
+            models = FittedModels.from_OLS(
+                np.diagonal(np.linalg.inv(XtX), axis1=1, axis2=2),
+                coefficients,
+                ssr,
+                sums[:, -1, -1] - Xty[:, 0] ** 2 / nobs_solved,
+                var,
+                nobs,
+            )
+            return coefficients, var, nobs, models
+
+        return coefficients, var, nobs
+
+
+class CrossProductsCache:
+
+    """
+    Cumulative cross-products of the regressions used last, shared by the threads running
+    event studies on the same data (e.g. through a `DataContext`).
+    When the cache is full, the regressions used least recently are discarded.
+    A pickled cache is empty: cross-products are built again when needed.
+    """
 
-        return residuals, df, var
\ No newline at end of file
+    def __init__(self):
+        self._items = dict()  # in the order of their last use
+        self._lock = threading.Lock()
+
+    def get(self, key, build, size: int):
+        """
+        Return the cross-products of `key`, built by `build()` if they are not in the cache,
+        keeping at most `size` of them.
+        """
+        with self._lock:
+            cross_products = self._items.pop(key, None)
+            if cross_products is not None:
+                self._items[key] = cross_products
+                return cross_products
+
+        # built outside of the lock, other threads can use the cache meanwhile
+        cross_products = build()
+        with self._lock:
+            self._items[key] = cross_products
+            while len(self._items) > size:
+                del self._items[next(iter(self._items))]
+        return cross_products
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._items))
+
+    def __reduce__(self):
+        return (CrossProductsCache, ())
+
+
+class FittedModel:
+
+    """
+    Compact record of a model fitted on the estimation window of an event,
+    kept by event studies run with `keep_model=True`:
+        params: coefficients, the intercept (or the mean for the constant mean model) first,
+        bse: standard errors of the coefficients,
+        rsquared: R² of the regression,
+        var: variance of the residuals used by the event study,
+        nobs: number of observations.
+    Unlike a statsmodels' results, it does not keep any copy of the data.
+    It replaces the statsmodels' results formerly kept by `keep_model`: only these attributes are kept,
+    methods such as `summary()` or `conf_int()` are not available.
+    """
+
+    __slots__ = ("params", "bse", "rsquared", "var", "nobs")
+
+    def __init__(self, params, bse, rsquared, var, nobs):
+        self.params = np.asarray(params)
+        self.bse = np.asarray(bse)
+        self.rsquared = float(rsquared)
+        self.var = float(var)
+        self.nobs = int(nobs)
+
+    def __repr__(self):
+        return (
+            f"FittedModel(params={self.params}, bse={self.bse}, rsquared={self.rsquared:.4f}, "
+            f"var={self.var:.4g}, nobs={self.nobs})"
+        )
+
+
+class FittedModels:
+
+    """
+    Fitted models of many events, stored as columnar arrays: params and bse of shape
+    (events, coefficients), rsquared, var and nobs of shape (events,).
+    Indexing returns the `FittedModel` of one event, sharing the memory of these arrays.
+    """
+
+    __slots__ = ("params", "bse", "rsquared", "var", "nobs")
+
+    def __init__(self, params, bse, rsquared, var, nobs):
+        self.params = params
+        self.bse = bse
+        self.rsquared = rsquared
+        self.var = var
+        self.nobs = nobs
+
+    def __len__(self):
+        return len(self.params)
+
+    def __getitem__(self, i: int):
+        model = FittedModel.__new__(FittedModel)
+        model.params, model.bse = self.params[i], self.bse[i]
+        model.rsquared, model.var, model.nobs = float(self.rsquared[i]), float(self.var[i]), int(self.nobs[i])
+        return model
+
+    @classmethod
+    def from_records(cls, records: list):
+        """
+        Stack `FittedModel` records with the same number of coefficients.
+        """
+        return cls(
+            np.array([record.params for record in records], dtype=np.float64),
+            np.array([record.bse for record in records], dtype=np.float64),
+            np.array([record.rsquared for record in records], dtype=np.float64),
+            np.array([record.var for record in records], dtype=np.float64),
+            np.array([record.nobs for record in records], dtype=np.int64),
+        )
+
+    @classmethod
+    def from_OLS(cls, inverse_diagonal, params, ssr, sst, var, nobs):
+        """
+        Build the records of OLS regressions with an intercept, from the diagonal of (X'X)^-1,
+        the coefficients, the residual and total sums of squares and the number of observations
+        (common to all regressions or one per regression) of each regression.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = ssr / (nobs - params.shape[1])
+            bse = np.sqrt(inverse_diagonal * scale[:, None])
+            rsquared = 1 - ssr / sst
+        return cls(
+            params,
+            bse,
+            rsquared,
+            np.asarray(var, dtype=np.float64),
+            np.broadcast_to(np.asarray(nobs, dtype=np.int64), (len(params),)).copy(),
+        )
@@ -1,15 +1,21 @@
-from .utils import to_table, plot, read_csv
+from .utils import to_table, plot, read_csv, t_cdf
+from .single import Single
+from .models import FittedModel, FittedModels
+from .aggregate import AggregateState, _linear_quantile
+from .context import DataContext
+from .store import AlignedStore, _extend
 from .exception import (
     CustomException,
     DateMissingError,
     DataMissingError,
     ColumnMissingError,
 )
+import importlib.util
+import itertools
 import logging
+import os
 
 import numpy as np
-import statsmodels.api as sm
-from scipy.stats import t, kurtosis, skew
 import datetime
 
 
@@ -28,6 +34,16 @@ class Multiple:
     All single event studies must have the same specifications (event, estimation and buffer windows).
     However, the model used for each event study can be different (if needed).
 
+    The AR of all events and their variances are held as events x event window matrices
+    (`Multiple.AR` and `Multiple.var_AR`), from which all aggregate statistics are computed.
+    `Multiple.sample` keeps the single event studies, whose AR are rows of `Multiple.AR`.
+    An aggregate computed with `Multiple.from_stream` only keeps the sufficient statistics
+    of its events (see `AggregateState`): it has no sample nor matrices.
+    Events can be added to or removed from an aggregate (`Multiple.add`, `Multiple.remove`),
+    its statistics are then updated from these sufficient statistics.
+    Aggregates computed separately (e.g. on shards of events, by different processes or machines)
+    can be merged from their sufficient statistics (`Multiple.state`, `Multiple.merge`).
+
     References
     ----------
 
@@ -94,9 +110,13 @@ class Multiple:
         # retrieve common parameters from the first occurence in eventStudies:
         self.event_window = sample[0].event_window
         self.event_window_size = sample[0].event_window_size
-        self.sample = sample
-        self.CAR = [event.CAR[-1] for event in sample]
         self.description = description
+
+        self.sample = sample
+        self.__stack_sample()
+        # exact sufficient statistics and sorted CAR of the events, built when events are added or removed
+        self._state = None
+        self._sorted_CAR = None
         self.__compute()
         
 
@@ -106,37 +126,324 @@ class Multiple:
     #    self.CAAR = 1/len(sample) * np.sum([event.CAR for event in sample], axis=0)
     #    self.var_CAAR = (1/(len(sample)**2)) * np.sum([event.var_CAR for event in sample], axis=0)
 
+    def __stack_sample(self):
+        # AR and their variance of all events, as events x event window matrices,
+        # on which all statistics are computed at once
+        self._AR, self._var_AR, self._df = self.__stack(self.sample)
+        if self._var_AR.ndim == 1:
+            # constant variances (see `Single.var_AR`), broadcast only once for all events
+            self._var_AR = np.repeat(self._var_AR[:, None], self.event_window_size, axis=1)
+
+        # each event's AR now refers to a row of the matrix (no copy is kept)
+        self.__bind_rows(0)
+
+        self._models = self.__stack_models()
+        self._stale_models = False
+        self._CAR = np.cumsum(self._AR, axis=1)[:, -1]
+        # matrices are stored at the beginning of buffers with spare capacity, for `add`
+        self._buffers = {name: getattr(self, name) for name in self.__MATRICES}
+
+    # matrices of the events, with one row by event
+    __MATRICES = ("_AR", "_var_AR", "_df", "_CAR")
+
+    def __bind_rows(self, start: int):
+        # events from `start` refer to their row of the AR matrix
+        for event, AR in zip(self.sample[start:], self._AR[start:]):
+            event._AR = AR
+
+    @property
+    def AR(self):
+        """
+        AR of all events, as an events x event window matrix.
+        None for an aggregate computed from a stream (see `from_stream`).
+        """
+        return self._AR
+
+    @property
+    def var_AR(self):
+        """
+        Variances of the AR of all events, as an events x event window matrix.
+        None for an aggregate computed from a stream (see `from_stream`).
+        """
+        return self._var_AR
+
+    @property
+    def CAR(self):
+        """
+        CAR of all events over the whole event window.
+        None for an aggregate computed from a stream (see `from_stream`).
+        """
+        return self._CAR
+
+    @property
+    def models(self):
+        """
+        Fitted models of all events as columnar arrays (see `keep_model` in `from_list`),
+        None if not all events kept a model of the same form.
+        """
+        if self._stale_models:
+            # events were added or removed since the models were stacked
+            self._models = self.__stack_models()
+            self._stale_models = False
+        return self._models
+
+    def __stack_models(self):
+        # fitted models of all events as columnar arrays (see `models.FittedModels`),
+        # if all events kept a model of the same form. Each event then refers to a row of these arrays.
+        records = [getattr(event, "model", None) for event in self.sample]
+        if not all(isinstance(record, FittedModel) for record in records):
+            return None
+        if len({record.params.shape for record in records}) != 1:
+            return None
+
+        models = FittedModels.from_records(records)
+        for i, event in enumerate(self.sample):
+            event.model = models[i]
+        return models
+
+    @staticmethod
+    def __stack(sample):
+        # AR, variances of AR and degrees of freedom of the events of `sample`, as arrays.
+        # Variances are given by event (a vector) if all are constant over the event window.
+        AR = np.array([event.AR for event in sample], dtype=np.float64)
+        variances = [event._var_AR for event in sample]
+        if all(isinstance(var, float) for var in variances):
+            var_AR = np.array(variances, dtype=np.float64)
+        else:
+            var_AR = np.array([event.var_AR for event in sample], dtype=np.float64)
+        df = np.array([event.df for event in sample])
+        return AR, var_AR, df
+
     def __compute(self):
-        self.AAR = 1 / len(self.sample) * np.sum([event.AR for event in self.sample], axis=0)
-        self.var_AAR = (1 / (len(self.sample) ** 2)) * np.sum(
-            [event.var_AR for event in self.sample], axis=0
+        n = len(self._AR)
+        self.__compute_tests(
+            1 / n * np.sum(self._AR, axis=0),
+            (1 / (n ** 2)) * np.sum(self._var_AR, axis=0),
+            np.sum(self._df, axis=0),
         )
+        self.CAR_dist = self.__compute_CAR_dist(np.cumsum(self._AR, axis=1))
+
+    def __compute_from_state(self):
+        # aggregate statistics from the sufficient statistics only (see `AggregateState`)
+        self.__compute_tests(self._state.AAR, self._state.var_AAR, self._state.df)
+        self.CAR_dist = self._state.CAR_dist
+        if self._sorted_CAR is not None:
+            # the events are kept: extrema and quantiles are read in their sorted CAR
+            sorted_CAR = self._sorted_CAR
+            self.CAR_dist["Min"] = np.where(np.isnan(sorted_CAR[:, -1]), np.nan, sorted_CAR[:, 0])
+            self.CAR_dist["Max"] = sorted_CAR[:, -1]
+            for q in (25, 50, 75):
+                self.CAR_dist[f"Quantile {q}%"] = self.__sorted_quantile(sorted_CAR, q / 100)
+
+    @staticmethod
+    def __sorted_quantile(sorted_values, q):
+        # quantile of each row of sorted values, with the linear interpolation of numpy.quantile
+        quantile = _linear_quantile(lambda rank: sorted_values[:, rank], sorted_values.shape[1], q)
+        # missing values are sorted last
+        return np.where(np.isnan(sorted_values[:, -1]), np.nan, quantile)
+
+    def __compute_tests(self, AAR, var_AAR, df):
+        self.AAR = AAR
+        self.var_AAR = var_AAR
         self.CAAR = np.cumsum(self.AAR)
-        self.var_CAAR = [
-            np.sum(self.var_AAR[:i]) for i in range(1, self.event_window_size + 1)
-        ]
+        self.var_CAAR = np.cumsum(self.var_AAR)
 
         self.tstat = self.CAAR / np.sqrt(self.var_CAAR)
-        self.df = np.sum([event.df for event in self.sample], axis=0)
-        self.pvalue = (1.0 - t.cdf(abs(self.tstat), self.df)) * 2
+        self.df = df
+        self.pvalue = (1.0 - t_cdf(abs(self.tstat), self.df)) * 2
 
-        self.CAR_dist = self.__compute_CAR_dist()
+    @staticmethod
+    def __compute_CAR_dist(CAR):
+        from scipy.stats import kurtosis, skew
 
-    def __compute_CAR_dist(self):
-        CAR = [event.CAR for event in self.sample]
+        quantiles = np.quantile(CAR, q=[0.25, 0.5, 0.75], axis=0)
         CAR_dist = {
             "Mean": np.mean(CAR, axis=0),
             "Variance": np.var(CAR, axis=0),
             "Kurtosis": kurtosis(CAR, axis=0),
             "Skewness": skew(CAR, axis=0),
             "Min": np.min(CAR, axis=0),
-            "Quantile 25%": np.quantile(CAR, q=0.25, axis=0),
-            "Quantile 50%": np.quantile(CAR, q=0.5, axis=0),
-            "Quantile 75%": np.quantile(CAR, q=0.75, axis=0),
+            "Quantile 25%": quantiles[0],
+            "Quantile 50%": quantiles[1],
+            "Quantile 75%": quantiles[2],
             "Max": np.max(CAR, axis=0),
         }
         return CAR_dist
 
+    def add(self, event):
+        """
+        Add an event study to the aggregate.
+
+        Aggregate statistics (AAR, CAAR, their variances, T-stat, P-value, degrees of freedom
+        and the moments of the CAR distribution) are updated from the sufficient statistics
+        of the aggregate (see `AggregateState`), in a time proportional to the event window,
+        without recomputing them from all events. The statistics are then computed from exact sums,
+        which may differ from the ones computed at construction by rounding errors only.
+
+        The event is also added as the last row of the matrices (`AR`, `var_AR`, `CAR`), 
+        in an amortized time proportional to the event window. Exact extrema and quantiles 
+        of the CAR are kept from the CAR sorted by day, in which the event is inserted:
+        this moves the memory of all events (in a time proportional to the number of events
+        times the event window), but nothing is sorted or computed again.
+
+        Parameters
+        ----------
+        event : Single
+            Event study to add, with the same event window as the aggregate.
+
+        See also
+        --------
+
+        remove
+
+        Example
+        -------
+
+        Add a late event to an aggregate:
+
+        >>> agg = eventstudy.Multiple.from_csv(
+        ...     'AAPL_10K.csv',
+        ...     eventstudy.Single.market_model,
+        ... )
+        >>> late = eventstudy.Single.market_model(
+        ...     security_ticker = 'AAPL',
+        ...     market_ticker = 'SPY',
+        ...     event_date = np.datetime64('2019-10-31'),
+        ... )
+        >>> agg.add(late)
+        """
+        if tuple(event.event_window) != tuple(self.event_window):
+            raise ValueError(
+                f"The event window of the event {event.event_window} "
+                f"differs from the one of the aggregate {self.event_window}."
+            )
+        state = self.__get_state()
+        AR, var_AR, df = self.__stack([event])
+        state.add(AR, var_AR, df)
+        if self.sample is not None:
+            self.sample.append(event)
+            self.__update_sorted_CAR(np.cumsum(AR[0]), insert=True)
+            self.__append_rows(AR, var_AR, df)
+        self.__compute_from_state()
+
+    def remove(self, event):
+        """
+        Remove an event study from the aggregate.
+
+        Aggregate statistics are updated as with `add`. For an aggregate computed from a stream
+        (see `from_stream`), the event must have been aggregated before (this can't be checked),
+        and the minimum (or maximum) of the CAR becomes unknown (NaN) on the days where
+        the event had the lowest (or highest) CAR.
+
+        Otherwise, the event is searched in the sample and its row is removed from the matrices
+        and from the sorted CAR, which moves the memory of the following events:
+        unlike the statistics, this takes a time proportional to the number of events.
+        Matrices are updated in place: `AR`, `var_AR` and `CAR` read before are modified too.
+
+        Parameters
+        ----------
+        event : Single
+            Event study to remove, one of `Multiple.sample`.
+
+        See also
+        --------
+
+        add
+
+        Example
+        -------
+
+        Remove a contaminated event from an aggregate:
+
+        >>> agg = eventstudy.Multiple.from_csv(
+        ...     'AAPL_10K.csv',
+        ...     eventstudy.Single.market_model,
+        ... )
+        >>> agg.remove(agg.sample[3])
+        """
+        if self.sample is not None:
+            # events are compared by identity (Single doesn't define equality)
+            try:
+                i = self.sample.index(event)
+            except ValueError:
+                raise ValueError("The event is not in the sample of the aggregate.") from None
+        state = self.__get_state()
+        if state.n == 1:
+            raise ValueError("The only event of an aggregate can't be removed.")
+        AR, var_AR, df = self.__stack([event])
+        state.remove(AR, var_AR, df)
+        if self.sample is not None:
+            del self.sample[i]
+            # the removed event no longer refers to the matrices of the aggregate
+            event._AR = event._AR.copy()
+            if isinstance(getattr(event, "model", None), FittedModel):
+                event.model = FittedModels.from_records([event.model])[0]
+            self.__update_sorted_CAR(np.cumsum(AR[0]), insert=False)
+            self.__delete_row(i)
+        self.__compute_from_state()
+
+    @property
+    def state(self):
+        """
+        Sufficient statistics of the events of the aggregate (see `AggregateState`).
+
+        A copy is returned: it can be saved, sent to another process or merged
+        without changing the aggregate.
+
+        See also
+        --------
+
+        from_state, merge
+        """
+        return self.__get_state().copy()
+
+    def __get_state(self):
+        # sufficient statistics of the events, built when first needed
+        if self._state is None:
+            self._state = AggregateState(self.event_window)
+            self._state.add(self.AR, self.var_AR, self._df)
+            # CAR of the events sorted by day of the event window, for the extrema and quantiles
+            self._sorted_CAR = np.sort(np.cumsum(self.AR, axis=1).T, axis=1)
+        return self._state
+
+    def __update_sorted_CAR(self, CAR, insert: bool):
+        # insert (or delete) the CAR of one event in the sorted CAR of each day, without sorting them again
+        W, n = self._sorted_CAR.shape
+        positions = np.array([np.searchsorted(row, value) for row, value in zip(self._sorted_CAR, CAR)])
+        positions += np.arange(W) * n
+        if insert:
+            self._sorted_CAR = np.insert(self._sorted_CAR.ravel(), positions, CAR).reshape(W, n + 1)
+        else:
+            self._sorted_CAR = np.delete(self._sorted_CAR.ravel(), positions).reshape(W, n - 1)
+
+    def __append_rows(self, AR, var_AR, df):
+        # add the rows of new events at the end of the matrices, in their spare capacity
+        rows = {
+            "_AR": AR,
+            "_var_AR": np.broadcast_to(var_AR[:, None], AR.shape) if var_AR.ndim == 1 else var_AR,
+            "_df": df,
+            "_CAR": np.cumsum(AR, axis=1)[:, -1],
+        }
+        n = len(self._AR)
+        reallocated = False
+        for name in self.__MATRICES:
+            matrix, buffer = _extend(getattr(self, name), self._buffers[name], rows[name], order="C")
+            reallocated |= buffer is not self._buffers[name]
+            setattr(self, name, matrix)
+            self._buffers[name] = buffer
+        # when the buffers are full, all events move to the new ones
+        self.__bind_rows(0 if reallocated else n)
+        self._stale_models = True
+
+    def __delete_row(self, i: int):
+        # remove the row of an event from the matrices, the following rows moving up (in place)
+        for name in self.__MATRICES:
+            matrix = getattr(self, name)
+            matrix[i:-1] = matrix[i + 1 :]
+            setattr(self, name, matrix[:-1])
+        self.__bind_rows(i)
+        self._stale_models = True
+
     def sign_test(self, sign="positive", confidence=0.9):
         """ Not implemented yet """
         # signtest
@@ -356,6 +663,11 @@ class Multiple:
         date_format: str = "%Y-%m-%d",
         keep_model: bool = False,
         ignore_errors: bool = True,
+        context: DataContext = None,
+        solver: str = None,
+        batch: bool = False,
+        min_obs: int = None,
+        n_jobs: int = None,
     ):
         """
         Compute an aggregate of event studies from a multi-line string containing each event's parameters.
@@ -385,7 +697,10 @@ class Multiple:
             https://docs.python.org/2/library/datetime.html#strftime-strptime-behavior
         keep_model : bool, optional
             If true the model used to compute each single event study will be stored in memory.
-            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, by default False
+            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, 
+            and for all events as columnar arrays through eventstudy.Multiple.models, by default False.
+            Models are compact records (`models.FittedModel`: params, bse, rsquared, var and nobs),
+            not statsmodels' results objects.
         ignore_errors : bool, optional
             If true, errors during the computation of single event studies will be ignored. 
             In this case, these events will be removed from the computation.
@@ -393,6 +708,21 @@ class Multiple:
             Errors can also be accessed using `print(eventstudy.Multiple.error_report())`.
             If false, the computation will be stopped by any error encounter 
             during the computation of single event studies, by default True
+        context : DataContext, optional
+            Data on which the event studies are run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regressions: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes each estimation from cumulative cross-products
+            built once per security (see `Single.market_model`): faster when the events are
+            concentrated on a few securities.
+        batch : bool, optional
+            If true, all regressions are solved together (see `from_list`), by default False.
+        min_obs : int, optional
+            Minimum number of valid days in each estimation window (see `from_list`), by default None.
+        n_jobs : int, optional
+            Number of processes computing the event studies (see `from_list`), by default None.
             
         See also
         --------
@@ -433,6 +763,11 @@ class Multiple:
             buffer_size,
             keep_model=keep_model,
             ignore_errors=ignore_errors,
+            context=context,
+            solver=solver,
+            batch=batch,
+            min_obs=min_obs,
+            n_jobs=n_jobs,
         )
 
     @classmethod
@@ -446,6 +781,11 @@ class Multiple:
         *,
         keep_model: bool = False,
         ignore_errors: bool = True,
+        context: DataContext = None,
+        solver: str = None,
+        batch: bool = False,
+        min_obs: int = None,
+        n_jobs: int = None,
     ):
         """
         Compute an aggregate of event studies from a list containing each event's parameters.
@@ -469,7 +809,10 @@ class Multiple:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute each single event study will be stored in memory.
-            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, by default False
+            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, 
+            and for all events as columnar arrays through eventstudy.Multiple.models, by default False.
+            Models are compact records (`models.FittedModel`: params, bse, rsquared, var and nobs),
+            not statsmodels' results objects.
         ignore_errors : bool, optional
             If true, errors during the computation of single event studies will be ignored. 
             In this case, these events will be removed from the computation.
@@ -477,6 +820,35 @@ class Multiple:
             Errors can also be accessed using `print(eventstudy.Multiple.error_report())`.
             If false, the computation will be stopped by any error encounter 
             during the computation of single event studies, by default True
+        context : DataContext, optional
+            Data on which the event studies are run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regressions: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes each estimation from cumulative cross-products
+            built once per security (see `Single.market_model`): faster when the events are
+            concentrated on a few securities.
+        batch : bool, optional
+            If true, the windows of all events are gathered at once and all regressions
+            are solved together, which is much faster for large lists of events, by default False.
+            Only available for the model methods of `Single` (market_model, constant_mean,
+            FamaFrench_3factor and FamaFrench_5factor), with the "numpy" or "rolling" solver.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window of each event,
+            by default None. If specified, days with a missing value are dropped from the estimation
+            (see `Single.market_model`), and events with less valid days are reported as errors.
+        n_jobs : int, optional
+            Number of processes computing the event studies, by default None (computed in this process).
+            The event list is split in chunks run on a pool of `n_jobs` processes (-1 for all CPUs),
+            with the data sent once to each process. Events and errors are returned in the order
+            of `event_list`, exactly as without n_jobs (with `batch`, up to rounding errors,
+            as the regressions solved together depend on the chunks). Each process limits its BLAS threads
+            to its share of the CPUs, with the optional `threadpoolctl` package 
+            (`pip install eventstudy[parallel]`). Processes are started with the "spawn" method (on all platforms):
+            `event_study_model` must be importable by the processes (e.g. a model method of `Single`
+            or a function defined in a module), and scripts must guard their main code
+            with `if __name__ == "__main__":`.
             
         See also
         --------
@@ -503,8 +875,311 @@ class Multiple:
         #   {'event_date': np.datetime64, models_data},
         #   {'event_date': np.datetime64, models_data}
         # ]
-        sample = list()
+        compute_options = dict(
+            event_window=event_window,
+            estimation_size=estimation_size,
+            buffer_size=buffer_size,
+            keep_model=keep_model,
+            ignore_errors=ignore_errors,
+            solver=solver,
+            batch=batch,
+            min_obs=min_obs,
+        )
+        if n_jobs is not None and n_jobs != 1:
+            sample, failures = cls.__from_pool(event_list, event_study_model, n_jobs, context, compute_options)
+        else:
+            sample, failures = cls._compute_events(event_list, event_study_model, context=context, **compute_options)
+
         errors = list()
+        cls.__record_errors(event_list, failures, errors)
+        return cls(sample, errors)
+
+    @classmethod
+    def from_stream(
+        cls,
+        events,
+        event_study_model=None,
+        event_window: tuple = (-10, +10),
+        estimation_size: int = 300,
+        buffer_size: int = 30,
+        *,
+        ignore_errors: bool = True,
+        context: DataContext = None,
+        solver: str = None,
+        batch: bool = False,
+        min_obs: int = None,
+        chunk_size: int = 1000,
+    ):
+        """
+        Compute an aggregate of event studies from an iterator of events, without keeping them in memory.
+
+        Events are consumed chunk after chunk and only the sufficient statistics of the aggregate
+        are kept (see `AggregateState`): memory doesn't grow with the number of events.
+        AAR, CAAR, their variances and tests, as well as the moments and extrema of the CAR
+        distribution are then the same as with `from_list` (up to rounding errors).
+        As event studies are not kept, `sample`, `AR`, `var_AR`, `CAR` and `models` are None,
+        and the quantiles of the CAR distribution are approximated (relative error below 0.8%).
+
+        Parameters
+        ----------
+        events : iterable
+            Iterable (e.g. a generator) of `eventstudy.Single` instances if `event_study_model` is None,
+            or of dictionaries specifying each event's parameters (as in `from_list`).
+        event_study_model : optional
+            Function returning an eventstudy.Single class instance (see `from_list`), by default None.
+            If None, `events` yields event studies already computed.
+        event_window : tuple, optional
+            Event window specification (T2,T3), by default (-10, +10).
+            Not used if `event_study_model` is None: the event window of the events is used.
+        estimation_size : int, optional
+            Size of the estimation for the modelisation of returns [T0,T1], by default 300
+        buffer_size : int, optional
+            Size of the buffer window [T1,T2], by default 30
+        ignore_errors : bool, optional
+            If true, errors during the computation of single event studies will be ignored
+            (see `from_list`), by default True
+        context : DataContext, optional
+            Data on which the event studies are run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regressions (see `from_list`), by default None: "numpy".
+        batch : bool, optional
+            If true, the events of each chunk are computed at once (see `from_list`), by default False.
+        min_obs : int, optional
+            Minimum number of valid days in each estimation window (see `from_list`), by default None.
+        chunk_size : int, optional
+            Number of events computed and aggregated at once, by default 1000.
+
+        See also
+        --------
+
+        from_list, merge, AggregateState
+
+        Example
+        -------
+
+        Aggregate events read from a large csv file, one line after another:
+
+        >>> def read_events(path):
+        ...     with open(path) as file:
+        ...         next(file)  # header
+        ...         for line in file:
+        ...             date, ticker = line.strip().split(',')
+        ...             yield {'event_date': np.datetime64(date), 'security_ticker': ticker, 'market_ticker': 'SPY'}
+        >>> agg = eventstudy.Multiple.from_stream(
+        ...     read_events('events.csv'),
+        ...     eventstudy.Single.market_model,
+        ...     event_window = (-5,+10),
+        ... )
+        """
+        compute_options = dict(
+            event_window=event_window,
+            estimation_size=estimation_size,
+            buffer_size=buffer_size,
+            keep_model=False,
+            ignore_errors=ignore_errors,
+            solver=solver,
+            batch=batch,
+            min_obs=min_obs,
+        )
+        state = None if event_study_model is None else AggregateState(event_window)
+        errors = list()
+        events = iter(events)
+        while True:
+            chunk = list(itertools.islice(events, chunk_size))
+            if not chunk:
+                break
+            if event_study_model is None:
+                sample = chunk
+            else:
+                sample, failures = cls._compute_events(chunk, event_study_model, context=context, **compute_options)
+                cls.__record_errors(chunk, failures, errors)
+            if sample:
+                if state is None:
+                    state = AggregateState(sample[0].event_window)
+                state.add(*cls.__stack(sample))
+
+        if state is None or state.n == 0:
+            raise ValueError("No event study to aggregate.")
+        return cls.from_state(state, errors)
+
+    @classmethod
+    def from_state(cls, state, errors=None, description: str = None):
+        """
+        Build an aggregate of event studies from their sufficient statistics only.
+
+        As event studies are not kept, `sample`, `AR`, `var_AR`, `CAR` and `models` are None,
+        and the quantiles of the CAR distribution are approximated (see `from_stream`).
+
+        Parameters
+        ----------
+        state : AggregateState
+            Sufficient statistics of the events (e.g. merged from several processes).
+        errors : list, optional
+            A list containing errors encountered during the computation of single event studies, by default None.
+        description : str, optional
+            A description text, by default None.
+
+        See also
+        --------
+
+        state, merge, AggregateState
+        """
+        self = cls.__new__(cls)
+        self.errors = errors
+        self.__warn_errors()
+
+        self.event_window = state.event_window
+        self.event_window_size = state.event_window_size
+        self.description = description
+        self.sample = None
+        self._AR = None
+        self._var_AR = None
+        self._df = None
+        self._models = None
+        self._stale_models = False
+        self._CAR = None
+
+        self._state = state
+        self._sorted_CAR = None
+        self.__compute_from_state()
+        return self
+
+    @classmethod
+    def merge(cls, aggregates, description: str = None):
+        """
+        Merge aggregates of event studies computed separately (e.g. on shards of events).
+
+        Aggregates are merged from their sufficient statistics (see `AggregateState`):
+        the result is exactly the one of `from_stream` run on all events at once,
+        whatever the order in which aggregates are merged.
+
+        Parameters
+        ----------
+        aggregates : list
+            List of `eventstudy.Multiple` or `eventstudy.AggregateState` instances, of the same event window.
+        description : str, optional
+            A description text, by default None.
+
+        See also
+        --------
+
+        from_stream, from_state, state
+
+        Example
+        -------
+
+        Run the event studies of each shard in a different process:
+
+        >>> def aggregate_shard(shard):
+        ...     return eventstudy.Multiple.from_stream(shard, eventstudy.Single.market_model).state
+        >>> with concurrent.futures.ProcessPoolExecutor() as pool:
+        ...     states = list(pool.map(aggregate_shard, shards))
+        >>> agg = eventstudy.Multiple.merge(states)
+        """
+        state = None
+        errors = list()
+        for aggregate in aggregates:
+            if isinstance(aggregate, Multiple):
+                errors.extend(aggregate.errors or [])
+                aggregate = aggregate.__get_state()
+            state = aggregate.copy() if state is None else state.merge(aggregate)
+
+        if state is None or state.n == 0:
+            raise ValueError("No event study to aggregate.")
+        return cls.from_state(state, errors, description)
+
+    @staticmethod
+    def __record_errors(event_list, failures, errors):
+        # add to `errors` the parameters of the events of `event_list` that failed, with their error
+        for i, error in failures:
+            event_params = event_list[i]
+            event_params["error_type"] = error.__class__.__name__
+            event_params["error_msg"] = error.helper
+            errors.append(event_params)
+
+    @classmethod
+    def _compute_events(
+        cls,
+        event_list,
+        event_study_model,
+        *,
+        event_window,
+        estimation_size,
+        buffer_size,
+        keep_model,
+        ignore_errors,
+        context,
+        solver,
+        batch,
+        min_obs,
+    ):
+        # Compute the single event studies of `event_list`, one after another or in batch.
+        # Return the events computed and the errors encountered, with the position of their event
+        # in `event_list`, both in the order of `event_list`. Without ignore_errors, the first error is raised.
+        Single._load_tickers(event_list, context)
+        if batch:
+            results = cls.__from_batch(
+                event_list,
+                event_study_model,
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model=keep_model,
+                context=context,
+                solver=solver,
+                min_obs=min_obs,
+            )
+        else:
+            results = cls.__from_loop(
+                event_list,
+                event_study_model,
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model=keep_model,
+                ignore_errors=ignore_errors,
+                context=context,
+                solver=solver,
+                min_obs=min_obs,
+            )
+
+        sample = list()
+        failures = list()
+        for i, result in enumerate(results):
+            if isinstance(result, Single):
+                sample.append(result)
+            elif ignore_errors:
+                failures.append((i, result))
+            else:
+                raise result
+
+        return sample, failures
+
+    @staticmethod
+    def __from_loop(
+        event_list,
+        event_study_model,
+        event_window,
+        estimation_size,
+        buffer_size,
+        *,
+        keep_model,
+        ignore_errors,
+        context,
+        solver,
+        min_obs,
+    ):
+        # options are only passed if given, so that custom models don't have to accept them
+        options = {}
+        if context is not None:
+            options["context"] = context
+        if solver is not None:
+            options["solver"] = solver
+        if min_obs is not None:
+            options["min_obs"] = min_obs
+
+        results = list()
         for event_params in event_list:
             try:
                 event = event_study_model(
@@ -513,18 +1188,103 @@ class Multiple:
                     estimation_size=estimation_size,
                     buffer_size=buffer_size,
                     keep_model=keep_model,
+                    **options,
                 )
             except (DateMissingError, DataMissingError, ColumnMissingError) as e:
-                if ignore_errors:
-                    event_params["error_type"] = e.__class__.__name__
-                    event_params["error_msg"] = e.helper
-                    errors.append(event_params)
-                else:
+                if not ignore_errors:
                     raise e
+                results.append(e)
             else:
-                sample.append(event)
+                results.append(event)
 
-        return cls(sample, errors)
+        return results
+
+    @staticmethod
+    def __from_batch(
+        event_list,
+        event_study_model,
+        event_window,
+        estimation_size,
+        buffer_size,
+        *,
+        keep_model,
+        context,
+        solver,
+        min_obs,
+    ):
+        # only the model methods of Single (or of a sub-class) can be run in batch
+        model = getattr(event_study_model, "__name__", None)
+        if (
+            model not in Single._BATCH_MODELS
+            or getattr(event_study_model, "__func__", None) is not getattr(Single, model).__func__
+        ):
+            raise ValueError(
+                "Batch computation is only available for the model methods of eventstudy.Single: "
+                + ", ".join(Single._BATCH_MODELS)
+                + "."
+            )
+        return event_study_model.__self__._batch(
+            model, event_list, event_window, estimation_size, buffer_size, context, solver, keep_model, min_obs
+        )
+
+    @classmethod
+    def __from_pool(cls, event_list, event_study_model, n_jobs, context, compute_options):
+        # Split `event_list` in chunks computed by a pool of processes. The data (the context,
+        # or the data imported in the Single class) is sent once to each process when it starts,
+        # and results are collected chunk after chunk: they are in the order of `event_list`.
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        cpu_count = os.cpu_count() or 1
+        if n_jobs == 0:
+            raise ValueError("n_jobs can't be 0: give a number of processes, or -1 to use all CPUs.")
+        if n_jobs < 0:
+            n_jobs = max(cpu_count + 1 + n_jobs, 1)  # -1: all CPUs, -2: all CPUs but one, etc.
+
+        n_chunks = min(len(event_list), 4 * n_jobs)  # a few chunks per process to balance the load
+        bounds = np.linspace(0, len(event_list), n_chunks + 1).astype(int)
+
+        owner = getattr(event_study_model, "__self__", None)
+        if not (isinstance(owner, type) and issubclass(owner, Single)):
+            owner = Single
+        # derived data (aligned panel, cross-products) are built again by the processes when needed
+        parameters = None
+        if context is None:
+            parameters = {
+                param_name: data
+                for param_name, data in owner._parameters.items()
+                if param_name not in owner._DERIVED_PARAMETERS
+            }
+
+        # each process runs its BLAS with its share of the CPUs, so that they don't compete
+        if importlib.util.find_spec("threadpoolctl") is None:
+            logging.warning(
+                "threadpoolctl is not installed: the BLAS threads of the processes can't be limited "
+                "and may compete for the CPUs (pip install threadpoolctl)."
+            )
+        with ProcessPoolExecutor(
+            n_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(owner, parameters, context, max(cpu_count // n_jobs, 1)),
+        ) as executor:
+            futures = [
+                executor.submit(_compute_chunk, event_list[start:end], event_study_model, compute_options)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            sample = list()
+            failures = list()
+            try:
+                for start, future in zip(bounds, futures):
+                    chunk_sample, chunk_failures = future.result()
+                    sample += chunk_sample
+                    failures += [(start + i, error) for i, error in chunk_failures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return sample, failures
 
     @classmethod
     def from_csv(
@@ -538,6 +1298,11 @@ class Multiple:
         date_format: str = "%Y%m%d",
         keep_model: bool = False,
         ignore_errors: bool = True,
+        context: DataContext = None,
+        solver: str = None,
+        batch: bool = False,
+        min_obs: int = None,
+        n_jobs: int = None,
     ):
         """
         Compute an aggregate of event studies from a csv file containing each event's parameters.
@@ -567,7 +1332,10 @@ class Multiple:
             https://docs.python.org/2/library/datetime.html#strftime-strptime-behavior
         keep_model : bool, optional
             If true the model used to compute each single event study will be stored in memory.
-            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, by default False
+            They will be accessible through the class attributes eventStudy.Multiple.singles[n].model, 
+            and for all events as columnar arrays through eventstudy.Multiple.models, by default False.
+            Models are compact records (`models.FittedModel`: params, bse, rsquared, var and nobs),
+            not statsmodels' results objects.
         ignore_errors : bool, optional
             If true, errors during the computation of single event studies will be ignored. 
             In this case, these events will be removed from the computation.
@@ -575,6 +1343,21 @@ class Multiple:
             Errors can also be accessed using `print(eventstudy.Multiple.error_report())`.
             If false, the computation will be stopped by any error encounter 
             during the computation of single event studies, by default True
+        context : DataContext, optional
+            Data on which the event studies are run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regressions: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes each estimation from cumulative cross-products
+            built once per security (see `Single.market_model`): faster when the events are
+            concentrated on a few securities.
+        batch : bool, optional
+            If true, all regressions are solved together (see `from_list`), by default False.
+        min_obs : int, optional
+            Minimum number of valid days in each estimation window (see `from_list`), by default None.
+        n_jobs : int, optional
+            Number of processes computing the event studies (see `from_list`), by default None.
             
         See also
         --------
@@ -608,6 +1391,11 @@ class Multiple:
             buffer_size,
             keep_model=keep_model,
             ignore_errors=ignore_errors,
+            context=context,
+            solver=solver,
+            batch=batch,
+            min_obs=min_obs,
+            n_jobs=n_jobs,
         )
 
     def __warn_errors(self):
@@ -718,3 +1506,30 @@ Details
 
         else:
             return "No error."
+
+
+# Context (or None) of the processes computing event studies for `Multiple.from_list` with n_jobs
+_worker_context = None
+# limits of the BLAS threads of these processes (see `threadpoolctl`)
+_worker_limits = None
+
+
+def _init_worker(owner, parameters, context, blas_threads):
+    global _worker_context, _worker_limits
+    _worker_context = context
+    if parameters is not None:
+        if "returns" in parameters and "FamaFrench" in parameters:
+            # dates without factors were already reported by the main process
+            parameters["panel"] = AlignedStore(parameters["returns"], parameters["FamaFrench"])
+        owner._parameters = parameters
+
+    # BLAS are already loaded (with numpy): their threads are limited at runtime
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    _worker_limits = threadpool_limits(blas_threads)
+
+
+def _compute_chunk(event_list, event_study_model, compute_options):
+    return Multiple._compute_events(event_list, event_study_model, context=_worker_context, **compute_options)
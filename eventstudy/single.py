@@ -1,4 +1,14 @@
-from .utils import to_table, plot, read_csv, get_index_of_date
+from .utils import to_table, plot, read_table, read_header, t_cdf
+from .store import (
+    ReturnsStore,
+    LazyReturnsStore,
+    sort_by_date,
+    price_to_returns,
+    load_cache,
+    save_cache,
+    align,
+)
+from .context import DataContext
 from .exception import (
     ParameterMissingError,
     DateMissingError,
@@ -7,10 +17,57 @@ from .exception import (
 )
 
 import numpy as np
-import statsmodels.api as sm
-from scipy.stats import t
 
-from .models import market_model, FamaFrench_3factor, FamaFrench_5factor, constant_mean
+from .models import (
+    market_model,
+    FamaFrench_3factor,
+    FamaFrench_5factor,
+    constant_mean,
+    market_model_batch,
+    FamaFrench_3factor_batch,
+    FamaFrench_5factor_batch,
+    constant_mean_batch,
+    CrossProducts,
+    CrossProductsCache,
+    FittedModels,
+)
+
+
+def _lazy_returns(path, is_price, log_return, date_format, columns, dtype):
+    # read only the date column up front, tickers are read by the store when first needed
+    dates = read_table(path, format_date=True, date_format=date_format, columns=[])["date"]
+    order = None
+    if len(dates) > 1 and np.any(dates[1:] < dates[:-1]):
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+
+    if columns is None:
+        columns = [column for column in read_header(path) if column != "date"]
+
+    if is_price:
+        dates = dates[1:] #remove the first date
+
+    return LazyReturnsStore(dates, columns, _ColumnsReader(path, order, is_price, log_return), dtype=dtype)
+
+
+class _ColumnsReader:
+    # Read tickers from the source file of a lazy store. Unlike a closure, it can be pickled
+    # with the store (e.g. to run event studies in other processes, which then read the file themselves).
+
+    def __init__(self, path, order, is_price, log_return):
+        self.path = path
+        self.order = order
+        self.is_price = is_price
+        self.log_return = log_return
+
+    def __call__(self, tickers):
+        data = read_table(self.path, columns=tickers)
+        values = np.column_stack([np.asarray(data[ticker], dtype=np.float64) for ticker in tickers])
+        if self.order is not None:
+            values = values[self.order]
+        if self.is_price:
+            values = price_to_returns(values, self.log_return)
+        return values
 
 
 class Single:
@@ -32,6 +89,26 @@ class Single:
         "max_iteration": 4,
     }
 
+    # many events may be held at once (e.g. in `Multiple.sample`): no per-instance __dict__,
+    # results are float64 arrays and a constant variance of AR is kept as a float (see `var_AR`)
+    __slots__ = (
+        "event_date",
+        "event_window",
+        "estimation_size",
+        "buffer_size",
+        "description",
+        "_AR",
+        "df",
+        "_var_AR",
+        "model",
+        "_CAR",
+        "_var_CAR",
+        "_tstat",
+        "_pvalue",
+    )
+    # statistics computed from AR and var_AR when first read, then cached
+    _STATISTICS = ("_CAR", "_var_CAR", "_tstat", "_pvalue")
+
     def __init__(
         self,
         model_func,
@@ -41,7 +118,9 @@ class Single:
         estimation_size: int = 300,
         buffer_size: int = 30,
         keep_model: bool = False,
-        description: str = None
+        description: str = None,
+        solver: str = None,
+        min_obs: int = None,
     ):
         """
         Low-level (complex) way of runing an event study. Prefer the simpler use of model methods.
@@ -66,7 +145,21 @@ class Single:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute the event study will be stored in memory.
-            It will be accessible through the class attributes eventstudy.Single.model, by default False
+            It will be accessible through the class attributes eventstudy.Single.model, as a compact record
+            (`models.FittedModel`) keeping only params, bse, rsquared, var and nobs, by default False.
+            It is no longer a statsmodels' results object: methods such as `summary()` or `conf_int()`
+            are not available (refit the estimation window with statsmodels to get them).
+        description : str, optional
+            Description of the event study, by default None.
+        solver : str, optional
+            Solver used by `model_func` for OLS regressions ("numpy" or "statsmodels"), by default None.
+            If None, `model_func` default is used (see `models.Model`).
+            Only passed to `model_func` if specified, so that custom model functions
+            are not required to accept it.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window, by default None.
+            If specified, days with a missing value are dropped from the estimation window (see `models.Model`).
+            Only passed to `model_func` if specified, as `solver`.
 
         See also
         -------
@@ -89,30 +182,98 @@ class Single:
         """
         self.event_date = event_date
         self.event_window = event_window
-        self.event_window_size = -event_window[0] + event_window[1] + 1
         self.estimation_size = estimation_size
         self.buffer_size = buffer_size
         self.description = description
 
+        options = {}
+        if solver is not None:
+            options["solver"] = solver
+        if min_obs is not None:
+            options["min_obs"] = min_obs
         model = model_func(
             **model_data,
             estimation_size=self.estimation_size,
             event_window_size=self.event_window_size,
-            keep_model=keep_model
+            keep_model=keep_model,
+            **options
         )
 
         if keep_model:
-            self.AR, self.df, self.var_AR, self.model = model
+            AR, self.df, self.var_AR, self.model = model
+        else:
+            AR, self.df, self.var_AR = model
+        # copied: AR is often a view on the residuals of the whole window, which would be kept in memory
+        self.AR = np.array(AR, dtype=np.float64)
+
+    @property
+    def event_window_size(self):
+        return -self.event_window[0] + self.event_window[1] + 1
+
+    @property
+    def AR(self):
+        return self._AR
+
+    @AR.setter
+    def AR(self, AR):
+        self._AR = AR
+        self._clear_statistics()
+
+    @property
+    def var_AR(self):
+        # a constant variance is broadcast over the event window, as a read-only view
+        if np.ndim(self._var_AR) == 0:
+            return np.broadcast_to(self._var_AR, (self.event_window_size,))
+        return self._var_AR
+
+    @var_AR.setter
+    def var_AR(self, var_AR):
+        # the variance of AR can be given as one value or as one value per day of the event window
+        var_AR = np.asarray(var_AR, dtype=np.float64)
+        if var_AR.ndim == 0 or np.array_equal(var_AR, np.full_like(var_AR, var_AR[0]), equal_nan=True):
+            self._var_AR = float(var_AR.ravel()[0])
         else:
-            self.AR, self.df, self.var_AR = model
+            self._var_AR = var_AR
+        self._clear_statistics()
+
+    def _clear_statistics(self):
+        for name in self._STATISTICS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
 
-        self.__compute()
+    @property
+    def CAR(self):
+        try:
+            return self._CAR
+        except AttributeError:
+            self._CAR = np.cumsum(self.AR)
+            return self._CAR
+
+    @property
+    def var_CAR(self):
+        try:
+            return self._var_CAR
+        except AttributeError:
+            self._var_CAR = np.arange(1, self.event_window_size + 1) * self._var_AR
+            return self._var_CAR
+
+    @property
+    def tstat(self):
+        try:
+            return self._tstat
+        except AttributeError:
+            self._tstat = self.CAR / np.sqrt(self.var_CAR)
+            return self._tstat
 
-    def __compute(self):
-        self.CAR = np.cumsum(self.AR)
-        self.var_CAR = [(i * var) for i, var in enumerate(self.var_AR, 1)]
-        self.tstat = self.CAR / np.sqrt(self.var_CAR)
-        self.pvalue = (1.0 - t.cdf(abs(self.tstat), self.df)) * 2
+    @property
+    def pvalue(self):
+        try:
+            return self._pvalue
+        except AttributeError:
+            self._pvalue = (1.0 - t_cdf(abs(self.tstat), self.df)) * 2
+            return self._pvalue
 
     def results(self, asterisks: bool = True, decimals=3):
         """
@@ -251,6 +412,33 @@ class Single:
     @classmethod
     def _save_parameter(cls, param_name: str, data):
         cls._parameters[param_name] = data
+        cls._reset_derived()
+
+    # parameters derived from the imported data, built again when needed
+    _DERIVED_PARAMETERS = ("panel", "cross_products")
+
+    @classmethod
+    def _reset_derived(cls):
+        # the aligned panel of returns and factors and the cumulative cross-products must be built again
+        for param_name in cls._DERIVED_PARAMETERS:
+            cls._parameters.pop(param_name, None)
+
+    @classmethod
+    def get_context(cls):
+        """
+        Return a read-only `DataContext` holding the data currently imported in the `Single` Class.
+        Later imports do not modify the returned context.
+
+        See also
+        --------
+
+        DataContext
+        """
+        return DataContext(
+            returns=cls._parameters.get("returns"),
+            FamaFrench=cls._parameters.get("FamaFrench"),
+            max_iteration=cls._parameters["max_iteration"],
+        )
 
     @classmethod
     def _get_parameters(
@@ -261,18 +449,126 @@ class Single:
         event_window: tuple = (-10, +10),
         estimation_size: int = 300,
         buffer_size: int = 30,
+        context: DataContext = None,
+        min_obs: int = None,
     ) -> tuple:
 
-        # Find index of returns
+        # the data imported at the class level is the default context
+        parameters = cls._parameters if context is None else context
+
         try:
-            event_i = get_index_of_date(
-                cls._parameters[param_name]["date"],
-                event_date,
-                cls._parameters["max_iteration"],
-            )
+            store = parameters[param_name]
         except KeyError:
             raise ParameterMissingError(param_name)
 
+        for column in columns:
+            if column not in store:
+                raise ColumnMissingError(param_name, column)
+
+        start, end, size = cls._get_window_rows(
+            store.calendar, param_name, event_date, event_window, estimation_size, buffer_size, parameters
+        )
+
+        # views on the store's matrix, no data is copied
+        results = store.window(columns, start, end)
+        cls._check_window_size(results, columns, param_name, size)
+        cls._check_valid_obs(
+            results, columns, [param_name] * len(columns), estimation_size, event_window, min_obs
+        )
+
+        return results
+
+    @classmethod
+    def _get_joint_parameters(
+        cls,
+        security_columns: tuple,
+        factor_columns: tuple,
+        event_date: np.datetime64,
+        event_window: tuple = (-10, +10),
+        estimation_size: int = 300,
+        buffer_size: int = 30,
+        context: DataContext = None,
+        min_obs: int = None,
+    ) -> tuple:
+        # Same as `_get_parameters` but for both returns and Fama-French factors at once,
+        # through the panel of returns and factors aligned on their common dates.
+
+        parameters = cls._parameters if context is None else context
+        panel = cls._get_panel(parameters)
+
+        for column in security_columns:
+            if column not in panel.returns:
+                raise ColumnMissingError("returns", column)
+        for column in factor_columns:
+            if column not in panel.factors:
+                raise ColumnMissingError("FamaFrench", column)
+
+        # a date missing in the panel but not in the returns is missing in the factors
+        if panel.calendar.index_of(event_date, parameters["max_iteration"]) is None:
+            in_returns = panel.returns.calendar.index_of(event_date, parameters["max_iteration"])
+            raise DateMissingError(event_date, "returns" if in_returns is None else "FamaFrench")
+
+        start, end, size = cls._get_window_rows(
+            panel.calendar, "FamaFrench", event_date, event_window, estimation_size, buffer_size, parameters
+        )
+
+        securities = panel.security_window(security_columns, start, end)
+        cls._check_window_size(securities, security_columns, "returns", size)
+        factors = panel.factors.window(factor_columns, start, end)
+        cls._check_window_size(factors, factor_columns, "FamaFrench", size)
+        cls._check_valid_obs(
+            securities + factors,
+            security_columns + factor_columns,
+            ["returns"] * len(security_columns) + ["FamaFrench"] * len(factor_columns),
+            estimation_size,
+            event_window,
+            min_obs,
+        )
+
+        return securities + factors
+
+    @classmethod
+    def _load_tickers(cls, event_list, context: DataContext = None):
+        # Read at once, from a lazy store, the tickers of events run one after another:
+        # each read parses the whole source file. Unknown tickers are left to the models' errors.
+        parameters = cls._parameters if context is None else context
+        store = parameters.get("returns")
+        if not isinstance(store, LazyReturnsStore):
+            return
+
+        tickers = dict.fromkeys(
+            event_params[key]
+            for event_params in event_list
+            for key in ("security_ticker", "market_ticker")
+            if key in event_params
+        )
+        store.load([ticker for ticker in tickers if ticker in store])
+
+    @classmethod
+    def _get_panel(cls, parameters):
+        # returns and Fama-French factors aligned on their common dates,
+        # built once and kept until the returns or the factors change
+        try:
+            return parameters["panel"]
+        except KeyError:
+            pass
+
+        for param_name in ("returns", "FamaFrench"):
+            if param_name not in parameters:
+                raise ParameterMissingError(param_name)
+
+        panel = align(parameters["returns"], parameters["FamaFrench"])
+        if parameters is cls._parameters:
+            cls._parameters["panel"] = panel
+
+        return panel
+
+    @staticmethod
+    def _get_window_rows(
+        calendar, param_name, event_date, event_window, estimation_size, buffer_size, parameters
+    ):
+        # Find index of the event through the parameter's sorted calendar
+        event_i = calendar.index_of(event_date, parameters["max_iteration"])
         if event_i is None:
             raise DateMissingError(event_date, param_name)
 
@@ -280,20 +576,385 @@ class Single:
         end = event_i + event_window[1] + 1
         size = -event_window[0] + buffer_size + estimation_size + event_window[1] + 1
 
-        results = list()
-        for column in columns:
+        return start, end, size
+
+    @staticmethod
+    def _check_window_size(results, columns, param_name, size):
+        # test if all data has been retrieved
+        for column, result in zip(columns, results):
+            if len(result) != size:
+                raise DataMissingError(param_name, column, len(result), size)
+
+    @staticmethod
+    def _check_valid_obs(results, columns, param_names, estimation_size, event_window, min_obs):
+        # with min_obs, days with a missing value are dropped from the estimation window,
+        # which must keep at least min_obs valid days, but the event window must be complete
+        if min_obs is None:
+            return
+
+        missing = np.isnan(np.column_stack(results))[None]
+        event_window_size = -event_window[0] + event_window[1] + 1
+        (column,), (retrieved,), (expected,) = Single._missing_obs(
+            missing, estimation_size, event_window_size, min_obs
+        )
+        if column >= 0:
+            raise DataMissingError(param_names[column], columns[column], int(retrieved), int(expected))
+
+    @staticmethod
+    def _missing_obs(missing, estimation_size, event_window_size, min_obs):
+        # Check the missing values of the windows of many events (`missing`: events x days x columns).
+        # Return, for each event, the first column with a missing value in its faulty window
+        # (-1 if the event can be computed), the number of valid days and the number expected.
+        estimation, event = missing[:, :estimation_size], missing[:, -event_window_size:]
+        nobs = estimation_size - np.count_nonzero(estimation.any(axis=2), axis=1)
+        event_nobs = event_window_size - np.count_nonzero(event.any(axis=2), axis=1)
+        estimation_failed = nobs < min_obs
+        event_failed = event_nobs < event_window_size
+
+        column = np.where(
+            estimation_failed,
+            np.argmax(estimation.any(axis=1), axis=1),
+            np.where(event_failed, np.argmax(event.any(axis=1), axis=1), -1),
+        )
+        retrieved = np.where(estimation_failed, nobs, event_nobs)
+        expected = np.where(estimation_failed, min_obs, event_window_size)
+        return column, retrieved, expected
+
+    # Models which can be run in batch, with their batch function, the event parameters they need
+    # and the Fama-French factors they use.
+    _BATCH_MODELS = {
+        "market_model": (market_model_batch, ("security_ticker", "market_ticker"), ()),
+        "constant_mean": (constant_mean_batch, ("security_ticker",), ()),
+        "FamaFrench_3factor": (
+            FamaFrench_3factor_batch,
+            ("security_ticker",),
+            ("Mkt-RF", "SMB", "HML", "RF"),
+        ),
+        "FamaFrench_5factor": (
+            FamaFrench_5factor_batch,
+            ("security_ticker",),
+            ("Mkt-RF", "SMB", "HML", "RMW", "CMA", "RF"),
+        ),
+    }
+    # number of regressions whose cumulative cross-products are kept for the "rolling" solver
+    _CROSS_PRODUCTS_CACHE_SIZE = 256
+
+    @classmethod
+    def _batch(
+        cls,
+        model: str,
+        event_list: list,
+        event_window: tuple = (-10, +10),
+        estimation_size: int = 300,
+        buffer_size: int = 30,
+        context: DataContext = None,
+        solver: str = None,
+        keep_model: bool = False,
+        min_obs: int = None,
+    ) -> list:
+        # Run the model method named `model` on all events of `event_list` at once:
+        # windows of all events are gathered in stacked arrays and regressions are solved together,
+        # or, with the "rolling" solver, from the cumulative cross-products of each regression.
+        # Return, in the order of `event_list`, the Single instance or the error of each event,
+        # which are the same as the ones of the model method run event by event.
+        if solver not in (None, "numpy", "rolling"):
+            raise ValueError(
+                f'Unknown solver for batch computation: {solver}. Available solvers: "numpy", "rolling".'
+            )
+        model_func, keys, factor_columns = cls._BATCH_MODELS[model]
+        parameters = cls._parameters if context is None else context
+
+        for event_params in event_list:
+            for key in ("event_date",) + keys:
+                if key not in event_params:
+                    raise TypeError(f"{model}() missing 1 required argument: '{key}'")
+
+        if factor_columns:
+            panel = cls._get_panel(parameters)
+            store, calendar = panel.returns, panel.calendar
+        else:
             try:
-                result = cls._parameters[param_name][column][start:end]
+                store = parameters["returns"]
             except KeyError:
-                raise ColumnMissingError(param_name, column)
+                raise ParameterMissingError("returns")
+            calendar = store.calendar
 
-            # test if all data has been retrieved
-            if len(result) != size:
-                raise DataMissingError(param_name, column, len(result), start + end)
+        n = len(event_list)
+        columns = {key: [event_params[key] for event_params in event_list] for key in keys}
+        dates = [event_params["event_date"] for event_params in event_list]
+        event_i = calendar.indices_of(dates, parameters["max_iteration"])
 
-            results.append(result)
+        size = -event_window[0] + buffer_size + estimation_size + event_window[1] + 1
+        starts = event_i - (-event_window[0] + buffer_size + estimation_size)
+        ends = event_i + event_window[1] + 1
+
+        results = [None] * n
+        missing_factor = next((column for column in factor_columns if column not in panel.factors), None)
+        for i in range(n):
+            missing = next((columns[key][i] for key in keys if columns[key][i] not in store), None)
+            if missing is not None:
+                results[i] = ColumnMissingError("returns", missing)
+            elif missing_factor is not None:
+                results[i] = ColumnMissingError("FamaFrench", missing_factor)
+            elif event_i[i] < 0:
+                param_name = "returns"
+                if factor_columns and store.calendar.index_of(dates[i], parameters["max_iteration"]) is not None:
+                    param_name = "FamaFrench"
+                results[i] = DateMissingError(dates[i], param_name)
+            elif starts[i] < 0 or ends[i] > len(calendar):
+                retrieved = min(ends[i], len(calendar)) - max(starts[i], 0)
+                results[i] = DataMissingError("returns", columns["security_ticker"][i], retrieved, size)
+
+        valid = np.array([result is None for result in results], dtype=bool)
+        if not valid.any():
+            return results
+
+        event_window_size = -event_window[0] + event_window[1] + 1
+        tickers = [
+            tuple(columns[key][i] for key in keys) for i in np.flatnonzero(valid)
+        ]
+        if min_obs is not None:
+            # same checks as `_check_valid_obs`, screening all events at once from the prefix counts
+            # of valid values of each column (security, market or factors): the event window must be
+            # complete, and at least (estimation size - missing values of all columns) days are valid.
+            # Only the windows of the events which fail or may fail are gathered, to check them exactly.
+            securities = [ticker[0] for ticker in tickers]
+            markets = [ticker[1] for ticker in tickers] if "market_ticker" in keys else None
+
+            def valid_counts(first, last):
+                if factor_columns:
+                    counts = [panel.security_valid_counts(securities, first, last)]
+                    counts += [panel.factors.valid_counts(column, first, last) for column in factor_columns]
+                else:
+                    counts = [store.valid_counts(securities, first, last)]
+                    if markets is not None:
+                        counts.append(store.valid_counts(markets, first, last))
+                return np.column_stack(counts)
+
+            estimation = valid_counts(starts[valid], starts[valid] + estimation_size)
+            event = valid_counts(ends[valid] - event_window_size, ends[valid])
+            lowest = estimation_size - np.sum(estimation_size - estimation, axis=1)
+            checked = np.flatnonzero(np.any(event < event_window_size, axis=1) | (lowest < min_obs))
+
+            rows = starts[valid][checked, None] + np.arange(size)
+            if factor_columns:
+                windows = [panel.security_windows([securities[j] for j in checked], rows)]
+                windows += [panel.factors.windows(column, rows) for column in factor_columns]
+            else:
+                windows = [store.windows([securities[j] for j in checked], rows)]
+                if markets is not None:
+                    windows.append(store.windows([markets[j] for j in checked], rows))
+            missing = np.isnan(np.stack(windows, axis=2))
+
+            param_names = ["returns"] + ["FamaFrench" if factor_columns else "returns"] * (missing.shape[2] - 1)
+            positions = np.flatnonzero(valid)
+            failed = np.zeros(len(tickers), dtype=bool)
+            for j, column, retrieved, expected in zip(
+                checked, *cls._missing_obs(missing, estimation_size, event_window_size, min_obs)
+            ):
+                if column >= 0:
+                    failed[j] = True
+                    event_columns = (tickers[j][0],) + (factor_columns or tickers[j][1:])
+                    results[positions[j]] = DataMissingError(
+                        param_names[column], event_columns[column], int(retrieved), int(expected)
+                    )
+            valid[positions[failed]] = False
+            tickers = [ticker for ticker, fail in zip(tickers, failed) if not fail]
+            if not valid.any():
+                return results
+
+        if solver == "rolling":
+            AR, df, var, *models = cls._batch_rolling(
+                model,
+                parameters,
+                tickers,
+                starts[valid],
+                estimation_size,
+                buffer_size,
+                event_window_size,
+                keep_model,
+                min_obs,
+            )
+        else:
+            # events with the same window and regressors (market or factors) share one design matrix,
+            # factorized once for all of them (e.g. many securities with an event on the same date)
+            designs = dict()
+            groups = np.array(
+                [
+                    designs.setdefault((start,) + ticker[1:], len(designs))
+                    for start, ticker in zip(starts[valid], tickers)
+                ],
+                dtype=np.intp,
+            )
+            rows = starts[valid, None] + np.arange(size)
+            design_rows = np.array([design[0] for design in designs], dtype=np.intp)[:, None] + np.arange(size)
+
+            securities = [ticker[0] for ticker in tickers]
+            if factor_columns:
+                model_data = [panel.security_windows(securities, rows)]
+                model_data += [panel.factors.windows(column, design_rows) for column in factor_columns]
+            else:
+                model_data = [store.windows(securities, rows)]
+                if "market_ticker" in keys:
+                    model_data.append(store.windows([design[1] for design in designs], design_rows))
+
+            AR, df, var, *models = model_func(
+                *model_data,
+                estimation_size=estimation_size,
+                event_window_size=event_window_size,
+                keep_model=keep_model,
+                min_obs=min_obs,
+                groups=groups if len(designs) < len(groups) else None,
+            )
 
-        return tuple(results)
+        # AR are often a view on the residuals of the whole windows, which would be kept in memory.
+        # CAR, tstat, etc. are computed by each event when first read (see `Single.CAR`).
+        AR = np.ascontiguousarray(AR)
+        # with min_obs, the degrees of freedom depend on the valid days of each event
+        df = np.asarray(df)
+
+        for j, i in enumerate(np.flatnonzero(valid)):
+            event = cls.__new__(cls)
+            event.event_date = dates[i]
+            event.event_window = event_window
+            event.estimation_size = estimation_size
+            event.buffer_size = buffer_size
+            event.description = cls._describe(model, {key: columns[key][i] for key in keys})
+            event._AR, event.df, event._var_AR = AR[j], int(df if df.ndim == 0 else df[j]), float(var[j])
+            if keep_model:
+                event.model = models[0][j]
+            results[i] = event
+
+        return results
+
+    @classmethod
+    def _batch_rolling(
+        cls,
+        model,
+        parameters,
+        tickers,
+        starts,
+        estimation_size,
+        buffer_size,
+        event_window_size,
+        keep_model,
+        min_obs=None,
+    ):
+        # Batch models solved from the cumulative cross-products of each regression
+        # (security and market, security and factors, or security alone for the constant mean),
+        # built once for all the events of this regression and kept for later calls.
+        size = estimation_size + buffer_size + event_window_size
+        event_rows = starts[:, None] + (size - event_window_size) + np.arange(event_window_size)
+
+        groups = dict()
+        for i, key in enumerate(tickers):
+            groups.setdefault(key, []).append(i)
+
+        AR = np.empty((len(starts), event_window_size))
+        var = np.empty(len(starts))
+        nobs = np.empty(len(starts), dtype=np.int64)
+        models = list()
+        for key, events in groups.items():
+            cross_products = cls._get_cross_products(parameters, model, key)
+            coefficients, var[events], nobs[events], *fitted = cross_products.fit(
+                starts[events], estimation_size, keep_model, min_obs
+            )
+            if keep_model:
+                models.append((events, fitted[0]))
+
+            rows = event_rows[events]
+            AR[events] = (
+                cross_products.y[rows]
+                - coefficients[:, :1]
+                - np.einsum("ewk,ek->ew", cross_products.X[rows], coefficients[:, 1:])
+            )
+
+            if model == "constant_mean":
+                # the variance of the constant mean model is computed over the whole window
+                sums, missing = cross_products.sums(starts[events], size)
+                n = size if min_obs is None else size - missing
+                mean = coefficients[:, 0]
+                residuals_mean = sums[:, 0, 1] / n - mean
+                var[events] = sums[:, 1, 1] / n - 2 * mean * sums[:, 0, 1] / n + mean ** 2 - residuals_mean ** 2
+                if min_obs is None:
+                    var[np.asarray(events)[missing > 0]] = np.nan
+
+        if keep_model:
+            k = coefficients.shape[1]
+            fitted = FittedModels(
+                np.empty((len(starts), k)),
+                np.empty((len(starts), k)),
+                np.empty(len(starts)),
+                var,
+                nobs,
+            )
+            for events, group in models:
+                fitted.params[events], fitted.bse[events] = group.params, group.bse
+                fitted.rsquared[events] = group.rsquared
+            return AR, nobs - 1, var, fitted
+
+        return AR, nobs - 1, var
+
+    @classmethod
+    def _run_batch(
+        cls, model, event_list, event_window, estimation_size, buffer_size, keep_model, context, solver, min_obs
+    ) -> list:
+        # run events through the batch computation from a model method,
+        # raising the error of the first event which cannot be computed
+        events = cls._batch(
+            model, event_list, event_window, estimation_size, buffer_size, context, solver, keep_model, min_obs
+        )
+        for event in events:
+            if not isinstance(event, Single):
+                raise event
+        return events
+
+    @classmethod
+    def _get_cross_products(cls, parameters, model, tickers):
+        # cumulative cross-products of a regression, built once and kept until the data change.
+        # Only the _CROSS_PRODUCTS_CACHE_SIZE regressions used last are kept (each holds a few columns of data).
+        if parameters is cls._parameters:
+            cache = cls._parameters.get("cross_products")
+            if cache is None:
+                cache = cls._parameters.setdefault("cross_products", CrossProductsCache())
+        else:
+            cache = parameters["cross_products"]
+
+        return cache.get(
+            (model,) + tickers,
+            lambda: CrossProducts(*cls._regression_data(parameters, model, tickers)),
+            cls._CROSS_PRODUCTS_CACHE_SIZE,
+        )
+
+    @classmethod
+    def _regression_data(cls, parameters, model, tickers):
+        # regressors and regressand of a batch model over all dates of the data
+        factor_columns = cls._BATCH_MODELS[model][2]
+        if factor_columns:
+            panel = cls._get_panel(parameters)
+            (security,) = panel.security_window(tickers, 0, len(panel.calendar))
+            y = np.asarray(security, dtype=np.float64) - panel.factor_matrix(("RF",))[:, 0]
+            return panel.factor_matrix(factor_columns[:-1]), y
+
+        store = parameters["returns"]
+        if model == "market_model":
+            return store.column(tickers[1]), store.column(tickers[0])
+        return np.empty((len(store), 0)), store.column(tickers[0])
+
+    @staticmethod
+    def _describe(model: str, tickers: dict) -> str:
+        # description of an event study run by a model method
+        if model == "market_model":
+            return (
+                f"Market model estimation, Security: {tickers['security_ticker']}, "
+                f"Market: {tickers['market_ticker']}"
+            )
+        elif model == "constant_mean":
+            return f"Constant mean estimation, Security: {tickers['security_ticker']}"
+        elif model == "FamaFrench_3factor":
+            return f"Fama-French 3-factor model estimation, Security: {tickers['security_ticker']}"
+        elif model == "FamaFrench_5factor":
+            return f"Fama-French 5-factor model estimation, Security: {tickers['security_ticker']}"
 
     @classmethod
     def import_returns(
@@ -302,16 +963,22 @@ class Single:
         *,
         is_price: bool = False,
         log_return: bool = True,  # if False, percentage change will be computed
-        date_format: str = "%Y-%m-%d"
+        date_format: str = "%Y-%m-%d",
+        columns: list = None,
+        cache: bool = False,
+        lazy: bool = False,
+        dtype=np.float64
     ):
         """
-        Import returns from a csv file to the `Single` Class parameters.
+        Import returns from a csv, Parquet or Arrow/Feather file to the `Single` Class parameters.
         Once imported, the returns are shared among all `Single` instances.
         
         Parameters
         ----------
         path : str
-            Path to the returns' csv file
+            Path to the returns' file. Parquet (`.parquet`, `.pq`) and Arrow/Feather 
+            (`.feather`, `.arrow`, `.ipc`) files are read with the `pyarrow` package, 
+            other files are read as csv.
         is_price : bool, optional
             Specify if the file contains price (True) or returns (False), by default False. 
             If set at True, the function will convert prices to returns.
@@ -323,20 +990,269 @@ class Single:
             Format of the date provided in the csv file, by default "%Y-%m-%d".
             Refer to datetime standard library for more details date_format: 
             https://docs.python.org/2/library/datetime.html#strftime-strptime-behavior
+            Not used if the date column of a Parquet or Arrow file is already typed as a date.
+        columns : list, optional
+            Tickers to import, by default None (all tickers of the file are imported).
+            Other columns are not read from the file.
+        cache : bool, optional
+            If true, the imported returns are saved in a binary format (`.npy` files)
+            in a `<path>.cache` directory next to the file, by default False.
+            Later imports of the same file memory-map this cache instead of parsing the file.
+            The cache is automatically rebuilt if the size or the modification time 
+            of the file changes, or if it is imported with different options.
+            If the cache can't be written (e.g. read-only directory), a warning is logged.
+        lazy : bool, optional
+            If true, only the dates and the header are read at import, by default False.
+            Each ticker's returns are then read from the file the first time they are needed,
+            and kept in memory for later use. Each read parses the whole file: the tickers
+            of all events of an aggregate (`Multiple`) are read at once. Useful for very wide
+            files of which only a few tickers are used. Can't be combined with `cache`.
+        dtype : numpy.dtype, optional
+            Type used to store the returns, by default numpy.float64.
+            Set it to numpy.float32 to halve the memory used by the returns.
+            Prices are converted to returns before being rounded to float32, and all
+            models and aggregations still compute in float64 (see note below).
+
+        Note
+        ----
+
+        Storing returns in float32 only rounds the stored inputs (about 7 significant digits).
+        It was checked against float64 storage on the example data (AAPL 10-K releases,
+        daily returns, event window (-2,+10), estimation size of 300 days), for the market model
+        and both Fama-French models (the 5-factor model with simulated RMW and CMA factors).
+        The largest differences observed are about 5e-9 on AR, 3e-10 on CAAR and 1e-7 on T-stat,
+        and a relative difference of 3e-8 on AR's variance, 
+        which is far below the standard errors of the estimates.
+        This check is run by `tests/test_dtype.py`.
+        """
+        if lazy:
+            if cache:
+                raise ValueError("Lazy import of returns can't be combined with cache.")
+
+            returns = _lazy_returns(path, is_price, log_return, date_format, columns, dtype)
+            cls._save_parameter("returns", returns)
+            return
+
+        options = {
+            "is_price": is_price,
+            "log_return": log_return,
+            "date_format": date_format,
+            "columns": None if columns is None else list(columns),
+            "dtype": np.dtype(dtype).name,
+        }
+        returns = load_cache(path, options) if cache else None
+
+        if returns is None:
+            data = sort_by_date(
+                read_table(path, format_date=True, date_format=date_format, columns=columns)
+            )
+            returns = ReturnsStore.from_dict(data)
+
+            if is_price:
+                returns = ReturnsStore(
+                    returns.calendar[1:], #remove the first date
+                    price_to_returns(returns.values, log_return),
+                    returns.columns,
+                )
+
+            if np.dtype(dtype) != returns.values.dtype:
+                returns = returns.astype(dtype)
+
+            if cache:
+                save_cache(returns, path, options)
+
+        cls._save_parameter("returns", returns)
+
+    @classmethod
+    def import_returns_long(
+        cls,
+        path: str,
+        *,
+        ticker_column: str = "ticker",
+        value_column: str = "return",
+        is_price: bool = False,
+        log_return: bool = True,  # if False, percentage change will be computed
+        date_format: str = "%Y-%m-%d",
+        cache: bool = False,
+        dtype=np.float64
+    ):
+        """
+        Import returns from a long-format file (one row per security and date, 
+        e.g. CRSP daily stock file) to the `Single` Class parameters.
+        Once imported, the returns are shared among all `Single` instances.
+
+        The file must contain a `date` column, a ticker column and a returns (or prices) column.
+        Returns are stored in the same way than with `import_returns`, 
+        so that all models can be run on them.
+        
+        Parameters
+        ----------
+        path : str
+            Path to the returns' csv, Parquet or Arrow/Feather file.
+        ticker_column : str, optional
+            Name of the column containing tickers, by default "ticker".
+        value_column : str, optional
+            Name of the column containing returns (or prices), by default "return".
+        is_price : bool, optional
+            Specify if the file contains price (True) or returns (False), by default False. 
+            If set at True, the function will convert prices to returns.
+            Each security's return is computed from its previous available price,
+            days without any row for a security are skipped.
+        log_return : bool, optional
+            Specify if returns must be computed as log returns (True) 
+            or percentage change (False), by default True.
+            Only used if `is_price`is set to True.
+        date_format : str, optional
+            Format of the date provided in the file, by default "%Y-%m-%d".
+            Refer to datetime standard library for more details date_format: 
+            https://docs.python.org/2/library/datetime.html#strftime-strptime-behavior
+        cache : bool, optional
+            If true, the imported returns are cached in a binary format next to the file, 
+            by default False (see `import_returns`).
+        dtype : numpy.dtype, optional
+            Type used to store the returns, by default numpy.float64 (see `import_returns`).
+
+        Example
+        -------
+
+        Import daily prices given in a long format:
+
+        >>> EventStudy.Single.import_returns_long(
+        ...     'prices.csv',
+        ...     ticker_column = 'PERMNO',
+        ...     value_column = 'PRC',
+        ...     is_price = True
+        ... )
+        """
+        options = {
+            "layout": "long",
+            "ticker_column": ticker_column,
+            "value_column": value_column,
+            "is_price": is_price,
+            "log_return": log_return,
+            "date_format": date_format,
+            "dtype": np.dtype(dtype).name,
+        }
+        returns = load_cache(path, options) if cache else None
+
+        if returns is None:
+            data = read_table(
+                path,
+                format_date=True,
+                date_format=date_format,
+                columns=[ticker_column, value_column],
+            )
+            returns = ReturnsStore.from_long(
+                data["date"],
+                data[ticker_column],
+                data[value_column],
+                is_price=is_price,
+                log_return=log_return,
+                dtype=dtype,
+            )
+
+            if cache:
+                save_cache(returns, path, options)
+
+        cls._save_parameter("returns", returns)
+
+    @classmethod
+    def append_returns(
+        cls,
+        path: str,
+        *,
+        is_price: bool = False,
+        log_return: bool = True,  # if False, percentage change will be computed
+        date_format: str = "%Y-%m-%d"
+    ):
+        """
+        Append new trading days to the returns already imported, 
+        without importing again the full history.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file (csv, Parquet or Arrow/Feather) containing the new returns, 
+            in the same format than the file imported with `import_returns`.
+            Its dates must be strictly increasing and after the last date imported.
+            Tickers missing in this file are given NaN returns for the new dates.
+        is_price : bool, optional
+            Specify if the file contains price (True) or returns (False), by default False. 
+            If set at True, the first row of the file must be the prices at the last date 
+            already imported: they are only used to compute the returns of the next date.
+        log_return : bool, optional
+            Specify if returns must be computed as log returns (True) 
+            or percentage change (False), by default True.
+            Only used if `is_price`is set to True.
+        date_format : str, optional
+            Format of the date provided in the file, by default "%Y-%m-%d".
+
+        Example
+        -------
+
+        Refresh returns daily in a long-running process:
+
+        >>> EventStudy.Single.import_returns('returns.csv')
+        >>> EventStudy.Single.append_returns('returns_2020-01-02.csv')
         """
-        data = read_csv(path, format_date=True, date_format=date_format)
+        try:
+            returns = cls._parameters["returns"]
+        except KeyError:
+            raise ParameterMissingError("returns")
+
+        data = sort_by_date(read_table(path, format_date=True, date_format=date_format))
+        new = ReturnsStore.from_dict(data)
 
         if is_price:
-            for key in data.keys():
-                if key != "date":
-                    if log_return:
-                        data[key] = np.diff(np.log(data[key]))
-                    else:
-                        data[key] = np.diff(data[key]) / data[key][1:]
-                else:
-                    data[key] = data[key][1:] #remove the first date
+            # only prices are given: the first row must overlap the returns imported
+            last = returns.calendar[-1]
+            if len(new.calendar) == 0 or new.calendar[0] != last:
+                raise ValueError(
+                    "The first row of appended prices must be the last date already imported "
+                    f"({np.datetime_as_string(last, unit='D')})."
+                )
+            new = ReturnsStore(
+                new.calendar[1:], #remove the first date
+                price_to_returns(new.values, log_return),
+                new.columns,
+            )
+
+        returns.append(new.calendar.dates, {column: new[column] for column in new.columns})
+        cls._reset_derived()
+
+    @classmethod
+    def append_FamaFrench(
+        cls, path: str, *, rescale_factor: bool = True, date_format: str = "%Y%m%d"
+    ):
+        """
+        Append new trading days to the Fama-French factors already imported, 
+        without importing again the full history.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file (csv, Parquet or Arrow/Feather) containing the new factors, 
+            in the same format than the file imported with `import_FamaFrench`.
+            Its dates must be strictly increasing and after the last date imported.
+        rescale_factor : bool, optional
+            Divide by 100 the factor provided, by default True,
+            Fama-French factors are given in percent on Kenneth R. French website.
+        date_format : str, optional
+            Format of the date provided in the file, by default "%Y%m%d".
+        """
+        try:
+            factors = cls._parameters["FamaFrench"]
+        except KeyError:
+            raise ParameterMissingError("FamaFrench")
+
+        data = sort_by_date(read_table(path, format_date=True, date_format=date_format))
+        new = ReturnsStore.from_dict(data)
+
+        if rescale_factor:
+            new.values /= 100
 
-        cls._save_parameter("returns", data)
+        factors.append(new.calendar.dates, {column: new[column] for column in new.columns})
+        cls._reset_derived()
 
     @classmethod
     def import_returns_from_API(cls):
@@ -344,16 +1260,25 @@ class Single:
 
     @classmethod
     def import_FamaFrench(
-        cls, path: str, *, rescale_factor: bool = True, date_format: str = "%Y%m%d"
+        cls,
+        path: str,
+        *,
+        rescale_factor: bool = True,
+        date_format: str = "%Y%m%d",
+        columns: list = None,
+        cache: bool = False,
+        dtype=np.float64
     ):
         """
-        Import Fama-French factors from a csv file to the `Single` Class parameters.
+        Import Fama-French factors from a csv, Parquet or Arrow/Feather file to the `Single` Class parameters.
         Once imported, the factors are shared among all `Single` instances.
         
         Parameters
         ----------
         path : str
-            Path to the factors' csv file
+            Path to the factors' file. Parquet (`.parquet`, `.pq`) and Arrow/Feather 
+            (`.feather`, `.arrow`, `.ipc`) files are read with the `pyarrow` package, 
+            other files are read as csv.
         rescale_factor : bool, optional
             Divide by 100 the factor provided, by default True,
             Fama-French factors are given in percent on Kenneth R. French website.
@@ -361,16 +1286,46 @@ class Single:
             Format of the date provided in the csv file, by default "%Y-%m-%d".
             Refer to datetime standard library for more details date_format: 
             https://docs.python.org/2/library/datetime.html#strftime-strptime-behavior
+            Not used if the date column of a Parquet or Arrow file is already typed as a date.
+        columns : list, optional
+            Factors to import, by default None (all factors of the file are imported).
+            Other columns are not read from the file.
+        cache : bool, optional
+            If true, the imported factors are saved in a binary format (`.npy` files)
+            in a `<path>.cache` directory next to the file, by default False.
+            Later imports of the same file memory-map this cache instead of parsing the file.
+            The cache is automatically rebuilt if the size or the modification time 
+            of the file changes, or if it is imported with different options.
+            If the cache can't be written (e.g. read-only directory), a warning is logged.
+        dtype : numpy.dtype, optional
+            Type used to store the factors, by default numpy.float64.
+            Set it to numpy.float32 to halve the memory used by the factors.
+            Models still compute in float64 (see `import_returns` for the accuracy of float32 storage).
         """
+        options = {
+            "rescale_factor": rescale_factor,
+            "date_format": date_format,
+            "columns": None if columns is None else list(columns),
+            "dtype": np.dtype(dtype).name,
+        }
+        factors = load_cache(path, options) if cache else None
 
-        data = read_csv(path, format_date=True, date_format=date_format)
+        if factors is None:
+            data = sort_by_date(
+                read_table(path, format_date=True, date_format=date_format, columns=columns)
+            )
+            factors = ReturnsStore.from_dict(data)
 
-        if rescale_factor:
-            for key in data.keys():
-                if key != "date":
-                    data[key] = np.array(data[key]) / 100
+            if rescale_factor:
+                factors.values /= 100
 
-        cls._save_parameter("FamaFrench", data)
+            if np.dtype(dtype) != factors.values.dtype:
+                factors = factors.astype(dtype)
+
+            if cache:
+                save_cache(factors, path, options)
+
+        cls._save_parameter("FamaFrench", factors)
 
     @classmethod
     def market_model(
@@ -382,6 +1337,9 @@ class Single:
         estimation_size: int = 300,
         buffer_size: int = 30,
         keep_model: bool = False,
+        context: DataContext = None,
+        solver: str = None,
+        min_obs: int = None,
         **kwargs
     ):
         """
@@ -389,8 +1347,11 @@ class Single:
         
         Parameters
         ----------
-        security_ticker : str
+        security_ticker : str or list
             Ticker of the security (e.g. company stock) as given in the returns imported.
+            With a list of tickers, the event studies of all these securities on the same event date
+            are run at once, the regression of the market or the factors being factorized only once:
+            a list of `Single` is then returned (the "statsmodels" solver is not available).
         market_ticker : str
             Ticker of the market (e.g. market index) as given in the returns imported.
         event_date : np.datetime64
@@ -407,7 +1368,25 @@ class Single:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute the event study will be stored in memory.
-            It will be accessible through the class attributes eventstudy.Single.model, by default False
+            It will be accessible through the class attributes eventstudy.Single.model, as a compact record
+            (`models.FittedModel`) keeping only params, bse, rsquared, var and nobs, by default False.
+            It is no longer a statsmodels' results object: methods such as `summary()` or `conf_int()`
+            are not available (refit the estimation window with statsmodels to get them).
+        context : DataContext, optional
+            Data on which the event study is run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regression: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes the estimation from cumulative cross-products
+            of the security's returns and the regressors, built once and kept for the next events
+            on the same security: faster when many events are run on the same security.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window, by default None.
+            If None, the windows must be complete: a missing value gives NaN results.
+            If specified, days with a missing value are dropped from the estimation window,
+            which must keep at least min_obs valid days, and the event window must be complete
+            (otherwise a DataMissingError is raised).
         **kwargs
             Additional keywords have no effect but might be accepted to avoid freezing 
             if there are not needed parameters specified.
@@ -430,6 +1409,24 @@ class Single:
         ...     event_window = (-5,+20)
         ... )
         """
+        if solver == "rolling" or isinstance(security_ticker, (list, tuple)):
+            securities = security_ticker if isinstance(security_ticker, (list, tuple)) else [security_ticker]
+            events = cls._run_batch(
+                "market_model",
+                [
+                    {"security_ticker": security, "market_ticker": market_ticker, "event_date": event_date}
+                    for security in securities
+                ],
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model,
+                context,
+                solver,
+                min_obs,
+            )
+            return events if isinstance(security_ticker, (list, tuple)) else events[0]
+
         security_returns, market_returns = cls._get_parameters(
             "returns",
             (security_ticker, market_ticker),
@@ -437,6 +1434,8 @@ class Single:
             event_window,
             estimation_size,
             buffer_size,
+            context,
+            min_obs,
         )
         description = f"Market model estimation, Security: {security_ticker}, Market: {market_ticker}"
 
@@ -448,7 +1447,9 @@ class Single:
             buffer_size=buffer_size,
             keep_model=keep_model,
             description= description,
-            event_date=event_date
+            event_date=event_date,
+            solver=solver,
+            min_obs=min_obs
         )
 
     @classmethod
@@ -460,6 +1461,9 @@ class Single:
         estimation_size: int = 300,
         buffer_size: int = 30,
         keep_model: bool = False,
+        context: DataContext = None,
+        solver: str = None,
+        min_obs: int = None,
         **kwargs
     ):
         """
@@ -483,7 +1487,25 @@ class Single:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute the event study will be stored in memory.
-            It will be accessible through the class attributes eventstudy.Single.model, by default False
+            It will be accessible through the class attributes eventstudy.Single.model, as a compact record
+            (`models.FittedModel`) keeping only params, bse, rsquared, var and nobs, by default False.
+            It is no longer a statsmodels' results object: methods such as `summary()` or `conf_int()`
+            are not available (refit the estimation window with statsmodels to get them).
+        context : DataContext, optional
+            Data on which the event study is run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the estimation: "numpy" (direct computation of the mean) or "rolling",
+            by default None: "numpy". There is no regression to run with statsmodels.
+            The "rolling" solver computes the estimation from cumulative sums
+            of the security's returns, built once and kept for the next events
+            on the same security: faster when many events are run on the same security.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window, by default None.
+            If None, the windows must be complete: a missing value gives NaN results.
+            If specified, days with a missing value are dropped from the estimation window,
+            which must keep at least min_obs valid days, and the event window must be complete
+            (otherwise a DataMissingError is raised).
         **kwargs
             Additional keywords have no effect but might be accepted to avoid freezing 
             if there are not needed parameters specified.
@@ -505,6 +1527,23 @@ class Single:
         ...     event_window = (-5,+20)
         ... )
         """
+        if solver == "rolling":
+            return cls._run_batch(
+                "constant_mean",
+                [{"security_ticker": security_ticker, "event_date": event_date}],
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model,
+                context,
+                solver,
+                min_obs,
+            )[0]
+        if solver not in (None, "numpy"):
+            raise ValueError(
+                f'Unknown solver for the constant mean model: {solver}. Available solvers: "numpy", "rolling".'
+            )
+
         # the comma after 'security_returns' unpack the one-value tuple returned by the function _get_parameters
         (security_returns,) = cls._get_parameters(
             "returns",
@@ -513,6 +1552,8 @@ class Single:
             event_window,
             estimation_size,
             buffer_size,
+            context,
+            min_obs,
         )
         
         description = f"Constant mean estimation, Security: {security_ticker}"
@@ -525,7 +1566,8 @@ class Single:
             buffer_size=buffer_size,
             keep_model=keep_model,
             description=description,
-            event_date=event_date 
+            event_date=event_date,
+            min_obs=min_obs
         )
 
     @classmethod
@@ -537,6 +1579,9 @@ class Single:
         estimation_size: int = 300,
         buffer_size: int = 30,
         keep_model: bool = False,
+        context: DataContext = None,
+        solver: str = None,
+        min_obs: int = None,
         **kwargs
     ):
         """
@@ -545,8 +1590,11 @@ class Single:
         
         Parameters
         ----------
-        security_ticker : str
+        security_ticker : str or list
             Ticker of the security (e.g. company stock) as given in the returns imported.
+            With a list of tickers, the event studies of all these securities on the same event date
+            are run at once, the regression of the market or the factors being factorized only once:
+            a list of `Single` is then returned (the "statsmodels" solver is not available).
         event_date : np.datetime64
             Date of the event in numpy.datetime64 format.
         event_window : tuple, optional
@@ -561,7 +1609,25 @@ class Single:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute the event study will be stored in memory.
-            It will be accessible through the class attributes eventstudy.Single.model, by default False
+            It will be accessible through the class attributes eventstudy.Single.model, as a compact record
+            (`models.FittedModel`) keeping only params, bse, rsquared, var and nobs, by default False.
+            It is no longer a statsmodels' results object: methods such as `summary()` or `conf_int()`
+            are not available (refit the estimation window with statsmodels to get them).
+        context : DataContext, optional
+            Data on which the event study is run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regression: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes the estimation from cumulative cross-products
+            of the security's returns and the regressors, built once and kept for the next events
+            on the same security: faster when many events are run on the same security.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window, by default None.
+            If None, the windows must be complete: a missing value gives NaN results.
+            If specified, days with a missing value are dropped from the estimation window,
+            which must keep at least min_obs valid days, and the event window must be complete
+            (otherwise a DataMissingError is raised).
         **kwargs
             Additional keywords have no effect but might be accepted to avoid freezing 
             if there are not needed parameters specified.
@@ -590,21 +1656,30 @@ class Single:
             In: The Journal of Finance 47.2, pp. 427–465.
         """
 
-        (security_returns,) = cls._get_parameters(
-            "returns",
+        if solver == "rolling" or isinstance(security_ticker, (list, tuple)):
+            securities = security_ticker if isinstance(security_ticker, (list, tuple)) else [security_ticker]
+            events = cls._run_batch(
+                "FamaFrench_3factor",
+                [{"security_ticker": security, "event_date": event_date} for security in securities],
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model,
+                context,
+                solver,
+                min_obs,
+            )
+            return events if isinstance(security_ticker, (list, tuple)) else events[0]
+
+        security_returns, Mkt_RF, SMB, HML, RF = cls._get_joint_parameters(
             (security_ticker,),
-            event_date,
-            event_window,
-            estimation_size,
-            buffer_size,
-        )
-        Mkt_RF, SMB, HML, RF = cls._get_parameters(
-            "FamaFrench",
             ("Mkt-RF", "SMB", "HML", "RF"),
             event_date,
             event_window,
             estimation_size,
             buffer_size,
+            context,
+            min_obs,
         )
         
         description = f"Fama-French 3-factor model estimation, Security: {security_ticker}"
@@ -623,7 +1698,9 @@ class Single:
             buffer_size=buffer_size,
             keep_model=keep_model,
             description=description,
-            event_date=event_date
+            event_date=event_date,
+            solver=solver,
+            min_obs=min_obs
         )
 
     @classmethod
@@ -635,6 +1712,9 @@ class Single:
         estimation_size: int = 300,
         buffer_size: int = 30,
         keep_model: bool = False,
+        context: DataContext = None,
+        solver: str = None,
+        min_obs: int = None,
         **kwargs
     ):
         """
@@ -643,8 +1723,11 @@ class Single:
         
         Parameters
         ----------
-        security_ticker : str
+        security_ticker : str or list
             Ticker of the security (e.g. company stock) as given in the returns imported.
+            With a list of tickers, the event studies of all these securities on the same event date
+            are run at once, the regression of the market or the factors being factorized only once:
+            a list of `Single` is then returned (the "statsmodels" solver is not available).
         event_date : np.datetime64
             Date of the event in numpy.datetime64 format.
         event_window : tuple, optional
@@ -659,7 +1742,25 @@ class Single:
             Size of the buffer window [T1,T2], by default 30
         keep_model : bool, optional
             If true the model used to compute the event study will be stored in memory.
-            It will be accessible through the class attributes eventstudy.Single.model, by default False
+            It will be accessible through the class attributes eventstudy.Single.model, as a compact record
+            (`models.FittedModel`) keeping only params, bse, rsquared, var and nobs, by default False.
+            It is no longer a statsmodels' results object: methods such as `summary()` or `conf_int()`
+            are not available (refit the estimation window with statsmodels to get them).
+        context : DataContext, optional
+            Data on which the event study is run, by default None.
+            If None, the data imported in the `Single` Class is used.
+        solver : str, optional
+            Solver of the OLS regression: "numpy" (fast direct least-squares), "statsmodels" or "rolling", 
+            by default None: "numpy".
+            The "rolling" solver computes the estimation from cumulative cross-products
+            of the security's returns and the regressors, built once and kept for the next events
+            on the same security: faster when many events are run on the same security.
+        min_obs : int, optional
+            Minimum number of valid (non-missing) days in the estimation window, by default None.
+            If None, the windows must be complete: a missing value gives NaN results.
+            If specified, days with a missing value are dropped from the estimation window,
+            which must keep at least min_obs valid days, and the event window must be complete
+            (otherwise a DataMissingError is raised).
         **kwargs
             Additional keywords have no effect but might be accepted to avoid freezing 
             if there are not needed parameters specified.
@@ -688,21 +1789,30 @@ class Single:
             In: The Journal of Finance 47.2, pp. 427–465.
         """
 
-        (security_returns,) = cls._get_parameters(
-            "returns",
+        if solver == "rolling" or isinstance(security_ticker, (list, tuple)):
+            securities = security_ticker if isinstance(security_ticker, (list, tuple)) else [security_ticker]
+            events = cls._run_batch(
+                "FamaFrench_5factor",
+                [{"security_ticker": security, "event_date": event_date} for security in securities],
+                event_window,
+                estimation_size,
+                buffer_size,
+                keep_model,
+                context,
+                solver,
+                min_obs,
+            )
+            return events if isinstance(security_ticker, (list, tuple)) else events[0]
+
+        security_returns, Mkt_RF, SMB, HML, RMW, CMA, RF = cls._get_joint_parameters(
             (security_ticker,),
-            event_date,
-            event_window,
-            estimation_size,
-            buffer_size,
-        )
-        Mkt_RF, SMB, HML, RMW, CMA, RF = cls._get_parameters(
-            "FamaFrench",
             ("Mkt-RF", "SMB", "HML", "RMW", "CMA", "RF"),
             event_date,
             event_window,
             estimation_size,
             buffer_size,
+            context,
+            min_obs,
         )
         
         description = f"Fama-French 5-factor model estimation, Security: {security_ticker}"
@@ -723,5 +1833,7 @@ class Single:
             buffer_size=buffer_size,
             keep_model=keep_model,
             description=description,
-            event_date=event_date
+            event_date=event_date,
+            solver=solver,
+            min_obs=min_obs
         )
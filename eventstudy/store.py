@@ -0,0 +1,724 @@
+import numpy as np
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+CACHE_VERSION = 1
+
+
+class Calendar:
+    """
+    Sorted index of the trading dates of an imported dataset.
+
+    The calendar is built once at import time and resolves event dates
+    to row indices by binary search instead of scanning the whole date column.
+
+    Parameters
+    ----------
+    dates : array-like
+        Trading dates in numpy.datetime64 format, sorted in increasing order.
+    """
+
+    def __init__(self, dates):
+        self.dates = np.asarray(dates)
+        if len(self.dates) > 1 and np.any(self.dates[1:] < self.dates[:-1]):
+            raise ValueError("Calendar dates must be sorted in increasing order.")
+        # dates may be allocated with spare capacity, `dates` is a view on the used ones
+        self._buffer = self.dates
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, key):
+        return self.dates[key]
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.dates
+        return self.dates.astype(dtype)
+
+    def index_of(self, date: np.datetime64, max_iteration: int = 4):
+        """
+        Return the index of the first trading day on or after `date`,
+        looking at most `max_iteration` days ahead.
+        Return None if no trading day is found in this range.
+        """
+        index = self.indices_of(np.array([date]), max_iteration)[0]
+        return None if index < 0 else int(index)
+
+    def indices_of(self, dates, max_iteration: int = 4):
+        """
+        Vectorized version of `index_of`: resolve an array of dates in one call.
+        Dates without any trading day in range are given the index -1.
+        """
+        # dates may be given as datetime, datetime.date or pandas.Timestamp
+        dates = np.asarray(dates, dtype=self.dates.dtype)
+        indices = np.searchsorted(self.dates, dates, side="left")
+        found = indices < len(self.dates)
+        limit = dates + np.timedelta64(max_iteration, "D")
+        found[found] = self.dates[indices[found]] <= limit[found]
+        return np.where(found, indices, -1)
+
+    def snapshot(self):
+        """
+        Return a read-only calendar sharing the current dates (no copy).
+        Dates appended later to this calendar are not visible in the snapshot.
+        """
+        snapshot = Calendar.__new__(Calendar)
+        snapshot.dates = _read_only(self.dates)
+        snapshot._buffer = snapshot.dates
+        return snapshot
+
+    def append(self, dates):
+        """
+        Add new trading days at the end of the calendar.
+        Raise a ValueError if dates are not strictly increasing and after the last date.
+        """
+        dates = np.asarray(dates).astype(self.dates.dtype)
+        if np.any(dates[1:] <= dates[:-1]) or (
+            len(dates) > 0 and len(self.dates) > 0 and dates[0] <= self.dates[-1]
+        ):
+            raise ValueError(
+                "Appended dates must be strictly increasing and after the last date imported."
+            )
+
+        self.dates, self._buffer = _extend(self.dates, self._buffer, dates)
+
+
+def _read_only(array):
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _extend(array, buffer, rows, order: str = "F"):
+    # Append rows to an array stored at the beginning of a larger buffer (along the first axis).
+    # The buffer capacity is doubled when full, so that appends cost an amortized constant time per row.
+    n, size = len(array), len(array) + len(rows)
+    if size > len(buffer):
+        shape = (max(size, 2 * n),) + array.shape[1:]
+        buffer = np.empty(shape, dtype=array.dtype, order=order)
+        buffer[:n] = array
+
+    buffer[n:size] = rows
+    return buffer[:size], buffer
+
+
+def _valid_prefix_counts(values):
+    # number of valid (non-NaN) values before each row, with a leading 0: the number of valid values
+    # of any window [start, end) is then the difference of two rows
+    counts = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(~np.isnan(values), out=counts[1:])
+    return counts
+
+
+def price_to_returns(prices, log_return: bool = True):
+    """
+    Convert prices to returns along the first axis (dates).
+    The result has one row less than `prices`.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if log_return:
+        return np.diff(np.log(prices), axis=0)
+    else:
+        return np.diff(prices, axis=0) / prices[1:]
+
+
+def sort_by_date(data: dict, date_column: str = "date"):
+    """
+    Sort all columns of a column-wise dataset by date, only if they are not sorted yet.
+    """
+    dates = np.asarray(data[date_column])
+    if len(dates) > 1 and np.any(dates[1:] < dates[:-1]):
+        order = np.argsort(dates, kind="stable")
+        for key in data.keys():
+            data[key] = np.asarray(data[key])[order]
+
+    return data
+
+
+class ReturnsStore:
+    """
+    Columnar store of imported data (returns or Fama-French factors).
+
+    Values are held in a single contiguous dates × columns float matrix,
+    in column-major order so that the window of any column is a contiguous view.
+    Columns are reached through a column-name to column-index mapping
+    and rows through the store's sorted `Calendar`.
+
+    Parameters
+    ----------
+    dates : array-like or Calendar
+        Trading dates, sorted in increasing order.
+    values : array-like
+        Matrix of values of shape (number of dates, number of columns).
+    columns : list
+        Name of each column (e.g. tickers or factors).
+    dtype : numpy.dtype, optional
+        Type of the stored values, by default numpy.float64.
+        numpy.float32 halves the memory used by the store.
+    """
+
+    def __init__(self, dates, values, columns, dtype=np.float64):
+        self.calendar = dates if isinstance(dates, Calendar) else Calendar(dates)
+        self.values = np.asfortranarray(values, dtype=dtype)
+        # the matrix may be allocated with spare columns, `values` is a view on the used ones
+        self._buffer = self.values
+        self.columns = tuple(columns)
+        self._index = {column: i for i, column in enumerate(self.columns)}
+        # prefix counts of valid values of each column, built when first needed
+        self._valid_counts = dict()
+
+        if self.values.shape != (len(self.calendar), len(self.columns)):
+            raise ValueError(
+                f"Values of shape {self.values.shape} do not match "
+                f"{len(self.calendar)} dates and {len(self.columns)} columns."
+            )
+
+    @classmethod
+    def from_dict(cls, data: dict, date_column: str = "date"):
+        """
+        Build the store from a column-wise dataset (as returned by `utils.read_csv`).
+        """
+        columns = [key for key in data.keys() if key != date_column]
+        values = np.empty((len(data[date_column]), len(columns)), order="F")
+        for i, column in enumerate(columns):
+            values[:, i] = data[column]
+
+        return cls(data[date_column], values, columns)
+
+    @classmethod
+    def from_long(
+        cls,
+        dates,
+        tickers,
+        values,
+        *,
+        is_price: bool = False,
+        log_return: bool = True,
+        dtype=np.float64,
+    ):
+        """
+        Build the store from a long-format panel: one row per security and date.
+
+        Rows are scattered in the dates × tickers matrix in one vectorized pass,
+        dates and tickers without a row being filled with NaN.
+        If `values` are prices, each security's return is computed from its previous
+        available price, so that days without any row for a security are skipped.
+        As for wide data, the first date is then removed.
+        """
+        calendar, date_i = np.unique(np.asarray(dates), return_inverse=True)
+        columns, ticker_i = np.unique(np.asarray(tickers).astype(str), return_inverse=True)
+        date_i, ticker_i = date_i.ravel(), ticker_i.ravel()
+        values = np.asarray(values, dtype=np.float64)
+
+        # rows sorted by security, then by date
+        order = np.lexsort((date_i, ticker_i))
+        same_ticker = ticker_i[order][1:] == ticker_i[order][:-1]
+        if np.any(same_ticker & (date_i[order][1:] == date_i[order][:-1])):
+            raise ValueError("Several rows are given for the same date and ticker.")
+
+        if is_price:
+            returns = np.full(len(values), np.nan)
+            returns[order[1:]] = np.where(
+                same_ticker, price_to_returns(values[order], log_return), np.nan
+            )
+            values = returns
+
+        matrix = np.full((len(calendar), len(columns)), np.nan, dtype=dtype, order="F")
+        matrix[date_i, ticker_i] = values
+
+        if is_price:
+            calendar, matrix = calendar[1:], matrix[1:] #remove the first date
+
+        return cls(calendar, matrix, columns.tolist(), dtype=dtype)
+
+    def __len__(self):
+        return len(self.calendar)
+
+    def astype(self, dtype):
+        """
+        Return a copy of the store with values of type `dtype`.
+        """
+        return ReturnsStore(self.calendar, self.values, self.columns, dtype=dtype)
+
+    def __contains__(self, key):
+        return key == "date" or key in self._index
+
+    def __getitem__(self, key):
+        if key == "date":
+            return self.calendar
+        return self.column(key)
+
+    def keys(self):
+        return ("date",) + self.columns
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def column(self, column: str):
+        """
+        Return a view on all values of `column`. Raise a KeyError if the column is missing.
+        """
+        i = self._index[column]
+        return self.values[:, i]
+
+    def window(self, columns: tuple, start: int, end: int) -> tuple:
+        """
+        Return, for each column, a view on its values between rows `start` and `end`.
+        Raise a KeyError if one of the columns is missing.
+        """
+        # indices are resolved before reading the matrix, as a lazy store may add columns meanwhile
+        indices = [self._index[column] for column in columns]
+        values = self.values
+        start = max(start, 0)
+        return tuple(values[start:end, i] for i in indices)
+
+    def windows(self, columns, rows):
+        """
+        Gather the windows of many events at once.
+
+        Parameters
+        ----------
+        columns : str or array-like
+            Column shared by all events, or one column per event.
+        rows : numpy.ndarray
+            Rows of each event's window, of shape (number of events, window size).
+            All rows must be valid.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values of shape (number of events, window size).
+        """
+        if isinstance(columns, str):
+            i = self._index[columns]
+            return self.values[:, i][rows]
+
+        indices = np.array([self._index[column] for column in columns], dtype=np.intp)
+        return self.values[rows, indices[:, None]]
+
+    def valid_counts(self, columns, starts, ends):
+        """
+        Count the valid (non-NaN) values in the windows of many events at once,
+        from prefix counts kept for each column: each count costs O(1), whatever the window size.
+
+        Parameters
+        ----------
+        columns : str or array-like
+            Column shared by all events, or one column per event.
+        starts, ends : numpy.ndarray
+            First row and row after the last one of each event's window.
+            All rows must be valid.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of valid values of each event's window.
+        """
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if isinstance(columns, str):
+            counts = self._column_counts(columns)
+            return counts[ends] - counts[starts]
+
+        unique, inverse = np.unique(np.asarray(columns, dtype=object), return_inverse=True)
+        counts = np.column_stack([self._column_counts(column) for column in unique])
+        inverse = inverse.ravel()
+        return counts[ends, inverse] - counts[starts, inverse]
+
+    def _column_counts(self, column: str):
+        try:
+            return self._valid_counts[column]
+        except KeyError:
+            counts = _valid_prefix_counts(self.column(column))
+            self._valid_counts[column] = counts
+            return counts
+
+    def snapshot(self):
+        """
+        Return a read-only store sharing the current data (no copy).
+        Dates appended later to this store are not visible in the snapshot,
+        so that the snapshot can be shared freely, for example among threads.
+        """
+        snapshot = ReturnsStore.__new__(ReturnsStore)
+        snapshot.calendar = self.calendar.snapshot()
+        snapshot.values = _read_only(self.values)
+        snapshot._buffer = snapshot.values
+        snapshot.columns = self.columns
+        snapshot._index = dict(self._index)
+        # prefix counts are never modified in place, they can be shared
+        snapshot._valid_counts = dict(self._valid_counts)
+        return snapshot
+
+    def append(self, dates, values):
+        """
+        Add new trading days at the end of the store.
+
+        Parameters
+        ----------
+        dates : array-like
+            New dates, strictly increasing and after the last date of the store.
+        values : array-like or dict
+            Either a matrix of shape (number of new dates, number of columns),
+            with columns in the store's order, or a dictionary of values by column name
+            (columns not given are filled with NaN).
+        """
+        k = len(self.columns)
+        if isinstance(values, dict):
+            unknown = [column for column in values.keys() if column not in self._index]
+            if unknown:
+                raise ValueError(f"Unknown columns can't be appended: {', '.join(map(str, unknown))}.")
+
+            rows = np.full((len(dates), k), np.nan)
+            for column, column_values in values.items():
+                rows[:, self._index[column]] = column_values
+        else:
+            rows = np.asarray(values, dtype=np.float64).reshape(len(dates), k)
+
+        # the calendar checks the new dates before any data is modified
+        self.calendar.append(dates)
+        self.values, self._buffer = _extend(self.values, self._buffer, rows)
+
+        # prefix counts are extended from their last count, a new array leaves snapshots unchanged
+        for column, counts in self._valid_counts.items():
+            new_counts = _valid_prefix_counts(rows[:, self._index[column]])
+            self._valid_counts[column] = np.concatenate((counts, counts[-1] + new_counts[1:]))
+
+    def _add_columns(self, columns: list, values):
+        # Append columns to the matrix. Spare columns are allocated (doubling the capacity)
+        # so that adding columns one at a time only copies the matrix a logarithmic number of times.
+        n, k = self.values.shape
+        size = k + len(columns)
+        if size > self._buffer.shape[1]:
+            buffer = np.empty(
+                (self._buffer.shape[0], max(size, 2 * k)), dtype=self.values.dtype, order="F"
+            )
+            buffer[:n, :k] = self.values
+            self._buffer = buffer
+
+        self._buffer[:n, k:size] = values
+        self.values = self._buffer[:n, :size]
+        self.columns += tuple(columns)
+        for i, column in enumerate(columns, k):
+            self._index[column] = i
+
+    def save(self, directory: str):
+        """
+        Save the store in `directory` as binary `.npy` files (dates and values)
+        plus a json manifest describing the columns.
+        """
+        os.makedirs(directory, exist_ok=True)
+        _write_npy(os.path.join(directory, "dates.npy"), self.calendar.dates)
+        _write_npy(os.path.join(directory, "values.npy"), self.values)
+        _write_json(os.path.join(directory, "columns.json"), list(self.columns))
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: str = "r"):
+        """
+        Load a store saved with `ReturnsStore.save`.
+        By default, files are memory-mapped (read-only) instead of being read in memory.
+        """
+        with open(os.path.join(directory, "columns.json"), "r") as f:
+            columns = json.load(f)
+
+        dates = np.load(os.path.join(directory, "dates.npy"), mmap_mode=mmap_mode)
+        values = np.load(os.path.join(directory, "values.npy"), mmap_mode=mmap_mode)
+        return cls(dates, values, columns, dtype=values.dtype)
+
+
+class LazyReturnsStore(ReturnsStore):
+    """
+    Store whose columns are read from the source file the first time they are used.
+
+    Only the dates (and the list of available columns) are read up front.
+    Loaded columns are kept in the store's matrix, so each column is read only once.
+
+    Parameters
+    ----------
+    dates : array-like or Calendar
+        Trading dates, sorted in increasing order.
+    available_columns : list
+        Name of all columns which can be loaded from the source.
+    load_columns
+        Function taking a list of column names and returning their values, as a matrix
+        of shape (number of dates, number of columns) aligned on `dates`.
+    dtype : numpy.dtype, optional
+        Type of the stored values, by default numpy.float64.
+    """
+
+    def __init__(self, dates, available_columns, load_columns, dtype=np.float64):
+        super().__init__(dates, np.empty((len(dates), 0)), [], dtype=dtype)
+        self.available_columns = tuple(available_columns)
+        self._available = set(self.available_columns)
+        self._load_columns = load_columns
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key == "date" or key in self._available
+
+    def keys(self):
+        return ("date",) + self.available_columns
+
+    def load(self, columns: list):
+        """
+        Load all `columns` not loaded yet, reading the source only once.
+        Raise a KeyError if one of the columns is not available in the source.
+        """
+        if all(column in self._index for column in columns):
+            return
+
+        # columns might be requested by several threads at the same time
+        with self._lock:
+            missing = list(dict.fromkeys(c for c in columns if c not in self._index))
+            for column in missing:
+                if column not in self._available:
+                    raise KeyError(column)
+
+            if missing:
+                self._add_columns(missing, self._load_columns(missing))
+
+    def column(self, column: str):
+        self.load([column])
+        return super().column(column)
+
+    def window(self, columns: tuple, start: int, end: int) -> tuple:
+        self.load(columns)
+        return super().window(columns, start, end)
+
+    def windows(self, columns, rows):
+        self.load([columns] if isinstance(columns, str) else set(columns))
+        return super().windows(columns, rows)
+
+    def valid_counts(self, columns, starts, ends):
+        self.load([columns] if isinstance(columns, str) else set(columns))
+        return super().valid_counts(columns, starts, ends)
+
+    def snapshot(self):
+        # dates can't be appended to a lazy store, loading columns doesn't change its content
+        return self
+
+    def __getstate__(self):
+        # the lock can't be pickled, the copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def save(self, directory: str):
+        # only the loaded columns are in memory
+        raise TypeError("A lazy store can't be saved, load it entirely first.")
+
+    def append(self, dates, values):
+        # the store must stay aligned with its source file
+        raise TypeError("New dates can't be appended to a lazy store.")
+
+
+class AlignedStore:
+    """
+    Returns and Fama-French factors aligned on their common trading dates (inner join).
+
+    The factors are gathered once on the common calendar, so that a single date
+    resolution gives the window of both the security returns and the factors.
+    Returns are not copied: if the common dates are contiguous in the returns' calendar
+    (the usual case), security windows are views on the returns' matrix.
+
+    Parameters
+    ----------
+    returns : ReturnsStore
+        Returns of the securities.
+    factors : ReturnsStore
+        Fama-French factors.
+    """
+
+    def __init__(self, returns, factors):
+        dates, returns_rows, factors_rows = np.intersect1d(
+            returns.calendar.dates,
+            factors.calendar.dates,
+            assume_unique=True,
+            return_indices=True,
+        )
+        self.calendar = Calendar(dates)
+        self.returns = returns
+        self.factors = ReturnsStore(
+            self.calendar, factors.values[factors_rows], factors.columns, dtype=factors.values.dtype
+        )
+
+        # dates of the returns without factors
+        missing = np.ones(len(returns.calendar), dtype=bool)
+        missing[returns_rows] = False
+        self.missing_dates = returns.calendar.dates[missing]
+
+        if len(returns_rows) > 0 and returns_rows[-1] - returns_rows[0] + 1 == len(returns_rows):
+            self._rows = slice(int(returns_rows[0]), int(returns_rows[-1]) + 1)
+        else:
+            self._rows = returns_rows
+        # prefix counts of the securities on the common calendar, if it is not contiguous in the returns
+        self._valid_counts = dict()
+        # float64 matrices of factors, built when first needed
+        self._factor_matrices = dict()
+
+    def security_window(self, columns: tuple, start: int, end: int) -> tuple:
+        """
+        Return, for each security, its returns between rows `start` and `end` of the common calendar.
+        Raise a KeyError if one of the securities is missing.
+        """
+        start, end = max(start, 0), min(end, len(self.calendar))
+        if isinstance(self._rows, slice):
+            first = self._rows.start
+            return self.returns.window(columns, first + start, first + max(end, start))
+
+        rows = self._rows[start:end]
+        return tuple(self.returns.column(column)[rows] for column in columns)
+
+    def security_windows(self, columns, rows):
+        """
+        Gather the returns of many events at once, `rows` being rows of the common calendar
+        (see `ReturnsStore.windows`).
+        """
+        if isinstance(self._rows, slice):
+            return self.returns.windows(columns, rows + self._rows.start)
+        return self.returns.windows(columns, self._rows[rows])
+
+    def security_valid_counts(self, columns, starts, ends):
+        """
+        Count the valid returns in the windows of many events at once, `starts` and `ends`
+        being rows of the common calendar (see `ReturnsStore.valid_counts`).
+        """
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if isinstance(self._rows, slice):
+            first = self._rows.start
+            return self.returns.valid_counts(columns, starts + first, ends + first)
+
+        if isinstance(columns, str):
+            columns = [columns] * len(starts)
+        unique, inverse = np.unique(np.asarray(columns, dtype=object), return_inverse=True)
+        for column in unique:
+            if column not in self._valid_counts:
+                self._valid_counts[column] = _valid_prefix_counts(self.returns.column(column)[self._rows])
+        counts = np.column_stack([self._valid_counts[column] for column in unique])
+        inverse = inverse.ravel()
+        return counts[ends, inverse] - counts[starts, inverse]
+
+    def factor_matrix(self, columns: tuple):
+        """
+        Return the factors `columns` over the whole common calendar, as a float64 matrix
+        of shape (dates, columns). The matrix is built once and shared by all later calls.
+        """
+        columns = tuple(columns)
+        if columns not in self._factor_matrices:
+            matrix = np.column_stack([np.asarray(self.factors.column(column), dtype=np.float64) for column in columns])
+            self._factor_matrices[columns] = _read_only(matrix)
+        return self._factor_matrices[columns]
+
+    def snapshot(self):
+        snapshot = AlignedStore.__new__(AlignedStore)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot.calendar = self.calendar.snapshot()
+        snapshot.returns = self.returns.snapshot()
+        snapshot.factors = self.factors.snapshot()
+        return snapshot
+
+
+def align(returns, factors):
+    """
+    Align returns and Fama-French factors on their common trading dates.
+    Dates of the returns without factors are reported once, in a warning.
+    """
+    panel = AlignedStore(returns, factors)
+
+    nb = len(panel.missing_dates)
+    if nb > 0:
+        logging.warning(
+            f"{nb} dates of the returns have no Fama-French factors "
+            f"(from {np.datetime_as_string(panel.missing_dates[0], unit='D')}"
+            f" to {np.datetime_as_string(panel.missing_dates[-1], unit='D')})."
+            "\nThese dates are ignored by Fama-French models."
+        )
+
+    return panel
+
+
+def _replace(path: str, write, mode: str = "wb"):
+    # write in a temporary file then replace: a file memory-mapped by a previous import
+    # is never truncated in place. The temporary file is unique, so that processes
+    # saving the same file at the same time don't write in the same temporary file.
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files readable by their owner only
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_npy(path: str, array):
+    _replace(path, lambda f: np.save(f, array))
+
+
+def _write_json(path: str, content):
+    _replace(path, lambda f: json.dump(content, f), mode="w")
+
+
+def cache_directory(path: str) -> str:
+    return str(path) + ".cache"
+
+
+def _source_signature(path: str, options: dict) -> dict:
+    stat = os.stat(path)
+    return {
+        "version": CACHE_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "options": options,
+    }
+
+
+def load_cache(path: str, options: dict):
+    """
+    Return the store cached next to the source file `path`, memory-mapped.
+    Return None if there is no cache or if it is outdated: the source file's size
+    or modification time changed, or it was imported with different `options`.
+    """
+    directory = cache_directory(path)
+    try:
+        with open(os.path.join(directory, "manifest.json"), "r") as f:
+            manifest = json.load(f)
+        if manifest != _source_signature(path, options):
+            return None
+        return ReturnsStore.load(directory)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cache(store: ReturnsStore, path: str, options: dict):
+    """
+    Cache `store` next to the source file `path`, in binary format.
+    The manifest is written last, so an interrupted save never leaves a valid cache.
+    If the cache can't be written (e.g. in a read-only directory), a warning is logged
+    and the store is simply not cached.
+    """
+    directory = cache_directory(path)
+    manifest_path = os.path.join(directory, "manifest.json")
+    try:
+        try:
+            os.remove(manifest_path)
+        except FileNotFoundError:
+            pass
+
+        store.save(directory)
+        _write_json(manifest_path, _source_signature(path, options))
+    except OSError as error:
+        logging.warning(f"The imported data can't be cached in {directory} ({error}).")
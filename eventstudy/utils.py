@@ -1,18 +1,21 @@
 import numpy as np
-import pandas as pd
-from scipy.stats import t
 
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
+from .store import Calendar
 
 from collections import defaultdict
 from csv import DictReader
+import datetime
+import os
 
 # All model must returns : (residuals: list, df: int, var: float)
 
+# pandas, scipy and matplotlib are only imported by the functions using them,
+# so that importing eventstudy stays fast.
+
 # TODO: sortir la computation des résiduals des fonctions de modélisation. Juste leur faire calculer les prédictions. Sortir aussi windowsize estimation size et tout le reste, et aussi le secReturns qui doit être rataché à l'event study pas la fonction de modélisation.
 
 def to_table(columns, asterisks_dict=None, decimals=None, index_start=0):
+    import pandas as pd
 
     if decimals:
         if type(decimals) is int:
@@ -48,6 +51,9 @@ def add_asterisks(pvalue, value=None):
 
 
 def plot(time, CAR, *, AR=None, CI=False, var=None, df=None, confidence=0.90):
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+    from scipy.stats import t
 
     fig, ax = plt.subplots()
     ax.plot(time, CAR)
@@ -72,19 +78,22 @@ def plot(time, CAR, *, AR=None, CI=False, var=None, df=None, confidence=0.90):
     return fig
 
 
-def get_index_of_date(data, date: np.datetime64, n: int = 4):
-    # assume the date exist and there is only one of it in the dataset
-    # assume date are in index
+def t_cdf(x, df):
+    # cumulative distribution function of Student's t distribution, as scipy.stats.t.cdf,
+    # through scipy.special which is much faster to import than scipy.stats
+    from scipy.special import stdtr
+
+    return stdtr(df, x)
 
-    for i in range(n + 1):
-        index = np.where(data == date)[0]
-        if len(index) > 0:
-            return index[0]
-        else:
-            date = date + np.timedelta64(1, "D")
+
+def get_index_of_date(data, date: np.datetime64, n: int = 4):
+    # data must be sorted by date (it is the case of any imported parameter).
+    # Prefer passing directly the parameter's Calendar to avoid rebuilding it.
+    if not isinstance(data, Calendar):
+        data = Calendar(data)
 
     # return None if there is no row corresponding to this date or n days after.
-    return None
+    return data.index_of(date, n)
 
 
 def OLD_read_csv(path):
@@ -98,18 +107,80 @@ def OLD_read_csv(path):
     return data
 
 
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".feather", ".arrow", ".ipc")
+
+
 def read_csv(
     path,
     format_date: bool = False,
     date_format: str = "%Y-%m-%d",
     date_column: str = "date",
     row_wise: bool = False,
+    columns: list = None,
 ):
+    import pandas as pd
+
+    # columns: only read these columns (and the date column)
+    usecols = None if columns is None else [date_column, *columns]
+    df = pd.read_csv(path, skipinitialspace=True, usecols=usecols)
+
+    return frame_to_data(df, format_date, date_format, date_column, row_wise)
+
 
-    df = pd.read_csv(path, skipinitialspace=True)
+def read_table(
+    path,
+    format_date: bool = False,
+    date_format: str = "%Y-%m-%d",
+    date_column: str = "date",
+    row_wise: bool = False,
+    columns: list = None,
+):
+    # Read a csv, Parquet or Arrow/Feather file, based on the file extension.
+    # Parquet and Arrow files are read through pandas and need the `pyarrow` package.
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension not in PARQUET_EXTENSIONS + ARROW_EXTENSIONS:
+        return read_csv(path, format_date, date_format, date_column, row_wise, columns)
+
+    import pandas as pd
+
+    usecols = None if columns is None else [date_column, *columns]
+    if extension in PARQUET_EXTENSIONS:
+        df = pd.read_parquet(path, columns=usecols)
+    else:
+        df = pd.read_feather(path, columns=usecols)
+
+    return frame_to_data(df, format_date, date_format, date_column, row_wise)
+
+
+def read_header(path):
+    # Return the name of the columns of a csv, Parquet or Arrow/Feather file, without reading its data.
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in PARQUET_EXTENSIONS:
+        import pyarrow.parquet
+
+        return list(pyarrow.parquet.read_schema(path).names)
+    elif extension in ARROW_EXTENSIONS:
+        import pyarrow.ipc
+
+        with pyarrow.ipc.open_file(path) as reader:
+            return list(reader.schema.names)
+
+    import pandas as pd
+
+    return list(pd.read_csv(path, skipinitialspace=True, nrows=0).columns)
+
+
+def frame_to_data(
+    df,
+    format_date: bool = False,
+    date_format: str = "%Y-%m-%d",
+    date_column: str = "date",
+    row_wise: bool = False,
+):
 
     if format_date:
-        df[date_column] = pd.to_datetime(df[date_column], format=date_format)
+        df[date_column] = to_datetime(df[date_column], date_format)
 
     if row_wise:
         data = list()
@@ -124,3 +195,15 @@ def read_csv(
             data[col] = df[col].values
 
     return data
+
+
+def to_datetime(dates, date_format: str = "%Y-%m-%d"):
+    import pandas as pd
+
+    # typed date columns (e.g. from Parquet or Arrow files) are not parsed again
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    if len(dates) > 0 and isinstance(dates.iloc[0], datetime.date):
+        return pd.to_datetime(dates)
+
+    return pd.to_datetime(dates, format=date_format)
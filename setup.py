@@ -20,6 +20,7 @@ setuptools.setup(
     url="https://github.com/LemaireJean-Baptiste/eventstudy",
     packages=setuptools.find_packages(),
     install_requires=get_dependencies(),
+    extras_require={"parquet": ["pyarrow"], "parallel": ["threadpoolctl"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
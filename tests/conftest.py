@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+import eventstudy as es
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def example_data():
+    es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    es.Single.import_FamaFrench(os.path.join(EXAMPLE, "famafrench.csv"))
@@ -0,0 +1,147 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+import eventstudy as es
+from eventstudy.aggregate import AggregateState
+
+from test_multiple import STATISTICS, make_events
+
+QUANTILES = ("Quantile 25%", "Quantile 50%", "Quantile 75%")
+MOMENTS = ("Mean", "Variance", "Skewness", "Kurtosis", "Min", "Max")
+
+
+def assert_same_statistics(agg, expected):
+    for name in STATISTICS:
+        np.testing.assert_allclose(getattr(agg, name), getattr(expected, name), rtol=1e-11, atol=1e-18, err_msg=name)
+    assert agg.df == expected.df
+    for key in MOMENTS:
+        np.testing.assert_allclose(agg.CAR_dist[key], expected.CAR_dist[key], rtol=1e-9, atol=1e-15, err_msg=key)
+
+
+def assert_close_quantiles(quantiles, CAR):
+    # each CAR is replaced by the middle of its bucket in the sketch, of relative width below 1/64:
+    # quantiles are within 2^-7 of the CAR they are interpolated from (and CAR below 2^-30 count as zeros)
+    for key, q in zip(QUANTILES, (0.25, 0.5, 0.75)):
+        expected = np.quantile(CAR, q, axis=0)
+        missing = np.isnan(expected)
+        np.testing.assert_array_equal(np.isnan(quantiles[key]), missing)
+        bound = np.maximum(
+            np.abs(np.quantile(CAR, q, axis=0, method="lower")), np.abs(np.quantile(CAR, q, axis=0, method="higher"))
+        )
+        error = np.abs(quantiles[key] - expected)
+        assert np.all(error[~missing] <= bound[~missing] * 2 ** -7 + 2 ** -30), key
+
+
+@pytest.mark.parametrize(
+    "model, options",
+    [
+        (es.Single.market_model, {}),
+        (es.Single.market_model, {"batch": True}),
+        (es.Single.constant_mean, {"min_obs": 200}),
+        (es.Single.FamaFrench_3factor, {}),
+    ],
+)
+def test_stream_matches_list(model, options):
+    events = make_events(300, seed=3)
+    expected = es.Multiple.from_list([dict(event) for event in events], model, **options)
+    agg = es.Multiple.from_stream((dict(event) for event in events), model, chunk_size=37, **options)
+    assert agg.sample is None and agg.AR is None
+    assert len(agg.errors) == len(expected.errors)
+    assert_same_statistics(agg, expected)
+    assert_close_quantiles(agg.CAR_dist, np.cumsum(expected.AR, axis=1))
+
+    # stream of event studies already computed
+    agg = es.Multiple.from_stream(iter(expected.sample), chunk_size=50)
+    assert agg.errors == []
+    assert_same_statistics(agg, expected)
+
+    # quantiles of events without missing values, against the exact ones
+    complete = [event for event in expected.sample if not np.isnan(event.AR).any()]
+    assert len(complete) > 100
+    CAR = np.cumsum([event.AR for event in complete], axis=1)
+    agg = es.Multiple.from_stream(iter(complete), chunk_size=50)
+    assert_close_quantiles(agg.CAR_dist, CAR)
+
+
+def test_stream_empty():
+    with pytest.raises(ValueError):
+        es.Multiple.from_stream(iter([]))
+
+
+def test_sketch_quantiles():
+    rng = np.random.default_rng(0)
+    AR = rng.standard_normal((5000, 21)) * 0.02
+    state = AggregateState((-10, 10))
+    state.add(AR, np.full(5000, 1e-4), np.full(5000, 250))
+    CAR = np.cumsum(AR, axis=1)
+    assert_close_quantiles(state.CAR_dist, CAR)
+
+    # sums are exact: the state doesn't depend on the order in which events are added
+    shuffled = AggregateState((-10, 10))
+    for part in np.array_split(rng.permutation(5000), 7):
+        shuffled.add(AR[part], np.full(len(part), 1e-4), np.full(len(part), 250))
+    for key, values in state.CAR_dist.items():
+        np.testing.assert_array_equal(shuffled.CAR_dist[key], values)
+    np.testing.assert_array_equal(shuffled.AAR, state.AAR)
+
+
+def assert_identical(agg, expected):
+    for name in STATISTICS:
+        np.testing.assert_array_equal(getattr(agg, name), getattr(expected, name), err_msg=name)
+    assert agg.df == expected.df
+    for key, values in expected.CAR_dist.items():
+        np.testing.assert_array_equal(agg.CAR_dist[key], values, err_msg=key)
+
+
+def test_merge_shards(tmp_path):
+    events = make_events(400, seed=4)
+    expected = es.Multiple.from_stream((dict(event) for event in events), es.Single.market_model)
+    shards = [
+        es.Multiple.from_stream((dict(events[i]) for i in shard), es.Single.market_model, chunk_size=29)
+        for shard in np.array_split(np.arange(len(events)), 5)
+    ]
+    # states sent as JSON, e.g. by other processes
+    states = [AggregateState.from_dict(json.loads(json.dumps(shard.state.to_dict()))) for shard in shards]
+    assert_identical(es.Multiple.merge(states), expected)
+    assert_identical(es.Multiple.merge(shards[::-1]), expected)
+    assert len(es.Multiple.merge(shards).errors) == len(expected.errors)
+
+    # merging is associative and commutative
+    left = states[0].copy().merge(states[1]).merge(states[2])
+    right = states[2].copy().merge(states[0].copy().merge(states[1]))
+    assert json.dumps(left.to_dict()) == json.dumps(right.to_dict())
+
+    path = str(tmp_path / "state.json")
+    expected.state.save(path)
+    assert_identical(es.Multiple.from_state(AggregateState.load(path)), expected)
+
+
+def test_state_round_trip():
+    events = make_events(200, seed=5)
+    agg = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model)
+    state = agg.state
+    data = json.loads(json.dumps(state.to_dict()))
+    copy = AggregateState.from_dict(data)
+    # NaN extrema (of events with missing values) compare equal once dumped
+    assert json.dumps(copy.to_dict()) == json.dumps(state.to_dict())
+    assert json.dumps(pickle.loads(pickle.dumps(state)).to_dict()) == json.dumps(state.to_dict())
+    assert_identical(es.Multiple.from_state(copy), es.Multiple.from_state(state))
+
+    data["sketch_bits"] += 1
+    with pytest.raises(ValueError):
+        AggregateState.from_dict(data)
+
+
+def test_merge_event_windows():
+    with pytest.raises(ValueError):
+        AggregateState((-10, 10)).merge(AggregateState((-5, 5)))
+    with pytest.raises(ValueError):
+        es.Multiple.merge([AggregateState((0, 2)), AggregateState((0, 3))])
+    events = make_events(20, seed=6)
+    short = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model, event_window=(-5, 5))
+    long = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model)
+    with pytest.raises(ValueError):
+        es.Multiple.merge([short, long])
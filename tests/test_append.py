@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import eventstudy as es
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+@pytest.fixture
+def restore():
+    yield
+    es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    es.Single.import_FamaFrench(os.path.join(EXAMPLE, "famafrench.csv"))
+
+
+@pytest.fixture(scope="module")
+def prices(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2010-01-04", periods=600)
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (600, 3)), axis=0)), columns=["AAA", "BBB", "MKT"]
+    )
+    prices.insert(0, "date", dates.strftime("%Y-%m-%d"))
+    return prices, tmp_path_factory.mktemp("prices")
+
+
+def write(frame, directory, name):
+    path = str(directory / name)
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_append_prices(prices, restore):
+    frame, directory = prices
+    es.Single.import_returns(write(frame, directory, "all.csv"), is_price=True)
+    full = es.Single.get_context()["returns"]
+
+    es.Single.import_returns(write(frame[:400], directory, "head.csv"), is_price=True)
+    # the first row of the appended prices is the last date imported
+    es.Single.append_returns(write(frame[399:], directory, "tail.csv"), is_price=True)
+    returns = es.Single.get_context()["returns"]
+    assert len(returns.calendar) == len(full.calendar) == 599
+    np.testing.assert_array_equal(returns.calendar.dates, full.calendar.dates)
+    np.testing.assert_allclose(returns.values, full.values, rtol=1e-12)
+
+
+def test_append_prices_without_overlap(prices, restore):
+    frame, directory = prices
+    es.Single.import_returns(write(frame[:400], directory, "head.csv"), is_price=True)
+    with pytest.raises(ValueError):
+        es.Single.append_returns(write(frame[400:], directory, "tail.csv"), is_price=True)
+    assert len(es.Single.get_context()["returns"].calendar) == 399
+
+
+@pytest.mark.parametrize("rows", [slice(390, 420), slice(395, 396)])
+def test_append_dates_not_after_last(prices, restore, rows):
+    frame, directory = prices
+    es.Single.import_returns(write(frame[:400], directory, "head.csv"))
+    with pytest.raises(ValueError):
+        es.Single.append_returns(write(frame[rows], directory, "tail.csv"))
+    returns = es.Single.get_context()["returns"]
+    assert len(returns.calendar) == 400
+
+
+def test_append_duplicate_dates(prices, restore):
+    frame, directory = prices
+    es.Single.import_returns(write(frame[:400], directory, "head.csv"))
+    with pytest.raises(ValueError):
+        es.Single.append_returns(write(pd.concat([frame[400:405], frame[404:410]]), directory, "tail.csv"))
+
+
+def test_append_capacity(prices, restore):
+    # many small appends: the store grows beyond its spare capacity several times
+    frame, directory = prices
+    es.Single.import_returns(write(frame, directory, "all.csv"))
+    full = es.Single.get_context()
+
+    es.Single.import_returns(write(frame[:10], directory, "head.csv"))
+    for start in range(10, 600, 7):
+        es.Single.append_returns(write(frame[start : start + 7], directory, "tail.csv"))
+        # events on the new dates see the appended returns
+        date = np.datetime64(frame["date"].iloc[start])
+        event = es.Single.market_model("AAA", "MKT", date, (-2, 0), 5, 1)
+        expected = es.Single.market_model("AAA", "MKT", date, (-2, 0), 5, 1, context=full)
+        np.testing.assert_array_equal(event.AR, expected.AR)
+
+    returns = es.Single.get_context()["returns"]
+    np.testing.assert_array_equal(returns.calendar.dates, full["returns"].calendar.dates)
+    np.testing.assert_array_equal(returns.values, full["returns"].values)
+
+
+def test_append_FamaFrench(tmp_path, restore):
+    frame = pd.read_csv(os.path.join(EXAMPLE, "famafrench.csv"), skipinitialspace=True, dtype={"date": str})
+    es.Single.import_FamaFrench(os.path.join(EXAMPLE, "famafrench.csv"))
+    full = es.Single.get_context()["FamaFrench"]
+
+    es.Single.import_FamaFrench(write(frame[:-300], tmp_path, "head.csv"))
+    for start in range(len(frame) - 300, len(frame), 50):
+        es.Single.append_FamaFrench(write(frame[start : start + 50], tmp_path, "tail.csv"))
+    factors = es.Single.get_context()["FamaFrench"]
+    np.testing.assert_array_equal(factors.calendar.dates, full.calendar.dates)
+    np.testing.assert_array_equal(factors.values, full.values)
+
+    with pytest.raises(ValueError):
+        es.Single.append_FamaFrench(write(frame[-10:], tmp_path, "tail.csv"))
@@ -0,0 +1,190 @@
+import numpy as np
+import pytest
+
+import eventstudy as es
+from eventstudy.models import Model
+
+MODELS = {
+    "market_model": (es.Single.market_model, ("security_ticker", "market_ticker")),
+    "constant_mean": (es.Single.constant_mean, ("security_ticker",)),
+    "FamaFrench_3factor": (es.Single.FamaFrench_3factor, ("security_ticker",)),
+}
+
+
+def make_events(keys, dates, securities):
+    events = list()
+    for date in dates:
+        for security in securities:
+            event = {"event_date": date, "security_ticker": security}
+            if "market_ticker" in keys:
+                event["market_ticker"] = "SPY"
+            events.append(event)
+    return events
+
+
+def listing_dates(date, before, after, step):
+    # dates around `date`: the windows of the events of a security listed on `date` contain missing values
+    dates = es.Single._parameters["returns"].calendar.dates
+    i = np.flatnonzero(dates >= np.datetime64(date))[0]
+    return list(dates[i - before : i + after : step])
+
+
+def run_both(model, events, **options):
+    # the same events, computed one after another and in batch
+    function, _ = MODELS[model]
+    loop = es.Multiple.from_list([dict(event) for event in events], function, **options)
+    batch = es.Multiple.from_list([dict(event) for event in events], function, batch=True, **options)
+    return loop, batch
+
+
+def assert_same_events(loop, batch, rtol=1e-7):
+    assert batch.errors == loop.errors
+    assert len(batch.sample) == len(loop.sample)
+    for event, expected in zip(batch.sample, loop.sample):
+        assert event.event_date == expected.event_date
+        assert event.description == expected.description
+        assert event.df == expected.df
+    np.testing.assert_array_equal(np.isnan(batch.AR), np.isnan(loop.AR))
+    np.testing.assert_allclose(batch.AR, loop.AR, rtol=rtol, atol=1e-12)
+    np.testing.assert_allclose(batch.var_AR, loop.var_AR, rtol=rtol, atol=1e-14)
+    np.testing.assert_array_equal(batch.df, loop.df)
+
+
+@pytest.mark.parametrize("solver", [None, "rolling"])
+@pytest.mark.parametrize("model", list(MODELS))
+def test_batch_matches_loop(model, solver):
+    _, keys = MODELS[model]
+    dates = es.Single._parameters["returns"].calendar.dates
+    events = make_events(keys, dates[400:4900:150], ["AAPL", "MSFT", "FB"])
+    # FB windows around its listing: missing values
+    events += make_events(keys, listing_dates("2012-05-18", 30, 320, 40), ["FB"])
+    # events which can't be computed: unknown ticker, windows out of the data, unknown date
+    events += make_events(keys, dates[1000:1001], ["XXX"])
+    events += make_events(keys, [dates[10], dates[-3]], ["AAPL"])
+    events += make_events(keys, [np.datetime64("1990-01-01")], ["AAPL"])
+    loop, batch = run_both(model, events, keep_model=True, solver=solver)
+    assert len(loop.errors) >= 4
+    assert np.isnan(loop.AR).any()
+    assert_same_events(loop, batch)
+    complete = ~np.isnan(loop.models.params).any(axis=1)
+    np.testing.assert_allclose(batch.models.params[complete], loop.models.params[complete], rtol=1e-6, atol=1e-12)
+    np.testing.assert_array_equal(batch.models.nobs, loop.models.nobs)
+
+
+def test_batch_errors_raised():
+    dates = es.Single._parameters["returns"].calendar.dates
+    events = make_events(("security_ticker", "market_ticker"), dates[1000:1001], ["XXX"])
+    with pytest.raises(es.exception.ColumnMissingError):
+        es.Multiple.from_list(events, es.Single.market_model, batch=True, ignore_errors=False)
+
+
+@pytest.mark.parametrize("min_obs", [None, 200])
+@pytest.mark.parametrize("model", ["market_model", "FamaFrench_3factor"])
+def test_shared_designs(model, min_obs, monkeypatch):
+    # securities with events on the same dates share the design matrix of their market or factors
+    designs = list()
+    batch_OLS = Model.batch_OLS
+
+    def spy(self, X, Y, groups=None):
+        designs.append((len(X), len(Y), groups is not None))
+        return batch_OLS(self, X, Y, groups)
+
+    monkeypatch.setattr(Model, "batch_OLS", spy)
+    _, keys = MODELS[model]
+    dates = listing_dates("2012-05-18", 30, 320, 40) + listing_dates("2016-01-04", 0, 100, 50)
+    events = make_events(keys, dates, ["AAPL", "MSFT", "AMZN", "GOOG", "FB"])
+    loop, batch = run_both(model, events, keep_model=True, min_obs=min_obs)
+    assert designs == [(len(dates), len(batch.sample), True)]
+    assert_same_events(loop, batch)
+    np.testing.assert_allclose(batch.models.bse, loop.models.bse, rtol=1e-6)
+
+
+@pytest.mark.parametrize("keep_model", [False, True])
+def test_batch_OLS_groups(keep_model):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((3, 120, 2))
+    groups = rng.integers(0, 3, 20)
+    Y = X[groups] @ rng.standard_normal((20, 2, 1))[..., 0, None] + rng.standard_normal((20, 120, 1)) * 0.1
+    Y = Y[..., 0]
+    model = Model(100, 20, keep_model)
+    shared = model.batch_OLS(X, Y, groups)
+    separate = model.batch_OLS(X[groups], Y)
+    for result, expected in zip(shared[:3], separate[:3]):
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-14)
+    if keep_model:
+        for name in ("params", "bse", "rsquared"):
+            np.testing.assert_allclose(getattr(shared[3], name), getattr(separate[3], name), rtol=1e-10)
+
+
+@pytest.mark.parametrize("solver", [None, "rolling"])
+@pytest.mark.parametrize("model", list(MODELS))
+def test_min_obs_matches_loop(model, solver):
+    # FB and GOOG are listed during the data: their first estimation windows are incomplete
+    _, keys = MODELS[model]
+    dates = listing_dates("2012-05-18", 30, 320, 40) + listing_dates("2004-08-19", 30, 320, 40)
+    events = make_events(keys, dates, ["FB", "GOOG", "AAPL"])
+    loop, batch = run_both(model, events, keep_model=True, solver=solver, min_obs=150)
+    assert_same_events(loop, batch)
+    assert not np.isnan(batch.AR).any()
+    # estimation windows with missing values keep their valid days only
+    assert len({event.df for event in batch.sample}) > 2
+    np.testing.assert_array_equal(batch.models.nobs, [event.df + 1 for event in batch.sample])
+    assert {error["error_type"] for error in batch.errors} == {"DataMissingError"}
+
+
+def test_min_obs_estimation():
+    dates = listing_dates("2012-05-18", 0, 300, 1)
+    event = es.Single.market_model("FB", "SPY", dates[250], min_obs=150, keep_model=True)
+    security, market = es.Single._get_parameters("returns", ("FB", "SPY"), dates[250], (-10, 10), 300, 30)
+    valid = ~np.isnan(security[:300])
+    assert event.model.nobs == np.count_nonzero(valid) == event.df + 1
+    X = np.column_stack((np.ones(300), market[:300]))[valid]
+    params, *_ = np.linalg.lstsq(X, security[:300][valid], rcond=None)
+    np.testing.assert_allclose(event.model.params, params, rtol=1e-9)
+    np.testing.assert_allclose(event.AR, security[-21:] - params[0] - params[1] * market[-21:], rtol=1e-9)
+
+    with pytest.raises(es.exception.DataMissingError):
+        es.Single.market_model("FB", "SPY", dates[150], min_obs=150)
+
+
+def test_valid_counts():
+    store = es.Single._parameters["returns"]
+    panel = es.Single._get_panel(es.Single._parameters)
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, len(panel.calendar) - 400, 500)
+    ends = starts + rng.integers(0, 400, 500)
+    columns = rng.choice(["AAPL", "FB", "GOOG", "SPY"], 500)
+    rows = np.arange(len(panel.calendar))
+    for counts, windows in (
+        (store.valid_counts, store.windows),
+        (panel.security_valid_counts, panel.security_windows),
+    ):
+        valid = {column: ~np.isnan(windows(column, rows)) for column in ("AAPL", "FB", "GOOG", "SPY")}
+        expected = [np.count_nonzero(valid[c][s:e]) for c, s, e in zip(columns, starts, ends)]
+        np.testing.assert_array_equal(counts(columns, starts, ends), expected)
+        expected = [np.count_nonzero(valid["FB"][s:e]) for s, e in zip(starts, ends)]
+        np.testing.assert_array_equal(counts("FB", starts, ends), expected)
+
+
+@pytest.mark.parametrize("min_obs", [5, 150, 299, 300])
+@pytest.mark.parametrize("model", ["market_model", "FamaFrench_3factor"])
+def test_min_obs_screening(model, min_obs, monkeypatch):
+    # events are screened from the counts of valid values: only the ones which may fail are checked exactly
+    checked = list()
+    missing_obs = es.Single._missing_obs
+
+    def spy(missing, *args):
+        checked.append(len(missing))
+        return missing_obs(missing, *args)
+
+    monkeypatch.setattr(es.Single, "_missing_obs", staticmethod(spy))
+    _, keys = MODELS[model]
+    dates = listing_dates("2012-05-18", 30, 400, 3)
+    events = make_events(keys, dates, ["FB", "AAPL"])
+    function, _ = MODELS[model]
+    batch = es.Multiple.from_list([dict(event) for event in events], function, batch=True, min_obs=min_obs)
+    assert sum(checked) <= len(dates)
+    checked.clear()
+    loop = es.Multiple.from_list([dict(event) for event in events], function, min_obs=min_obs)
+    assert_same_events(loop, batch)
+    assert 0 < len(batch.errors) < len(dates)
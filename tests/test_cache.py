@@ -0,0 +1,57 @@
+import concurrent.futures
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import eventstudy as es
+from eventstudy.store import load_cache, save_cache
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+OPTIONS = {"version": "test"}
+
+
+def _save(path):
+    store = es.Single.get_context()["returns"]
+    for _ in range(5):
+        save_cache(store, path, OPTIONS)
+
+
+def test_concurrent_saves(tmp_path):
+    path = str(tmp_path / "returns.csv")
+    shutil.copy(os.path.join(EXAMPLE, "returns_GAFAM.csv"), path)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        list(executor.map(_save, [path] * 4))
+
+    cached = load_cache(path, OPTIONS)
+    store = es.Single.get_context()["returns"]
+    np.testing.assert_array_equal(cached.values, store.values)
+    np.testing.assert_array_equal(cached.calendar.dates, store.calendar.dates)
+    assert not [name for name in os.listdir(path + ".cache") if name.endswith(".tmp")]
+
+
+def test_read_only_directory(tmp_path, caplog):
+    path = str(tmp_path / "returns.csv")
+    shutil.copy(os.path.join(EXAMPLE, "returns_GAFAM.csv"), path)
+    os.chmod(tmp_path, 0o555)
+    try:
+        if os.access(tmp_path, os.W_OK):
+            pytest.skip("the directory can't be made read-only (e.g. run as root)")
+        save_cache(es.Single.get_context()["returns"], path, OPTIONS)
+        assert "can't be cached" in caplog.text
+        assert load_cache(path, OPTIONS) is None
+    finally:
+        os.chmod(tmp_path, 0o755)
+
+
+def test_unwritable_cache(tmp_path, caplog):
+    path = str(tmp_path / "returns.csv")
+    shutil.copy(os.path.join(EXAMPLE, "returns_GAFAM.csv"), path)
+    open(path + ".cache", "w").close()  # a file where the cache directory should be
+    es.Single.import_returns(path, cache=True)
+    try:
+        assert "can't be cached" in caplog.text
+        assert len(es.Single.get_context()["returns"].columns) > 0
+    finally:
+        es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import eventstudy as es
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+@pytest.fixture(scope="module")
+def contexts(tmp_path_factory):
+    # RMW and CMA are not in the example factors: they are simulated (with a fixed seed)
+    factors = pd.read_csv(os.path.join(EXAMPLE, "famafrench.csv"), skipinitialspace=True)
+    rng = np.random.default_rng(0)
+    factors["RMW"] = np.round(rng.normal(0, 0.5, len(factors)), 2)
+    factors["CMA"] = np.round(rng.normal(0, 0.4, len(factors)), 2)
+    path = str(tmp_path_factory.mktemp("data") / "famafrench5.csv")
+    factors.to_csv(path, index=False)
+
+    contexts = dict()
+    for dtype in (np.float64, np.float32):
+        es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"), dtype=dtype)
+        es.Single.import_FamaFrench(path, dtype=dtype)
+        contexts[dtype] = es.Single.get_context()
+    yield contexts
+
+    es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    es.Single.import_FamaFrench(os.path.join(EXAMPLE, "famafrench.csv"))
+
+
+@pytest.mark.parametrize(
+    "model", [es.Single.market_model, es.Single.FamaFrench_3factor, es.Single.FamaFrench_5factor]
+)
+def test_float32_accuracy(contexts, model):
+    # accuracy documented in `Single.import_returns`: AAPL 10-K releases, event window (-2,+10)
+    results = [
+        es.Multiple.from_csv(
+            os.path.join(EXAMPLE, "10K.csv"),
+            model,
+            event_window=(-2, +10),
+            estimation_size=300,
+            buffer_size=30,
+            date_format="%d/%m/%Y",
+            context=contexts[dtype],
+        )
+        for dtype in (np.float64, np.float32)
+    ]
+    double, single = results
+    assert len(double.sample) == len(single.sample) > 0
+    np.testing.assert_allclose(single.AR, double.AR, rtol=0, atol=1e-8)
+    np.testing.assert_allclose(single.var_AR, double.var_AR, rtol=1e-7)
+    np.testing.assert_allclose(single.CAAR, double.CAAR, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(single.tstat, double.tstat, rtol=0, atol=1e-6)
@@ -0,0 +1,115 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import eventstudy as es
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+@pytest.fixture
+def restore():
+    yield
+    es.Single.import_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    es.Single.import_FamaFrench(os.path.join(EXAMPLE, "famafrench.csv"))
+
+
+def assert_same_store(store, expected):
+    np.testing.assert_array_equal(store.calendar.dates, expected.calendar.dates)
+    assert sorted(store.columns) == sorted(expected.columns)
+    for column in expected.columns:
+        np.testing.assert_array_equal(store.column(column), expected.column(column), err_msg=column)
+
+
+def run_events():
+    events = [
+        {"event_date": np.datetime64(date), "security_ticker": ticker, "market_ticker": "SPY"}
+        for date in ("2015-03-02", "2018-11-01", "2019-05-02")
+        for ticker in ("AAPL", "FB", "MSFT")
+    ]
+    return (
+        es.Multiple.from_list([dict(event) for event in events], es.Single.market_model),
+        es.Multiple.from_list([dict(event) for event in events], es.Single.FamaFrench_3factor),
+    )
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".feather"])
+@pytest.mark.parametrize("typed_dates", [False, True])
+def test_arrow_import(tmp_path, restore, extension, typed_dates):
+    pytest.importorskip("pyarrow")
+    expected_returns, expected_factors = es.Single._parameters["returns"], es.Single._parameters["FamaFrench"]
+    expected = run_events()
+
+    returns = pd.read_csv(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    factors = pd.read_csv(os.path.join(EXAMPLE, "famafrench.csv"), skipinitialspace=True, dtype={"date": str})
+    if typed_dates:
+        returns["date"] = pd.to_datetime(returns["date"])
+        factors["date"] = pd.to_datetime(factors["date"], format="%Y%m%d")
+    paths = [str(tmp_path / (name + extension)) for name in ("returns", "factors")]
+    for frame, path in zip((returns, factors), paths):
+        if extension == ".parquet":
+            frame.to_parquet(path)
+        else:
+            frame.to_feather(path)
+
+    es.Single.import_returns(paths[0])
+    es.Single.import_FamaFrench(paths[1])
+    assert_same_store(es.Single._parameters["returns"], expected_returns)
+    assert_same_store(es.Single._parameters["FamaFrench"], expected_factors)
+    for agg, reference in zip(run_events(), expected):
+        np.testing.assert_array_equal(agg.AR, reference.AR)
+
+    es.Single.import_returns(paths[0], columns=["AAPL", "SPY"])
+    assert es.Single._parameters["returns"].columns == ("AAPL", "SPY")
+
+
+def long_returns():
+    returns = pd.read_csv(os.path.join(EXAMPLE, "returns_GAFAM.csv"))
+    frame = returns.melt(id_vars="date", var_name="PERMNO", value_name="RET").dropna()
+    # rows of a long file are in any order
+    return frame.sample(frac=1, random_state=0)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_long_import(tmp_path, restore, extension):
+    if extension == ".parquet":
+        pytest.importorskip("pyarrow")
+    expected_returns = es.Single._parameters["returns"]
+    expected = run_events()
+
+    path = str(tmp_path / ("returns" + extension))
+    if extension == ".parquet":
+        long_returns().to_parquet(path)
+    else:
+        long_returns().to_csv(path, index=False)
+    es.Single.import_returns_long(path, ticker_column="PERMNO", value_column="RET")
+    assert_same_store(es.Single._parameters["returns"], expected_returns)
+    for agg, reference in zip(run_events(), expected):
+        np.testing.assert_array_equal(agg.AR, reference.AR)
+
+
+def test_long_prices(tmp_path, restore):
+    frame = pd.DataFrame(
+        {
+            "date": ["2020-01-02", "2020-01-03", "2020-01-06", "2020-01-02", "2020-01-06", "2020-01-03"],
+            "ticker": ["AAA", "AAA", "AAA", "BBB", "BBB", "CCC"],
+            "price": [100.0, 110.0, 99.0, 50.0, 55.0, 20.0],
+        }
+    )
+    path = str(tmp_path / "prices.csv")
+    frame.to_csv(path, index=False)
+    es.Single.import_returns_long(path, value_column="price", is_price=True, log_return=False)
+    store = es.Single._parameters["returns"]
+    np.testing.assert_array_equal(store.calendar.dates, np.array(["2020-01-03", "2020-01-06"], dtype="datetime64[D]"))
+    # percentage changes are computed as with wide prices (see `price_to_returns`)
+    np.testing.assert_allclose(store.column("AAA"), [10 / 110, -11 / 99])
+    # BBB has no price on 2020-01-03: its return is computed from its previous price
+    np.testing.assert_allclose(store.column("BBB"), [np.nan, 5 / 55])
+    np.testing.assert_array_equal(store.column("CCC"), [np.nan, np.nan])
+
+    frame.loc[len(frame)] = ["2020-01-03", "AAA", 111.0]
+    frame.to_csv(path, index=False)
+    with pytest.raises(ValueError):
+        es.Single.import_returns_long(path, value_column="price")
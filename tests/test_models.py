@@ -0,0 +1,166 @@
+import concurrent.futures
+
+import numpy as np
+import pytest
+
+import eventstudy as es
+from eventstudy.models import FittedModel, Model
+
+
+EVENT_DATE = np.datetime64("2018-11-01")
+
+
+def market_model_data(security="AAPL"):
+    security, market = es.Single._get_parameters("returns", (security, "SPY"), EVENT_DATE, (-10, 10), 300, 30)
+    return market, security
+
+
+def FamaFrench_3factor_data(security="MSFT"):
+    security, *factors = es.Single._get_joint_parameters(
+        (security,), ("Mkt-RF", "SMB", "HML"), EVENT_DATE, (-10, 10), 300, 30
+    )
+    return np.column_stack(factors), security
+
+
+def compare_solvers(X, Y, estimation_size, event_window_size, min_obs=None):
+    fits = [
+        Model(estimation_size, event_window_size, keep_model=True, solver=solver, min_obs=min_obs).OLS(X, Y)
+        for solver in ("numpy", "statsmodels")
+    ]
+    (residuals, df, var, model), (sm_residuals, sm_df, sm_var, sm_model) = fits
+    np.testing.assert_allclose(residuals, sm_residuals, rtol=1e-10, atol=1e-14)
+    assert df == sm_df
+    np.testing.assert_allclose(var, sm_var, rtol=1e-10)
+    np.testing.assert_allclose(model.params, sm_model.params, rtol=1e-8, atol=1e-12)
+    np.testing.assert_allclose(model.bse, sm_model.bse, rtol=1e-8)
+    np.testing.assert_allclose(model.rsquared, sm_model.rsquared, rtol=1e-8, atol=1e-12)
+    assert model.nobs == sm_model.nobs
+    return fits
+
+
+@pytest.mark.parametrize("data", [market_model_data, FamaFrench_3factor_data])
+def test_OLS_solvers(data):
+    X, Y = data()
+    (_, df, _, model), _ = compare_solvers(X, Y, 300, 21)
+    assert df == 299
+    assert model.nobs == 300
+
+
+def test_OLS_solvers_missing_values():
+    market, security = market_model_data()
+    Y = np.array(security)
+    Y[[3, 50, 51, 200]] = np.nan
+    (_, df, _, model), _ = compare_solvers(market, Y, 300, 21, min_obs=250)
+    assert df == 295
+    assert model.nobs == 296
+
+    # without min_obs, a missing value gives NaN coefficients and variance with both solvers
+    for solver in ("numpy", "statsmodels"):
+        residuals, df, var = Model(300, 21, solver=solver).OLS(market, Y)
+        assert np.isnan(residuals).all() and np.isnan(var)
+        assert df == 299
+
+
+@pytest.mark.parametrize(
+    "model, options",
+    [
+        (es.Single.market_model, dict(security_ticker="AAPL", market_ticker="SPY")),
+        (es.Single.FamaFrench_3factor, dict(security_ticker="AAPL")),
+    ],
+)
+def test_models_solvers(model, options):
+    events = [
+        model(event_date=EVENT_DATE, solver=solver, keep_model=True, **options)
+        for solver in ("numpy", "statsmodels")
+    ]
+    np.testing.assert_allclose(events[0].AR, events[1].AR, rtol=1e-10, atol=1e-14)
+    np.testing.assert_allclose(events[0].var_AR, events[1].var_AR, rtol=1e-10)
+    assert events[0].df == events[1].df
+    np.testing.assert_allclose(events[0].model.params, events[1].model.params, rtol=1e-8, atol=1e-12)
+    assert events[0].model.nobs == events[1].model.nobs
+
+
+def test_rolling_cross_products_cache(monkeypatch):
+    monkeypatch.setattr(es.Single, "_CROSS_PRODUCTS_CACHE_SIZE", 2)
+    context = es.Single.get_context()
+    dates = context["returns"].calendar.dates[1000:1010]
+    for security in ("AAPL", "MSFT", "AMZN", "AAPL"):
+        for date in dates:
+            rolling = es.Single.market_model(security, "SPY", date, context=context, solver="rolling")
+            event = es.Single.market_model(security, "SPY", date, context=context)
+            np.testing.assert_allclose(rolling.AR, event.AR, rtol=1e-8, atol=1e-12)
+            assert rolling.df == event.df
+    assert list(context["cross_products"]) == [("market_model", "AMZN", "SPY"), ("market_model", "AAPL", "SPY")]
+
+
+@pytest.mark.parametrize("min_obs", [None, 200])
+def test_rolling_missing_values(min_obs):
+    # FB is listed in 2012: the estimation windows of these events contain missing values
+    dates = es.Single._parameters["returns"].calendar.dates
+    start = np.flatnonzero(dates >= np.datetime64("2012-05-18"))[0]
+    events = [
+        {"event_date": date, "security_ticker": "FB", "market_ticker": "SPY"} for date in dates[start : start + 400 : 7]
+    ]
+    aggregates = [
+        es.Multiple.from_list([dict(event) for event in events], es.Single.market_model, min_obs=min_obs, **options)
+        for options in (dict(), dict(batch=True, solver="rolling"))
+    ]
+    loop, rolling = aggregates
+    assert [event.df for event in loop.sample] == [event.df for event in rolling.sample]
+    np.testing.assert_array_equal(loop.df, rolling.df)
+    np.testing.assert_allclose(rolling.var_AR, loop.var_AR, rtol=1e-8)
+    assert len(loop.errors) == len(rolling.errors)
+
+
+def test_constant_mean_solvers():
+    event = es.Single.constant_mean("AAPL", EVENT_DATE)
+    for solver in ("numpy", "rolling"):
+        other = es.Single.constant_mean("AAPL", EVENT_DATE, solver=solver)
+        np.testing.assert_allclose(other.AR, event.AR, rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(other.var_AR, event.var_AR, rtol=1e-8)
+        assert other.df == event.df
+    with pytest.raises(ValueError):
+        es.Single.constant_mean("AAPL", EVENT_DATE, solver="statsmodels")
+
+
+def test_rolling_threads(monkeypatch):
+    # threads running rolling fits on the same context share its cache of cross-products
+    monkeypatch.setattr(es.Single, "_CROSS_PRODUCTS_CACHE_SIZE", 2)
+    context = es.Single.get_context()
+    dates = context["returns"].calendar.dates[1000:1040]
+    securities = ("AAPL", "MSFT", "AMZN", "GOOG")
+    expected = {
+        (security, date): es.Single.market_model(security, "SPY", date, context=context).AR
+        for security in securities
+        for date in dates
+    }
+
+    def run(security):
+        for date in dates:
+            for other in securities:
+                event = es.Single.market_model(other, "SPY", date, context=context, solver="rolling")
+                np.testing.assert_allclose(event.AR, expected[other, date], rtol=1e-8, atol=1e-12)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        list(executor.map(run, securities))
+    assert len(context["cross_products"]) <= 2
+
+
+@pytest.mark.parametrize("options", [dict(), dict(solver="statsmodels"), dict(min_obs=200)])
+def test_fitted_model_matches_statsmodels(options):
+    import statsmodels.api as sm
+
+    dates = es.Single._parameters["returns"].calendar.dates
+    date = dates[np.flatnonzero(dates >= np.datetime64("2012-05-18"))[0] + 280]
+    # the estimation window of FB has missing values, only dropped with min_obs
+    for security in ("AAPL", "FB") if "min_obs" in options else ("AAPL",):
+        event = es.Single.market_model(security, "SPY", date, keep_model=True, **options)
+        security_returns, market = es.Single._get_parameters("returns", (security, "SPY"), date, (-10, 10), 300, 30)
+        rows = ~np.isnan(security_returns[:300])
+        reg = sm.OLS(security_returns[:300][rows], sm.add_constant(market[:300][rows])).fit()
+        assert isinstance(event.model, FittedModel)
+        np.testing.assert_allclose(event.model.params, reg.params, rtol=1e-9)
+        np.testing.assert_allclose(event.model.bse, reg.bse, rtol=1e-9)
+        np.testing.assert_allclose(event.model.rsquared, reg.rsquared, rtol=1e-9)
+        assert event.model.nobs == reg.nobs == event.df + 1
+        np.testing.assert_allclose(event.model.var, event.var_AR[0], rtol=1e-12)
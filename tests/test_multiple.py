@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+import eventstudy as es
+
+STATISTICS = ("AAR", "var_AAR", "CAAR", "var_CAAR", "tstat", "pvalue")
+
+
+def make_events(n, seed=0, **options):
+    dates = es.Single._parameters["returns"].calendar.dates
+    rng = np.random.default_rng(seed)
+    tickers = ["AAPL", "MSFT", "AMZN", "GOOG", "XXX"]
+    return [
+        {"event_date": dates[i], "security_ticker": tickers[rng.integers(0, 5)], "market_ticker": "SPY"}
+        for i in rng.integers(400, len(dates) - 20, n)
+    ]
+
+
+def assert_same_aggregate(agg, expected, rtol=1e-11):
+    for name in STATISTICS:
+        np.testing.assert_allclose(getattr(agg, name), getattr(expected, name), rtol=rtol, atol=1e-18, err_msg=name)
+    assert agg.df == expected.df
+    for key, values in expected.CAR_dist.items():
+        np.testing.assert_allclose(agg.CAR_dist[key], values, rtol=1e-9, atol=1e-15, err_msg=key)
+
+
+def test_add_remove_match_rebuild():
+    events = make_events(60)
+    full = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model, keep_model=True)
+    agg = es.Multiple(full.sample[:40])
+    for event in full.sample[40:]:
+        agg.add(event)
+    assert_same_aggregate(agg, full)
+    np.testing.assert_array_equal(agg.AR, full.AR)
+    np.testing.assert_array_equal(agg.var_AR, full.var_AR)
+    np.testing.assert_array_equal(agg.CAR, full.CAR)
+    np.testing.assert_array_equal(agg.models.params, full.models.params)
+
+    for event in (agg.sample[3], agg.sample[-1], agg.sample[17]):
+        AR = event.AR.copy()
+        agg.remove(event)
+        np.testing.assert_array_equal(event.AR, AR)
+    # events keep referring to their row of the matrices
+    for event, AR in zip(agg.sample, agg.AR):
+        assert np.shares_memory(event._AR, agg.AR)
+        np.testing.assert_array_equal(event.AR, AR)
+
+    rebuilt = es.Multiple(list(agg.sample))
+    assert_same_aggregate(agg, rebuilt)
+    np.testing.assert_array_equal(agg.AR, rebuilt.AR)
+    np.testing.assert_array_equal(agg.CAR, rebuilt.CAR)
+
+
+def test_remove_errors():
+    sample = es.Multiple.from_list(make_events(10), es.Single.market_model).sample
+    assert len(sample) >= 5
+    agg = es.Multiple(sample[:3])
+    with pytest.raises(ValueError):
+        agg.remove(sample[4])
+    single = es.Multiple(sample[:1])
+    with pytest.raises(ValueError):
+        single.remove(sample[0])
+    assert len(single.sample) == 1
+    with pytest.raises(ValueError):
+        agg.add(es.Single.market_model("AAPL", "SPY", sample[0].event_date, event_window=(-3, 3)))
+
+
+def test_n_jobs():
+    events = make_events(80, seed=1)
+    sequential_events = [dict(event) for event in events]
+    pool_events = [dict(event) for event in events]
+    sequential = es.Multiple.from_list(sequential_events, es.Single.market_model, keep_model=True)
+    pool = es.Multiple.from_list(pool_events, es.Single.market_model, keep_model=True, n_jobs=2)
+
+    assert [event.description for event in pool.sample] == [event.description for event in sequential.sample]
+    assert [event.event_date for event in pool.sample] == [event.event_date for event in sequential.sample]
+    np.testing.assert_array_equal(pool.AR, sequential.AR)
+    np.testing.assert_array_equal(pool.var_AR, sequential.var_AR)
+    np.testing.assert_array_equal(pool.models.params, sequential.models.params)
+    for name in STATISTICS:
+        np.testing.assert_array_equal(getattr(pool, name), getattr(sequential, name))
+
+    # errors are the events of the list which failed, in their order
+    assert len(pool.errors) > 0
+    assert pool.errors == sequential.errors
+    assert [id(error) for error in pool.errors] == [id(event) for event in pool_events if "error_type" in event]
+
+
+def test_n_jobs_zero():
+    with pytest.raises(ValueError):
+        es.Multiple.from_list(make_events(4), es.Single.market_model, n_jobs=0)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_matrices_match_events(batch):
+    # statistics computed on the matrices, against the ones of each event
+    dates = es.Single._parameters["returns"].calendar.dates
+    # FB is listed in 2012: the windows of the first events contain missing values
+    start = np.flatnonzero(dates >= np.datetime64("2012-05-18"))[0]
+    listing = dates[start : start + 200 : 50]
+    events = make_events(40)
+    events += [{"event_date": date, "security_ticker": "FB", "market_ticker": "SPY"} for date in listing]
+    agg = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model, batch=batch)
+    sample = agg.sample
+    assert np.isnan(agg.AR).any()
+
+    np.testing.assert_array_equal(agg.AR, [event.AR for event in sample])
+    np.testing.assert_array_equal(agg.var_AR, [event.var_AR for event in sample])
+    np.testing.assert_array_equal(agg.CAR, [event.CAR[-1] for event in sample])
+    n = len(sample)
+    AAR = 1 / n * np.sum([event.AR for event in sample], axis=0)
+    var_AAR = 1 / n ** 2 * np.sum([event.var_AR for event in sample], axis=0)
+    np.testing.assert_allclose(agg.AAR, AAR, rtol=1e-12)
+    np.testing.assert_allclose(agg.var_AAR, var_AAR, rtol=1e-12)
+    np.testing.assert_allclose(agg.var_CAAR, [np.sum(var_AAR[:i]) for i in range(1, len(AAR) + 1)], rtol=1e-12)
+    assert agg.df == sum(event.df for event in sample)
+
+    CAR = [event.CAR for event in sample]
+    for q in (25, 50, 75):
+        np.testing.assert_allclose(agg.CAR_dist[f"Quantile {q}%"], np.quantile(CAR, q / 100, axis=0), rtol=1e-12)
+    np.testing.assert_allclose(agg.CAR_dist["Mean"], np.mean(CAR, axis=0), rtol=1e-12)
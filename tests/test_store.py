@@ -0,0 +1,145 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import eventstudy as es
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+@pytest.mark.parametrize(
+    "event_date",
+    [
+        np.datetime64("2019-05-02"),
+        pd.Timestamp("2019-05-02"),
+        datetime.date(2019, 5, 2),
+        datetime.datetime(2019, 5, 2),
+    ],
+)
+def test_event_date_types(event_date):
+    reference = es.Single.market_model(
+        security_ticker="AAPL", market_ticker="SPY", event_date=np.datetime64("2019-05-02")
+    )
+    event = es.Single.market_model(security_ticker="AAPL", market_ticker="SPY", event_date=event_date)
+    np.testing.assert_array_equal(event.AR, reference.AR)
+
+
+def test_event_date_types_in_list():
+    events = pd.DataFrame(
+        {
+            "event_date": [pd.Timestamp("2019-05-02"), pd.Timestamp("2018-11-01")],
+            "security_ticker": ["AAPL", "MSFT"],
+            "market_ticker": ["SPY", "SPY"],
+        }
+    )
+    agg = es.Multiple.from_list(events.to_dict("records"), es.Single.market_model)
+    assert len(agg.sample) == 2
+    assert not agg.errors
+
+
+def test_calendar_indices_of():
+    calendar = es.Single._parameters["returns"].calendar
+    dates = [datetime.date(2019, 5, 4), pd.Timestamp("2019-05-02")]
+    expected = calendar.indices_of(np.array(dates, dtype="datetime64[D]"))
+    np.testing.assert_array_equal(calendar.indices_of(dates), expected)
+    assert calendar.index_of(pd.Timestamp("2019-05-04")) == expected[0]
+
+
+def test_lazy_store_reads_source_once(monkeypatch):
+    from eventstudy.single import _lazy_returns
+
+    path = os.path.join(EXAMPLE, "returns_GAFAM.csv")
+    store = _lazy_returns(path, False, True, "%Y-%m-%d", None, np.float64)
+    reads = []
+    load_columns = store._load_columns
+    monkeypatch.setattr(store, "_load_columns", lambda tickers: reads.append(tickers) or load_columns(tickers))
+
+    events = [
+        {"event_date": np.datetime64("2019-05-02"), "security_ticker": ticker, "market_ticker": "SPY"}
+        for ticker in ("AAPL", "MSFT", "AMZN", "XXX")
+    ]
+    lazy = es.Multiple.from_list(
+        [dict(event) for event in events], es.Single.market_model, context=es.DataContext(store)
+    )
+    eager = es.Multiple.from_list([dict(event) for event in events], es.Single.market_model)
+    assert len(reads) == 1
+    np.testing.assert_array_equal(lazy.AR, eager.AR)
+    assert len(lazy.errors) == len(eager.errors) == 1
+
+
+def test_lazy_store_unsupported_operations(tmp_path):
+    from eventstudy.single import _lazy_returns
+
+    store = _lazy_returns(os.path.join(EXAMPLE, "returns_GAFAM.csv"), False, True, "%Y-%m-%d", None, np.float64)
+    with pytest.raises(TypeError):
+        store.save(str(tmp_path))
+    with pytest.raises(TypeError):
+        store.append(np.array(["2030-01-02"], dtype="datetime64[D]"), np.zeros((1, 0)))
+
+
+def read_example(name):
+    return pd.read_csv(os.path.join(EXAMPLE, name), skipinitialspace=True)
+
+
+def test_returns_store_matches_csv():
+    store = es.Single._parameters["returns"]
+    expected = read_example("returns_GAFAM.csv")
+    np.testing.assert_array_equal(store.calendar.dates, expected["date"].to_numpy(dtype="datetime64[D]"))
+    assert store.columns == tuple(expected.columns[1:])
+    np.testing.assert_array_equal(store.values, expected.iloc[:, 1:].to_numpy())
+
+    # windows are views on the contiguous column of the matrix
+    AAPL, SPY = store.window(("AAPL", "SPY"), 100, 400)
+    assert np.shares_memory(AAPL, store.values) and AAPL.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(AAPL, expected["AAPL"][100:400])
+    np.testing.assert_array_equal(SPY, expected["SPY"][100:400])
+    assert store.window(("AAPL",), -5, 10)[0].shape == (10,)
+
+    rows = np.array([[0, 1, 2], [10, 11, 12]])
+    np.testing.assert_array_equal(
+        store.windows(["AAPL", "MSFT"], rows), [expected["AAPL"][0:3], expected["MSFT"][10:13]]
+    )
+    np.testing.assert_array_equal(store.windows("SPY", rows), expected["SPY"].to_numpy()[rows])
+
+    with pytest.raises(KeyError):
+        store.window(("AAPL", "XXX"), 0, 10)
+    with pytest.raises(ValueError):
+        es.store.ReturnsStore(store.calendar, store.values[:, :2], store.columns)
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+def test_aligned_panel(gaps, caplog):
+    returns, factors = es.Single._parameters["returns"], es.Single._parameters["FamaFrench"]
+    FamaFrench = read_example("famafrench.csv")
+    FamaFrench["date"] = pd.to_datetime(FamaFrench["date"], format="%Y%m%d").dt.strftime("%Y-%m-%d")
+    merged = read_example("returns_GAFAM.csv").merge(FamaFrench, on="date")
+    if gaps:
+        # factors missing on some dates of the returns: returns are not contiguous on the common calendar
+        removed = merged["date"].iloc[[1500, 2000, 2001, 3000]].to_numpy(dtype="datetime64[D]")
+        kept = ~np.isin(factors.calendar.dates, removed)
+        factors = es.store.ReturnsStore(factors.calendar.dates[kept], factors.values[kept], factors.columns)
+        merged = merged[~merged["date"].isin(removed.astype(str))].reset_index(drop=True)
+
+    context = es.DataContext(returns, factors)
+    panel = context["panel"]
+    np.testing.assert_array_equal(panel.calendar.dates, merged["date"].to_numpy(dtype="datetime64[D]"))
+    assert isinstance(panel._rows, slice) != gaps
+    assert f"{len(returns) - len(merged)} dates of the returns have no Fama-French factors" in caplog.text
+    for column in ("Mkt-RF", "SMB", "HML", "RF"):
+        np.testing.assert_allclose(panel.factors.column(column), merged[column] / 100, rtol=1e-15)
+    window = merged[1990:2010]
+    np.testing.assert_array_equal(panel.security_window(("AAPL", "FB"), 1990, 2010), (window["AAPL"], window["FB"]))
+    np.testing.assert_array_equal(panel.security_windows(["MSFT"], np.arange(1990, 2010)[None]), [window["MSFT"]])
+    np.testing.assert_array_equal(panel.security_valid_counts(["FB"], [0], [len(merged)]), [merged["FB"].count()])
+
+    # Fama-French 3-factor model against a regression on the merged files
+    i = 2010
+    event = es.Single.FamaFrench_3factor("MSFT", merged["date"][i], context=context)
+    window = merged.iloc[i - 340 : i + 11]
+    Y = (window["MSFT"] - window["RF"] / 100).to_numpy()
+    X = np.column_stack((np.ones(len(window)), window[["Mkt-RF", "SMB", "HML"]] / 100))
+    params, *_ = np.linalg.lstsq(X[:300], Y[:300], rcond=None)
+    np.testing.assert_allclose(event.AR, (Y - X @ params)[-21:], rtol=1e-9, atol=1e-15)